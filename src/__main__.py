@@ -0,0 +1,9 @@
+import sys
+
+try:
+    from .cli import main
+except ImportError:
+    from cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,325 @@
+import codecs
+import re
+from collections import namedtuple
+
+
+Diagnostic = namedtuple("Diagnostic", "line severity message")
+AssemblyCheck = namedtuple("AssemblyCheck", "instructions labels lines diagnostics")
+
+# Komut -> operand türleri
+OPERAND_FORMS = {
+    "add": ("reg", "reg", "reg"),
+    "sub": ("reg", "reg", "reg"),
+    "and": ("reg", "reg", "reg"),
+    "or": ("reg", "reg", "reg"),
+    "slt": ("reg", "reg", "reg"),
+    "sll": ("reg", "reg", "shamt"),
+    "srl": ("reg", "reg", "shamt"),
+    "addi": ("reg", "reg", "imm"),
+    "lw": ("reg", "mem"),
+    "sw": ("reg", "mem"),
+    "beq": ("reg", "reg", "label"),
+    "bne": ("reg", "reg", "label"),
+    "j": ("label",),
+    "jal": ("label",),
+    "jr": ("reg",),
+}
+
+DATA_DIRECTIVES = (".word", ".space", ".asciiz")
+
+_LABEL = re.compile(r"^[A-Za-z_.][\w.]*$")
+_MEMORY = re.compile(r"^(-?\d+)\((\$\w+)\)$")
+# Satır başındaki "label:" önekleri; bir satırda birden fazla olabilir
+_LABEL_PREFIX = re.compile(r'\s*([^\s:#"]+)\s*:')
+# lw/sw operandında data label'ı: label, label+8, label($t1), label-4($t1)
+_DATA_OPERAND = re.compile(r"^([A-Za-z_][\w.]*)(?:([+-])(\d+))?(\(\$\w+\))?$")
+
+
+def _strip_comment(line):
+    """Tırnak içindeki '#' karakterlerini koruyarak yorumu kaldırır"""
+    quoted = False
+    escaped = False
+    for i, char in enumerate(line):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = quoted
+        elif char == '"':
+            quoted = not quoted
+        elif char == "#" and not quoted:
+            return line[:i].strip()
+    return line.strip()
+
+
+Statement = namedtuple("Statement", "line labels op operands text")
+
+
+def tokenize_line(line, number=0):
+    """Tek bir kaynak satırını tek geçişte Statement'a ayırır; boş/yorum satırında None.
+
+    Satır başındaki tüm "label:" önekleri labels'a alınır, satır içi
+    yorumlar atılır. Komut operandları boşluksuz olarak virgülden
+    bölünür; direktiflerin operandı (ör. .asciiz dizgisi) olduğu gibi
+    tek parça kalır.
+    """
+    code = _strip_comment(line) if '"' in line else line.split('#', 1)[0].strip()
+    if not code:
+        return None
+    labels = []
+    position = 0
+    if ':' in code:
+        match = _LABEL_PREFIX.match(code)
+        while match:
+            labels.append(match.group(1))
+            position = match.end()
+            match = _LABEL_PREFIX.match(code, position)
+        code = code[position:].strip()
+    if not code:
+        return Statement(number, labels, "", (), "")
+    parts = code.split(None, 1)
+    op = parts[0].lower()
+    if len(parts) == 1:
+        operands = ()
+    elif op[0] == '.':
+        operands = (parts[1].strip(),)
+    else:
+        operands = tuple("".join(parts[1].split()).split(","))
+    return Statement(number, labels, op, operands, code)
+
+
+def tokenize(lines):
+    """Satır akışından (dosya nesnesi, liste, üreteç) boş olmayan Statement'ları üretir"""
+    for number, line in enumerate(lines, 1):
+        statement = tokenize_line(line, number)
+        if statement is not None:
+            yield statement
+
+
+def _int32(value):
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def data_words(directive, operand, word_size=4):
+    """Data direktifinin bellek kelimelerini döndürür; hatalı operandda ValueError.
+
+    Data memory kelime adresli olduğundan her direktif kelime sınırında
+    başlar; .space ve .asciiz kelime boyutuna yuvarlanır, karakterler
+    kelimelere little-endian paketlenir.
+    """
+    if directive == ".word":
+        words = []
+        for item in operand.split(","):
+            try:
+                value = int(item.strip(), 0)
+            except ValueError:
+                raise ValueError(f"Invalid .word value '{item.strip()}'")
+            if not -0x80000000 <= value <= 0xFFFFFFFF:
+                raise ValueError(f".word value {value} does not fit in 32 bits")
+            words.append(_int32(value))
+        return words
+    if directive == ".space":
+        try:
+            size = int(operand, 0)
+        except ValueError:
+            raise ValueError(f"Invalid .space size '{operand}'")
+        if size < 0:
+            raise ValueError(f"Invalid .space size '{operand}'")
+        return [0] * -(-size // word_size)
+    if directive == ".asciiz":
+        if len(operand) < 2 or not (operand.startswith('"') and operand.endswith('"')):
+            raise ValueError(f"Invalid string literal {operand}")
+        try:
+            raw = codecs.decode(operand[1:-1], "unicode_escape").encode("latin-1") + b"\0"
+        except (UnicodeError, ValueError):
+            raise ValueError(f"Invalid string literal {operand}")
+        raw += b"\0" * (-len(raw) % word_size)
+        return [int.from_bytes(raw[i:i + word_size], "little", signed=True)
+                for i in range(0, len(raw), word_size)]
+    raise ValueError(f"Unknown directive '{directive}'")
+
+
+def _check_operand(kind, operand, register_map, labels):
+    """Operand hatalıysa (önem, mesaj) döndürür"""
+    if kind == "reg":
+        if operand not in register_map:
+            return "error", f"Unknown register '{operand}'"
+    elif kind == "imm":
+        try:
+            value = int(operand)
+        except ValueError:
+            return "error", f"Invalid immediate '{operand}'"
+        if not -0x8000 <= value <= 0x7FFF:
+            return "warning", f"Immediate {value} does not fit in 16 bits"
+    elif kind == "shamt":
+        if operand in register_map:
+            return None
+        try:
+            value = int(operand)
+        except ValueError:
+            return "error", f"Invalid shift amount '{operand}'"
+        if not 0 <= value <= 31:
+            return "warning", f"Shift amount {value} is outside 0-31"
+    elif kind == "mem":
+        match = _MEMORY.match(operand)
+        if not match:
+            return "error", f"Invalid memory operand '{operand}', expected offset($reg)"
+        if match.group(2) not in register_map:
+            return "error", f"Unknown register '{match.group(2)}'"
+    elif kind == "label":
+        if operand not in labels:
+            return "error", f"Undefined label '{operand}'"
+    return None
+
+
+Program = namedtuple("Program", "instructions labels lines data data_labels diagnostics")
+
+
+class AssemblyError(ValueError):
+    """Assemble hataları; tüm hatalı satırlar diagnostics içinde tutulur"""
+
+    def __init__(self, diagnostics):
+        self.diagnostics = diagnostics
+        super().__init__("\n".join(f"Line {d.line}: {d.message}" for d in diagnostics))
+
+
+class Assembler:
+    """Satır akışını tek geçişte tokenize eden iki geçişli assembler.
+
+    Birinci geçiş (feed) satırları tek tek okur: .text/.data bölümlerini
+    izler, label'ları kaydeder, .data kelimelerini üretir ve komutları
+    toplar; girdinin tamamının bellekte olması gerekmez. İkinci geçiş
+    (finish) lw/sw operandlarındaki data label'larını çözer ve
+    register_map verildiyse her komutun operandlarını doğrular. Hatalar
+    ilk hatada durmadan satır numaralarıyla diagnostics'te toplanır.
+    Her iki geçiş de satır sayısında doğrusaldır.
+    """
+
+    def __init__(self, register_map=None, word_size=4):
+        self.register_map = register_map
+        self.word_size = word_size
+        self.instructions = []
+        self.statements = []
+        self.lines = []
+        self.labels = {}
+        self.data = []
+        self.data_labels = {}
+        self.diagnostics = []
+        self.in_data = False
+
+    def report(self, line, severity, message):
+        self.diagnostics.append(Diagnostic(line, severity, message))
+
+    #Birinci geçiş
+    def feed(self, lines):
+        """Satır akışını okur; satırlar işlendikçe atılır"""
+        validate = self.register_map is not None
+        for statement in tokenize(lines):
+            number = statement.line
+            op = statement.op
+            if op == ".text" or op == ".data":
+                self.in_data = op == ".data"
+                if not statement.labels:
+                    continue
+            for label in statement.labels:
+                if validate and not _LABEL.match(label):
+                    self.report(number, "error", f"Invalid label '{label}'")
+                elif label in self.labels or label in self.data_labels:
+                    self.report(number, "warning", f"Duplicate label '{label}'")
+                if self.in_data:
+                    self.data_labels[label] = len(self.data) * self.word_size
+                else:
+                    self.labels[label] = len(self.instructions)
+            if not op or op == ".text" or op == ".data":
+                continue
+            if self.in_data:
+                self.feed_data(number, statement)
+            elif op[0] == '.':
+                if op in DATA_DIRECTIVES:
+                    self.report(number, "error", f"Directive '{op}' outside .data section")
+                else:
+                    self.report(number, "error", f"Unknown directive '{op}'")
+            else:
+                self.instructions.append(statement.text)
+                self.statements.append(statement)
+                self.lines.append(number)
+        return self
+
+    def feed_data(self, number, statement):
+        if statement.op[0] != '.':
+            self.report(number, "error", f"Invalid data line '{statement.text}'")
+            return
+        try:
+            self.data.extend(data_words(
+                statement.op, statement.operands[0] if statement.operands else "", self.word_size
+            ))
+        except ValueError as e:
+            self.report(number, "error", str(e))
+
+    #İkinci geçiş
+    def resolve_data_label(self, index, statement):
+        """lw/sw operandındaki data label'ını byte adresine çevirir (base yoksa $zero)"""
+        match = _DATA_OPERAND.match(statement.operands[1])
+        if not match or match.group(1) not in self.data_labels:
+            return statement
+        label, sign, offset, base = match.groups()
+        address = self.data_labels[label]
+        if offset:
+            address += int(offset) if sign == "+" else -int(offset)
+        operand = f"{address}{base or '($zero)'}"
+        statement = statement._replace(
+            operands=(statement.operands[0], operand),
+            text=f"{statement.op} {statement.operands[0]}, {operand}",
+        )
+        self.instructions[index] = statement.text
+        return statement
+
+    def check(self, statement, number):
+        form = OPERAND_FORMS.get(statement.op)
+        if form is None:
+            self.report(number, "error", f"Unknown opcode '{statement.op}'")
+            return
+        if len(statement.operands) != len(form):
+            self.report(number, "error",
+                        f"'{statement.op}' expects {len(form)} operands, got {len(statement.operands)}")
+            return
+        for kind, operand in zip(form, statement.operands):
+            problem = _check_operand(kind, operand, self.register_map, self.labels)
+            if problem is not None:
+                self.report(number, *problem)
+
+    def finish(self):
+        """İkinci geçişi yapar ve Program döndürür; tanılamalar satıra göre sıralıdır"""
+        data_labels = self.data_labels
+        validate = self.register_map is not None
+        for index, (statement, number) in enumerate(zip(self.statements, self.lines)):
+            if data_labels and statement.op in ("lw", "sw") and len(statement.operands) == 2:
+                statement = self.resolve_data_label(index, statement)
+            if validate:
+                self.check(statement, number)
+        self.diagnostics.sort(key=lambda d: d.line)
+        return Program(self.instructions, self.labels, self.lines, self.data,
+                       data_labels, self.diagnostics)
+
+
+def assemble_lines(lines, register_map=None, word_size=4):
+    """Satır akışını assemble eder; register_map verilirse operandlar da doğrulanır"""
+    return Assembler(register_map, word_size).feed(lines).finish()
+
+
+def assemble_file(path, register_map=None, word_size=4):
+    """Kaynak dosyayı tamamını belleğe okumadan satır satır assemble eder"""
+    with open(path, encoding="utf-8") as source:
+        return assemble_lines(source, register_map, word_size)
+
+
+def check_source(source, register_map):
+    """Kaynağı MIPSCPU.assemble ile aynı kurallarla ayrıştırır ve doğrular.
+
+    Komutları, label'ları, her komutun kaynak satır numarasını (1'den
+    başlar) ve satır numaralı tanılamaları döndürür. Label'lar önce
+    toplandığı için ileriye dönük referanslar da çözülür. .data bölümü
+    doğrulanır; lw/sw operandlarındaki data label'ları adrese çevrilir.
+    """
+    program = assemble_lines(source.splitlines(), register_map)
+    return AssemblyCheck(program.instructions, program.labels, program.lines, program.diagnostics)
@@ -0,0 +1,183 @@
+PREDICTOR_NAMES = ("static-taken", "static-not-taken", "1bit", "2bit", "gshare")
+
+
+class BranchPredictor:
+    """Koşullu branch tahmincileri için temel sınıf.
+
+    Alt sınıflar predict() ve update() metodlarını uygular; record() her
+    çözülen branch için tahmini yapar, tahminciyi günceller ve doğruluk
+    istatistiklerini tutar. pc, komutun byte adresidir.
+    """
+
+    name = "predictor"
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.predictions = 0
+        self.correct = 0
+        # pc -> [tahmin sayısı, doğru tahmin sayısı, komut metni]
+        self.branches = {}
+        self.reset_tables()
+
+    def reset_tables(self):
+        pass
+
+    def predict(self, pc):
+        raise NotImplementedError
+
+    def update(self, pc, taken):
+        pass
+
+    def record(self, pc, taken, text=""):
+        """Branch sonucunu kaydeder, tahminin doğru olup olmadığını döndürür"""
+        hit = self.predict(pc) == taken
+        self.update(pc, taken)
+
+        self.predictions += 1
+        entry = self.branches.get(pc)
+        if entry is None:
+            entry = self.branches[pc] = [0, 0, text]
+        entry[0] += 1
+        if hit:
+            self.correct += 1
+            entry[1] += 1
+        return hit
+
+    @property
+    def mispredictions(self):
+        return self.predictions - self.correct
+
+    @property
+    def accuracy(self):
+        if not self.predictions:
+            return 0.0
+        return self.correct / self.predictions
+
+    def branch_accuracy(self, pc):
+        total, correct, _ = self.branches[pc]
+        return correct / total
+
+    def misprediction_cost(self, penalty=1):
+        """Yanlış tahminlerin toplam cycle maliyeti"""
+        return self.mispredictions * penalty
+
+    def report(self, penalty=1):
+        """Global ve branch bazında doğruluk raporunu döndürür"""
+        lines = [
+            f"Branch Prediction ({self.name})",
+            f"Global accuracy: {self.accuracy * 100:.2f}% ({self.correct}/{self.predictions}), "
+            f"mispredictions: {self.mispredictions}",
+        ]
+        for pc in sorted(self.branches):
+            total, correct, text = self.branches[pc]
+            lines.append(f"  0x{pc:08x} {text}: {correct / total * 100:.2f}% ({correct}/{total})")
+        lines.append(
+            f"Estimated misprediction cost: {self.misprediction_cost(penalty)} cycles "
+            f"({penalty} cycle/miss)"
+        )
+        return "\n".join(lines)
+
+
+class StaticPredictor(BranchPredictor):
+    """Her zaman aynı yönü tahmin eder"""
+
+    def __init__(self, taken=True):
+        self.taken = taken
+        self.name = "static-taken" if taken else "static-not-taken"
+        super().__init__()
+
+    def predict(self, pc):
+        return self.taken
+
+
+class OneBitPredictor(BranchPredictor):
+    """Son sonucu hatırlayan 1-bit tahmin tablosu"""
+
+    name = "1bit"
+
+    def __init__(self, table_size=64):
+        self.table_size = table_size
+        super().__init__()
+
+    def reset_tables(self):
+        self.table = [False] * self.table_size
+
+    def predict(self, pc):
+        return self.table[(pc >> 2) % self.table_size]
+
+    def update(self, pc, taken):
+        self.table[(pc >> 2) % self.table_size] = taken
+
+
+class TwoBitPredictor(BranchPredictor):
+    """2-bit doymalı sayaç tablosu (0-1 not taken, 2-3 taken)"""
+
+    name = "2bit"
+
+    def __init__(self, table_size=64):
+        self.table_size = table_size
+        super().__init__()
+
+    def reset_tables(self):
+        # Weakly not taken ile başla
+        self.table = [1] * self.table_size
+
+    def _index(self, pc):
+        return (pc >> 2) % self.table_size
+
+    def predict(self, pc):
+        return self.table[self._index(pc)] >= 2
+
+    def update(self, pc, taken):
+        index = self._index(pc)
+        counter = self.table[index]
+        if taken:
+            self.table[index] = min(counter + 1, 3)
+        else:
+            self.table[index] = max(counter - 1, 0)
+
+
+class GsharePredictor(TwoBitPredictor):
+    """Global branch geçmişi ile pc'yi XOR'layarak 2-bit sayaç seçer"""
+
+    name = "gshare"
+
+    def __init__(self, table_size=256, history_bits=None):
+        if table_size <= 0 or table_size & (table_size - 1):
+            raise ValueError("gshare table size must be a power of two")
+        if history_bits is None:
+            history_bits = table_size.bit_length() - 1
+        self.history_bits = history_bits
+        super().__init__(table_size)
+
+    def reset_tables(self):
+        super().reset_tables()
+        self.history = 0
+
+    def _index(self, pc):
+        return ((pc >> 2) ^ self.history) & (self.table_size - 1)
+
+    def update(self, pc, taken):
+        super().update(pc, taken)
+        mask = (1 << self.history_bits) - 1
+        self.history = ((self.history << 1) | int(taken)) & mask
+
+
+def make_predictor(spec, table_size=None):
+    """İsimden tahminci oluşturur, örn. "2bit" veya "gshare:1024" """
+    name, _, size = spec.partition(":")
+    if size:
+        table_size = int(size)
+    if name == "static-taken":
+        return StaticPredictor(taken=True)
+    if name == "static-not-taken":
+        return StaticPredictor(taken=False)
+    if name == "1bit":
+        return OneBitPredictor(table_size or 64)
+    if name == "2bit":
+        return TwoBitPredictor(table_size or 64)
+    if name == "gshare":
+        return GsharePredictor(table_size or 256)
+    raise ValueError(f"Unknown branch predictor: {spec}")
@@ -0,0 +1,220 @@
+import operator
+import re
+
+
+_TOKEN = re.compile(r"\s*(M\[[^\]]+\]|\$\w+|-?0x[0-9a-fA-F]+|-?\d+|==|!=|<=|>=|<|>|&&|\|\||and\b|or\b)")
+_COMPARISONS = {
+    "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le,
+    ">": operator.gt, ">=": operator.ge,
+}
+
+
+def _compile_operand(token, register_map, word_size, memory_words=None):
+    """Tek bir operandı sim -> değer fonksiyonuna çevirir; bellek dışını
+    gösteren M[$reg] okuması None döndürür"""
+    if token.startswith("$"):
+        if token not in register_map:
+            raise ValueError(f"Unknown register in condition: {token}")
+        index = register_map[token]
+        return lambda sim: sim.registers[index]
+    if token.startswith("M["):
+        inner = token[2:-1].strip()
+        if inner in register_map:
+            index = register_map[inner]
+
+            def read(sim):
+                address = sim.registers[index]
+                memory = sim.data_memory
+                if 0 <= address < len(memory) * word_size:
+                    return memory[address // word_size]
+                return None
+            return read
+        address = int(inner, 0)
+        word = address // word_size
+        if address < 0 or (memory_words is not None and word >= memory_words):
+            raise ValueError(f"Memory address out of range in condition: {token}")
+        return lambda sim: sim.data_memory[word]
+    value = int(token, 0)
+    return lambda sim: value
+
+
+def _compare(compare, lhs, rhs):
+    """Karşılaştırma terimi; bellek dışı bir okuma terimi yanlış yapar"""
+    def term(sim):
+        left = lhs(sim)
+        right = rhs(sim)
+        return left is not None and right is not None and compare(left, right)
+    return term
+
+
+def compile_condition(expression, register_map, word_size=4, memory_words=None):
+    """"$t0 == 10 && M[0x40] > 3" gibi bir koşulu sim -> bool fonksiyonuna çevirir.
+
+    Operandlar register ($t0, $r8), tamsayı (10, -3, 0x40) veya bellek
+    kelimesi (M[0x40], M[$t1]) olabilir. Karşılaştırmalar and/&& ve
+    or/|| ile soldan sağa bağlanır. Negatif ya da memory_words kelimelik
+    belleğin dışındaki sabit adresler reddedilir; M[$t1] çalışırken bellek
+    dışını gösterirse o karşılaştırma yanlıştır.
+    """
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match:
+            raise ValueError(f"Invalid condition near: {expression[position:]}")
+        tokens.append(match.group(1))
+        position = match.end()
+
+    if len(tokens) < 3 or len(tokens) % 4 != 3:
+        raise ValueError(f"Invalid condition: {expression}")
+
+    predicate = None
+    joiner = None
+    for i in range(0, len(tokens), 4):
+        left, op, right = tokens[i:i + 3]
+        if op not in _COMPARISONS:
+            raise ValueError(f"Invalid comparison operator: {op}")
+        compare = _COMPARISONS[op]
+        lhs = _compile_operand(left, register_map, word_size, memory_words)
+        rhs = _compile_operand(right, register_map, word_size, memory_words)
+        term = _compare(compare, lhs, rhs)
+
+        if predicate is None:
+            predicate = term
+        elif joiner in ("&&", "and"):
+            predicate = (lambda a, b: lambda sim: a(sim) and b(sim))(predicate, term)
+        else:
+            predicate = (lambda a, b: lambda sim: a(sim) or b(sim))(predicate, term)
+
+        if i + 3 < len(tokens):
+            joiner = tokens[i + 3]
+            if joiner not in ("&&", "and", "||", "or"):
+                raise ValueError(f"Invalid condition joiner: {joiner}")
+    return predicate
+
+
+class BreakpointManager:
+    """Breakpoint ve watchpoint'leri hızlı kontrol için set/bitmask olarak tutar.
+
+    Breakpoint'ler komut indekslerinden oluşan bir set'tir; run döngüsü
+    her komutta yalnızca bir set üyelik kontrolü yapar. Register
+    watchpoint'leri 32 bitlik bir mask, bellek watchpoint'leri kelime
+    indekslerinden oluşan bir set olarak tutulur.
+    """
+
+    def __init__(self, word_size=4, data_words=None):
+        self.word_size = word_size
+        self.data_words = data_words  # Bilinen bellek boyu (kelime); koşullardaki adresler için
+        self.clear()
+
+    def clear(self):
+        self.breakpoints = set()
+        self.label_breakpoints = {}
+        self.label_indices = {}  # label -> yüklü programda çözüldüğü indeks
+        self.index_breakpoints = set()  # Doğrudan indeks/adresle konanlar
+        self.conditions = {}
+        self.register_mask = 0
+        self.memory_words = set()
+
+    def __bool__(self):
+        return bool(self.breakpoints or self.label_breakpoints
+                    or self.register_mask or self.memory_words)
+
+    def add_breakpoint(self, target, condition=None, register_map=None):
+        """Komut indeksine, "0x.." adresine veya label'a breakpoint koyar"""
+        predicate = None
+        if condition:
+            predicate = compile_condition(condition, register_map or {}, self.word_size, self.data_words)
+        if isinstance(target, str) and not target.startswith("0x") and not target.isdigit():
+            # Label'lar program yüklendiğinde çözülür
+            self.label_breakpoints[target] = (condition, predicate)
+            return
+        index = self.resolve(target)
+        self.breakpoints.add(index)
+        self.index_breakpoints.add(index)
+        if predicate is not None:
+            self.conditions[index] = (condition, predicate)
+        else:
+            self.conditions.pop(index, None)
+
+    def remove_breakpoint(self, target):
+        if isinstance(target, str) and target in self.label_breakpoints:
+            del self.label_breakpoints[target]
+            self.unresolve_label(target)
+            return
+        index = self.resolve(target)
+        self.breakpoints.discard(index)
+        self.index_breakpoints.discard(index)
+        self.conditions.pop(index, None)
+
+    def toggle_breakpoint(self, index, condition=None, register_map=None):
+        """Breakpoint'i açıp kapatır, yeni durumu döndürür"""
+        if index in self.breakpoints:
+            self.remove_breakpoint(index)
+            return False
+        self.add_breakpoint(index, condition, register_map)
+        return True
+
+    def resolve(self, target):
+        """Adres veya indeks hedefini komut indeksine çevirir"""
+        if isinstance(target, str):
+            if target.startswith("0x"):
+                return int(target, 16) // self.word_size
+            return int(target)
+        return target
+
+    def resolve_labels(self, labels):
+        """Label breakpoint'lerini assemble sonrası indekslere çevirir; önceki
+        programda çözülen indeksler önce kaldırılır"""
+        for label in list(self.label_indices):
+            self.unresolve_label(label)
+        for label, (condition, predicate) in self.label_breakpoints.items():
+            if label not in labels:
+                continue
+            index = labels[label]
+            self.label_indices[label] = index
+            self.breakpoints.add(index)
+            # Aynı indekste doğrudan konmuş breakpoint'in koşulu korunur
+            if predicate is not None and index not in self.index_breakpoints:
+                self.conditions[index] = (condition, predicate)
+
+    def unresolve_label(self, label):
+        """Label'ın çözüldüğü indeksi, başka bir breakpoint onu kullanmıyorsa kaldırır"""
+        index = self.label_indices.pop(label, None)
+        if index is None or index in self.index_breakpoints or index in self.label_indices.values():
+            return
+        self.breakpoints.discard(index)
+        self.conditions.pop(index, None)
+
+    def watch_register(self, index):
+        self.register_mask |= 1 << index
+
+    def unwatch_register(self, index):
+        self.register_mask &= ~(1 << index)
+
+    def is_register_watched(self, index):
+        return bool(self.register_mask >> index & 1)
+
+    def toggle_register_watch(self, index):
+        if self.is_register_watched(index):
+            self.unwatch_register(index)
+            return False
+        self.watch_register(index)
+        return True
+
+    def watch_memory(self, address):
+        """Byte adresindeki kelimeyi izler"""
+        self.memory_words.add(address // self.word_size)
+
+    def unwatch_memory(self, address):
+        self.memory_words.discard(address // self.word_size)
+
+    def toggle_memory_watch(self, address):
+        word = address // self.word_size
+        if word in self.memory_words:
+            self.memory_words.discard(word)
+            return False
+        self.memory_words.add(word)
+        return True
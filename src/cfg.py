@@ -0,0 +1,446 @@
+"""Assemble edilmiş programlar için kontrol akış grafiği (CFG) ve statik analiz.
+
+Komut listesi ve label'lardan temel bloklar (basic block) çıkarılır,
+bloklar arası kenarlar kurulur ve bunlar üzerinde erişilebilirlik,
+döngü iç içeliği (dominator tabanlı doğal döngüler) ve register
+canlılığı (liveness) hesaplanır. Sonuçlar erişilemeyen kod ve hiç
+yazılmamış register okumaları için uyarı üretir ve DOT olarak dışa
+aktarılabilir.
+
+jal çağrıları hedefe ve dönüş noktasına (jal'den sonraki komut) kenar
+verir; hedefi statik bilinmeyen jr komutları programdaki tüm dönüş
+noktalarına kenar verir, dönüş noktası yoksa programı bitirir.
+"""
+try:
+    from .pipeline import BRANCH_OPS, register_operands
+    from .assembler import Diagnostic
+except ImportError:
+    from pipeline import BRANCH_OPS, register_operands
+    from assembler import Diagnostic
+
+
+EXIT = -1  # Programın sonunu temsil eden sanal blok
+
+
+def parse_instruction(instruction):
+    """Komuttan (op, parametreler) çıkarır; MIPSCPU.clean_instruction_params ile aynı kurallar"""
+    instruction = instruction.split('#')[0].strip()
+    parts = instruction.split(None, 1)
+    if len(parts) < 2:
+        return "", []
+    return parts[0].lower(), [p.strip() for p in parts[1].replace(" ", "").split(",")]
+
+
+class BasicBlock:
+    """[start, end) aralığındaki komutlardan oluşan temel blok"""
+
+    __slots__ = ("id", "start", "end", "labels", "successors", "predecessors",
+                 "reachable", "loop_depth", "use", "defs", "live_in", "live_out")
+
+    def __init__(self, block_id, start, end):
+        self.id = block_id
+        self.start = start
+        self.end = end
+        self.labels = []
+        self.successors = []
+        self.predecessors = []
+        self.reachable = False
+        self.loop_depth = 0
+        # Register kümeleri bit maskesi olarak tutulur (bit i = $ri)
+        self.use = 0
+        self.defs = 0
+        self.live_in = 0
+        self.live_out = 0
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __repr__(self):
+        return f"BasicBlock({self.id}, {self.start}:{self.end}, succ={self.successors})"
+
+
+class Loop:
+    """Header'ı ve gövde bloklarıyla bir doğal döngü"""
+
+    __slots__ = ("header", "blocks", "depth")
+
+    def __init__(self, header, blocks):
+        self.header = header
+        self.blocks = blocks
+        self.depth = 1
+
+    def __repr__(self):
+        return f"Loop(header={self.header}, blocks={sorted(self.blocks)}, depth={self.depth})"
+
+
+def _mask_registers(mask):
+    registers = []
+    while mask:
+        low = mask & -mask
+        registers.append(low.bit_length() - 1)
+        mask ^= low
+    return registers
+
+
+class ControlFlowGraph:
+    """Bir programın temel blokları, kenarları ve analiz sonuçları.
+
+    Tüm analizler kurucu içinde bir kez yapılır; nesne değişmez olduğu
+    için yürütme motorları ve GUI aynı örneği paylaşabilir.
+    """
+
+    def __init__(self, instructions, labels, register_map):
+        self.instructions = list(instructions)
+        self.labels = dict(labels)
+        self.register_map = register_map
+        # Register indeksi -> isim ($rN yerine sembolik isim tercih edilir)
+        self.register_names = {}
+        for name, index in register_map.items():
+            if index not in self.register_names or self.register_names[index].startswith("$r"):
+                self.register_names[index] = name
+
+        self.operations = [parse_instruction(instruction) for instruction in self.instructions]
+        self.operands = [self._operands(op, params) for op, params in self.operations]
+        self.blocks = []
+        self.block_of = []  # komut indeksi -> blok id
+        self.loops = []
+        self._build_blocks()
+        self._connect_blocks()
+        self._mark_reachable()
+        self._find_loops()
+        self._compute_liveness()
+        self.uninitialized_reads = self._find_uninitialized_reads()
+
+    def _operands(self, op, params):
+        """(yazılan register, okunan register'lar); çözülemeyen komutlar için (None, ())"""
+        if not op:
+            return None, ()
+        try:
+            return register_operands(op, params, self.register_map)
+        except (KeyError, IndexError):
+            return None, ()
+
+    # Blok ve kenarlar
+    def _target(self, index):
+        """Branch/jump'ın hedef komut indeksi; hedef yoksa None"""
+        op, params = self.operations[index]
+        if op in BRANCH_OPS:
+            name = params[2] if len(params) > 2 else None
+        else:
+            name = params[0] if params else None
+        return self.labels.get(name)
+
+    def _build_blocks(self):
+        count = len(self.instructions)
+        leaders = {0} if count else set()
+        for index, (op, _) in enumerate(self.operations):
+            if op in BRANCH_OPS or op in ("j", "jal", "jr"):
+                if index + 1 < count:
+                    leaders.add(index + 1)
+                target = self._target(index) if op != "jr" else None
+                if target is not None and target < count:
+                    leaders.add(target)
+        for target in self.labels.values():
+            if target < count:
+                leaders.add(target)
+
+        starts = sorted(leaders)
+        self.block_of = [0] * count
+        for block_id, start in enumerate(starts):
+            end = starts[block_id + 1] if block_id + 1 < len(starts) else count
+            block = BasicBlock(block_id, start, end)
+            self.blocks.append(block)
+            for index in range(start, end):
+                self.block_of[index] = block_id
+        for label, target in sorted(self.labels.items(), key=lambda item: item[1]):
+            if target < count:
+                self.blocks[self.block_of[target]].labels.append(label)
+
+    def _block_at(self, index):
+        """Komut indeksindeki blok; program sonu ve ötesi için EXIT"""
+        if index >= len(self.instructions):
+            return EXIT
+        return self.block_of[index]
+
+    def _connect_blocks(self):
+        return_points = sorted({
+            index + 1 for index, (op, _) in enumerate(self.operations) if op == "jal"
+        })
+        for block in self.blocks:
+            last = block.end - 1
+            op, _ = self.operations[last]
+            successors = []
+            if op in BRANCH_OPS:
+                target = self._target(last)
+                if target is not None:
+                    successors.append(self._block_at(target))
+                successors.append(self._block_at(last + 1))
+            elif op == "j":
+                target = self._target(last)
+                successors.append(EXIT if target is None else self._block_at(target))
+            elif op == "jal":
+                target = self._target(last)
+                if target is not None:
+                    successors.append(self._block_at(target))
+                successors.append(self._block_at(last + 1))
+            elif op == "jr":
+                successors.extend(self._block_at(point) for point in return_points)
+                if not successors:
+                    successors.append(EXIT)
+            else:
+                successors.append(self._block_at(last + 1))
+            # Sırayı koruyarak tekrarları at
+            block.successors = list(dict.fromkeys(successors))
+            for successor in block.successors:
+                if successor != EXIT:
+                    self.blocks[successor].predecessors.append(block.id)
+
+    # Erişilebilirlik ve döngüler
+    def _mark_reachable(self):
+        """Giriş bloğundan DFS; erişilen blokların ters post-order sırasını tutar"""
+        self.order = []
+        if not self.blocks:
+            return
+        postorder = []
+        self.blocks[0].reachable = True
+        stack = [(0, iter(self.blocks[0].successors))]
+        while stack:
+            block_id, successors = stack[-1]
+            for successor in successors:
+                if successor != EXIT and not self.blocks[successor].reachable:
+                    self.blocks[successor].reachable = True
+                    stack.append((successor, iter(self.blocks[successor].successors)))
+                    break
+            else:
+                stack.pop()
+                postorder.append(block_id)
+        self.order = postorder[::-1]
+
+    def _dominators(self):
+        """Erişilen bloklar için anlık dominator (Cooper-Harvey-Kennedy)"""
+        position = {block_id: i for i, block_id in enumerate(self.order)}
+        idom = {self.order[0]: self.order[0]}
+
+        def intersect(a, b):
+            while a != b:
+                while position[a] > position[b]:
+                    a = idom[a]
+                while position[b] > position[a]:
+                    b = idom[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for block_id in self.order[1:]:
+                preds = [p for p in self.blocks[block_id].predecessors if p in idom]
+                new = preds[0]
+                for pred in preds[1:]:
+                    new = intersect(pred, new)
+                if idom.get(block_id) != new:
+                    idom[block_id] = new
+                    changed = True
+        return idom
+
+    def _number_dominator_tree(self):
+        """Dominator ağacında giriş/çıkış sıraları; dominates() sorgusu O(1) olur"""
+        children = {}
+        for block_id, parent in self.idom.items():
+            if block_id != parent:
+                children.setdefault(parent, []).append(block_id)
+        self._enter = {}
+        self._exit = {}
+        clock = 0
+        stack = [(self.order[0], False)]
+        while stack:
+            block_id, done = stack.pop()
+            clock += 1
+            if done:
+                self._exit[block_id] = clock
+                continue
+            self._enter[block_id] = clock
+            stack.append((block_id, True))
+            stack.extend((child, False) for child in children.get(block_id, ()))
+
+    def dominates(self, a, b):
+        """a bloğu b bloğuna giden her yolda bulunuyorsa True"""
+        if a not in self._enter or b not in self._enter:
+            return False
+        return self._enter[a] <= self._enter[b] and self._exit[b] <= self._exit[a]
+
+    def _find_loops(self):
+        self.idom = self._dominators() if self.order else {}
+        self._enter = {}
+        self._exit = {}
+        if self.order:
+            self._number_dominator_tree()
+        bodies = {}
+        for block_id in self.order:
+            for successor in self.blocks[block_id].successors:
+                if successor != EXIT and self.dominates(successor, block_id):
+                    # Geri kenar: gövde, kuyruktan header'a geriye doğru erişilen bloklar
+                    body = bodies.setdefault(successor, {successor})
+                    stack = [block_id]
+                    while stack:
+                        current = stack.pop()
+                        if current not in body:
+                            body.add(current)
+                            stack.extend(p for p in self.blocks[current].predecessors
+                                         if self.blocks[p].reachable)
+        self.loops = [Loop(header, frozenset(body)) for header, body in sorted(bodies.items())]
+        for loop in self.loops:
+            for block_id in loop.blocks:
+                self.blocks[block_id].loop_depth += 1
+        # Header'ı içeren döngü sayısı döngünün iç içelik derinliğidir
+        for loop in self.loops:
+            loop.depth = self.blocks[loop.header].loop_depth
+
+    # Veri akışı
+    def _compute_liveness(self):
+        for block in self.blocks:
+            use = defs = 0
+            for index in range(block.start, block.end):
+                dest, srcs = self.operands[index]
+                for src in srcs:
+                    if not defs >> src & 1:
+                        use |= 1 << src
+                if dest is not None:
+                    defs |= 1 << dest
+            block.use = use
+            block.defs = defs
+
+        worklist = [block.id for block in self.blocks]
+        pending = set(worklist)
+        while worklist:
+            block = self.blocks[worklist.pop()]
+            pending.discard(block.id)
+            live_out = 0
+            for successor in block.successors:
+                if successor != EXIT:
+                    live_out |= self.blocks[successor].live_in
+            block.live_out = live_out
+            live_in = block.use | (live_out & ~block.defs)
+            if live_in != block.live_in:
+                block.live_in = live_in
+                for pred in block.predecessors:
+                    if pred not in pending:
+                        pending.add(pred)
+                        worklist.append(pred)
+
+    def _find_uninitialized_reads(self):
+        """Hiçbir yolda önceden yazılmamış register okumaları: [(komut indeksi, register)]"""
+        written_in = {block_id: 0 for block_id in self.order}
+        written_out = {}
+        changed = True
+        while changed:
+            changed = False
+            for block_id in self.order:
+                block = self.blocks[block_id]
+                if block_id != 0 or block.predecessors:
+                    incoming = 0
+                    for pred in block.predecessors:
+                        incoming |= written_out.get(pred, 0)
+                    written_in[block_id] = incoming
+                out = written_in[block_id] | block.defs
+                if written_out.get(block_id) != out:
+                    written_out[block_id] = out
+                    changed = True
+
+        reads = []
+        for block_id in sorted(self.order):
+            block = self.blocks[block_id]
+            written = written_in[block_id]
+            for index in range(block.start, block.end):
+                dest, srcs = self.operands[index]
+                for src in srcs:
+                    if not written >> src & 1:
+                        reads.append((index, src))
+                        # Aynı register için tek uyarı yeter
+                        written |= 1 << src
+                if dest is not None:
+                    written |= 1 << dest
+        return reads
+
+    # Sorgular
+    @property
+    def unreachable_blocks(self):
+        return [block for block in self.blocks if not block.reachable]
+
+    def is_reachable(self, index):
+        return self.blocks[self.block_of[index]].reachable
+
+    def loop_ranges(self):
+        """Döngü gövdesindeki blokların (ilk, son) komut indeksi aralıkları"""
+        blocks = {block_id for loop in self.loops for block_id in loop.blocks}
+        return [(self.blocks[b].start, self.blocks[b].end - 1) for b in sorted(blocks)]
+
+    def loop_depth(self, index):
+        """Komutun içinde bulunduğu iç içe döngü sayısı"""
+        return self.blocks[self.block_of[index]].loop_depth
+
+    def live_registers(self, index):
+        """index'teki komut yürütülmeden önce canlı olan register'lar"""
+        block = self.blocks[self.block_of[index]]
+        live = block.live_out
+        for i in range(block.end - 1, index - 1, -1):
+            dest, srcs = self.operands[i]
+            if dest is not None:
+                live &= ~(1 << dest)
+            for src in srcs:
+                live |= 1 << src
+        return _mask_registers(live)
+
+    def register_name(self, register):
+        return self.register_names.get(register, f"$r{register}")
+
+    def diagnostics(self, lines=None):
+        """Erişilemeyen kod ve ilk değeri okunmadan önce yazılmayan register uyarıları.
+
+        lines verilirse (check_source sonucu) komut indeksleri kaynak satır
+        numarasına çevrilir, verilmezse satır olarak indeks + 1 kullanılır.
+        """
+        def line(index):
+            return lines[index] if lines is not None else index + 1
+
+        diagnostics = []
+        for block in self.unreachable_blocks:
+            count = len(block)
+            noun = "instruction" if count == 1 else "instructions"
+            diagnostics.append(Diagnostic(line(block.start), "warning", f"Unreachable code ({count} {noun})"))
+        for index, register in self.uninitialized_reads:
+            diagnostics.append(Diagnostic(
+                line(index), "warning", f"Register {self.register_name(register)} is read before it is written"
+            ))
+        diagnostics.sort(key=lambda d: d.line)
+        return diagnostics
+
+    def to_dot(self, word_size=4):
+        """Graphviz DOT metni; erişilemeyen bloklar kesikli çizilir"""
+        def escape(text):
+            return text.replace("\\", "\\\\").replace('"', '\\"')
+
+        lines = ["digraph cfg {", '    node [shape=box, fontname="Courier"];']
+        for block in self.blocks:
+            header = f"B{block.id} (0x{block.start * word_size:08x})"
+            if block.labels:
+                header += " " + ", ".join(f"{label}:" for label in block.labels)
+            if block.loop_depth:
+                header += f" loop depth {block.loop_depth}"
+            body = "".join(
+                escape(self.instructions[i].split('#')[0].strip()) + "\\l"
+                for i in range(block.start, block.end)
+            )
+            style = "" if block.reachable else ", style=dashed"
+            lines.append(f'    B{block.id} [label="{escape(header)}\\l{body}"{style}];')
+        exits = False
+        for block in self.blocks:
+            for successor in block.successors:
+                if successor == EXIT:
+                    exits = True
+                    lines.append(f"    B{block.id} -> exit;")
+                else:
+                    lines.append(f"    B{block.id} -> B{successor};")
+        if exits:
+            lines.append("    exit [shape=oval];")
+        lines.append("}")
+        return "\n".join(lines)
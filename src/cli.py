@@ -0,0 +1,347 @@
+"""Komut satırı arayüzü: python -m src run|assemble|cfg|trace|dump|query|serve|fuzz|gui
+
+Bu modül yalnızca simülasyon çekirdeğini (cpu) yükler; PyQt5 sadece
+gui komutu çalıştırıldığında import edilir.
+"""
+import argparse
+import sys
+import time
+
+try:
+    from .cpu import LOOP_DETECTION_STEPS, MIPSCPU
+    from .trace_file import TraceReader
+    from .trace_index import TraceIndex
+    from .log_sink import LogSink, VERBOSE
+    from .assembler import assemble_file, assemble_lines
+    from .program_cache import DEFAULT_MAX_BYTES, ProgramCache
+except ImportError:
+    from cpu import LOOP_DETECTION_STEPS, MIPSCPU
+    from trace_file import TraceReader
+    from trace_index import TraceIndex
+    from log_sink import LogSink, VERBOSE
+    from assembler import assemble_file, assemble_lines
+    from program_cache import DEFAULT_MAX_BYTES, ProgramCache
+
+
+def read_source(path):
+    """Assembly kaynağını dosyadan ya da '-' için stdin'den okur"""
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def assemble_source(path, register_map=None):
+    """Kaynağı dosyadan satır satır (ya da '-' için stdin'den) assemble eder"""
+    if path == "-":
+        return assemble_lines(sys.stdin, register_map)
+    return assemble_file(path, register_map)
+
+
+def format_state(cpu, show_all=False):
+    """Register ve data memory içeriğini metin olarak döndürür"""
+    names = {index: name for name, index in cpu.register_names.items()}
+    lines = ["Registers:"]
+    for index, value in enumerate(cpu.registers):
+        if value or show_all:
+            lines.append(f"  {names[index]:<6}{value:>12}  0x{value & 0xFFFFFFFF:08x}")
+    lines.append("Data memory:")
+    for index, value in enumerate(cpu.data_memory):
+        if value or show_all:
+            lines.append(f"  0x{index * cpu.WORD_SIZE:08x}{value:>12}  0x{value & 0xFFFFFFFF:08x}")
+    return "\n".join(lines)
+
+
+def make_cpu(args):
+    log = None
+    if getattr(args, "verbose", False):
+        log = LogSink(emit=lambda lines: print("\n".join(lines)), level=VERBOSE)
+    cpu = MIPSCPU(log=log)
+    if args.profile or args.profile_out:
+        cpu.enable_profiling(args.profile_out)
+    if args.cache is not None:
+        cpu.program_cache = ProgramCache(args.cache or None, int(args.cache_size * 1024 * 1024))
+    if args.file == "-":
+        cpu.load_program(read_source(args.file))
+    else:
+        cpu.load_file(args.file)
+    if args.data:
+        cpu.load_data_file(args.data, int(args.data_address, 0))
+    return cpu
+
+
+def print_profile(cpu):
+    """Profil açıksa ölçümü kapatır ve aşama dökümünü stderr'e yazar"""
+    if cpu.profiler is not None:
+        cpu.profiler.stop()
+        print(cpu.profiler.report(), file=sys.stderr)
+
+
+def cmd_assemble(args):
+    cpu = MIPSCPU()
+    program = assemble_source(args.file, cpu.register_map)
+    for diagnostic in program.diagnostics:
+        print(f"Line {diagnostic.line}: {diagnostic.severity}: {diagnostic.message}", file=sys.stderr)
+    if any(diagnostic.severity == "error" for diagnostic in program.diagnostics):
+        return 1
+    for i, instruction in enumerate(program.instructions):
+        code = cpu.generate_machine_code(instruction, i)
+        if args.hex:
+            code = f"0x{int(code, 2):08x}"
+        print(f"0x{i * cpu.WORD_SIZE:08x}  {code}  {instruction}")
+    return 0
+
+
+def cmd_cfg(args):
+    cpu = MIPSCPU()
+    cpu.program_instructions, cpu.labels = cpu.assemble(read_source(args.file))
+    cfg = cpu.control_flow_graph()
+    if args.dot:
+        print(cfg.to_dot(cpu.WORD_SIZE))
+        return 0
+    for block in cfg.blocks:
+        names = ", ".join(block.labels)
+        successors = ", ".join("exit" if s < 0 else f"B{s}" for s in block.successors)
+        flags = "" if block.reachable else "  unreachable"
+        if block.loop_depth:
+            flags += f"  loop depth {block.loop_depth}"
+        print(f"B{block.id}  0x{block.start * cpu.WORD_SIZE:08x}-0x{(block.end - 1) * cpu.WORD_SIZE:08x}"
+              f"  {names or '-'}  -> {successors}{flags}")
+    for diagnostic in cfg.diagnostics():
+        print(f"Instruction {diagnostic.line}: {diagnostic.severity}: {diagnostic.message}")
+    return 0
+
+
+def cmd_run(args):
+    cpu = make_cpu(args)
+    cpu.trace_enabled = False
+    cpu.fusion_enabled = args.fusion
+    for target in args.breakpoint or ():
+        cpu.breakpoints.add_breakpoint(target)
+    cpu.breakpoints.resolve_labels(cpu.labels)
+    start = time.perf_counter()
+    if args.detect_loops:
+        stop_reason = cpu.run_until_repeat(args.detect_loops)
+    else:
+        stop_reason = cpu.run()
+    elapsed = time.perf_counter() - start
+    if stop_reason is not None:
+        print(f"Paused: {stop_reason}")
+    print(format_state(cpu, args.all))
+    print(f"Executed {cpu.instruction_count} instructions in {elapsed * 1000:.3f} ms")
+    fingerprint = cpu.state_fingerprint()
+    if args.fingerprint or args.expect_fingerprint is not None:
+        print(f"State fingerprint: 0x{fingerprint:016x}")
+    if cpu.program_cache is not None:
+        stats = cpu.program_cache.stats()
+        print(f"Program cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} entries ({stats['bytes']} bytes)")
+    print_profile(cpu)
+    if cpu.last_error:
+        print(f"Error: {cpu.last_error}", file=sys.stderr)
+        return 1
+    if args.expect_fingerprint is not None and fingerprint != args.expect_fingerprint:
+        print(f"Error: state fingerprint 0x{fingerprint:016x} does not match "
+              f"expected 0x{args.expect_fingerprint:016x}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_trace(args):
+    cpu = make_cpu(args)
+    if args.output:
+        writer = cpu.open_trace_file(args.output, compress=args.compress)
+        cpu.run()
+        cpu.close_trace_file()
+        print(f"Wrote {writer.records} trace records to {args.output}")
+    else:
+        cpu.run()
+        sys.stdout.write("".join(cpu.execution_trace))
+    print_profile(cpu)
+    if cpu.last_error:
+        print(f"Error: {cpu.last_error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_dump(args):
+    names = {index: name for name, index in MIPSCPU().register_names.items()}
+    with TraceReader(args.file) as reader:
+        if args.csv:
+            reader.to_csv(sys.stdout, args.start, args.stop, names)
+        else:
+            reader.to_text(sys.stdout, args.start, args.stop, names)
+    return 0
+
+
+def cmd_query(args):
+    register_map = MIPSCPU().register_map
+    with TraceReader(args.file) as reader:
+        index = TraceIndex.from_reader(reader)
+    for text in args.queries:
+        try:
+            print(index.query(text, register_map))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+def cmd_serve(args):
+    import asyncio
+    try:
+        from .server import serve
+    except ImportError:
+        from server import serve
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_fuzz(args):
+    try:
+        from .fuzz import ENGINES, fuzz
+    except ImportError:
+        from fuzz import ENGINES, fuzz
+    engines = args.engines.split(",") if args.engines else list(ENGINES)
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown:
+        print(f"Error: unknown engine(s): {', '.join(unknown)}", file=sys.stderr)
+        return 1
+    report = fuzz(args.count, args.seed, args.workers, engines, args.length)
+    print(f"Checked {report['programs']} programs against {', '.join(engines)} "
+          f"in {report['seconds']:.2f} s ({report['programs_per_second']:.0f} programs/s)")
+    divergence = report["divergence"]
+    if divergence is None:
+        print("No divergence found")
+        return 0
+    print(f"Divergence in engine '{divergence['engine']}' (seed {divergence['seed']}), "
+          f"field '{divergence['field']}':")
+    print(f"  reference: {divergence['reference']}")
+    print(f"  {divergence['engine']}: {divergence['actual']}")
+    print("Minimized program:")
+    print(divergence["program"])
+    return 1
+
+
+def cmd_gui(args):
+    # Qt yalnızca burada yüklenir
+    try:
+        from .mips_simulator import main as gui_main
+    except ImportError:
+        from mips_simulator import main as gui_main
+    gui_main(args.file)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="MIPS 32-bit simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run a program and print the final state")
+    run.add_argument("file", help="assembly source file ('-' for stdin)")
+    run.add_argument("--fusion", action="store_true", help="run with superinstruction fusion")
+    run.add_argument("--break", dest="breakpoint", action="append", metavar="TARGET",
+                     help="stop at an index, 0x address or label (repeatable)")
+    run.add_argument("--all", action="store_true", help="print zero registers and memory too")
+    run.add_argument("-v", "--verbose", action="store_true", help="print simulator log messages")
+    run.add_argument("--data", metavar="FILE",
+                     help="copy a little-endian binary or .csv file into data memory")
+    run.add_argument("--data-address", default="0", metavar="ADDR",
+                     help="byte address for --data (default 0)")
+    run.add_argument("--cache", nargs="?", const="", metavar="DIR",
+                     help="reuse assembled programs from an on-disk cache "
+                          "(default $MIPS_CACHE_DIR or ~/.cache/mips-simulator)")
+    run.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                     metavar="MB", help="cache size limit before LRU eviction (default 64)")
+    run.add_argument("--profile", action="store_true",
+                     help="print time per stage (parse, encode, execute, trace) and instructions/s")
+    run.add_argument("--profile-out", metavar="FILE",
+                     help="also write cProfile stats to FILE (implies --profile)")
+    run.add_argument("--fingerprint", action="store_true",
+                     help="print a 64-bit fingerprint of the final registers and memory")
+    run.add_argument("--expect-fingerprint", type=lambda text: int(text, 0), metavar="HEX",
+                     help="exit with status 1 if the final state fingerprint differs (golden check)")
+    run.add_argument("--detect-loops", nargs="?", type=int, const=LOOP_DETECTION_STEPS, metavar="STEPS",
+                     help="stop when the same state repeats at the same instruction "
+                          f"(infinite loop), within STEPS instructions (default {LOOP_DETECTION_STEPS})")
+    run.set_defaults(handler=cmd_run)
+
+    assemble = commands.add_parser("assemble", help="print machine code for each instruction")
+    assemble.add_argument("file", help="assembly source file ('-' for stdin)")
+    assemble.add_argument("--hex", action="store_true", help="print machine code in hex")
+    assemble.set_defaults(handler=cmd_assemble)
+
+    trace = commands.add_parser("trace", help="run a program and print its execution trace")
+    trace.add_argument("file", help="assembly source file ('-' for stdin)")
+    trace.add_argument("-o", "--output", help="stream binary trace records to this file")
+    trace.add_argument("--compress", action="store_true", help="gzip the binary trace file")
+    trace.add_argument("-v", "--verbose", action="store_true", help="print simulator log messages")
+    trace.add_argument("--data", metavar="FILE",
+                       help="copy a little-endian binary or .csv file into data memory")
+    trace.add_argument("--data-address", default="0", metavar="ADDR",
+                       help="byte address for --data (default 0)")
+    trace.add_argument("--cache", nargs="?", const="", metavar="DIR",
+                       help="reuse assembled programs from an on-disk cache "
+                            "(default $MIPS_CACHE_DIR or ~/.cache/mips-simulator)")
+    trace.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                       metavar="MB", help="cache size limit before LRU eviction (default 64)")
+    trace.add_argument("--profile", action="store_true",
+                       help="print time per stage (parse, encode, execute, trace) and instructions/s")
+    trace.add_argument("--profile-out", metavar="FILE",
+                       help="also write cProfile stats to FILE (implies --profile)")
+    trace.set_defaults(handler=cmd_trace)
+
+    cfg = commands.add_parser("cfg", help="print basic blocks, loops and static analysis warnings")
+    cfg.add_argument("file", help="assembly source file ('-' for stdin)")
+    cfg.add_argument("--dot", action="store_true", help="print the control-flow graph in Graphviz DOT")
+    cfg.set_defaults(handler=cmd_cfg)
+
+    dump = commands.add_parser("dump", help="convert a binary trace file to text or CSV")
+    dump.add_argument("file", help="binary trace file written by trace --output")
+    dump.add_argument("--csv", action="store_true", help="write CSV instead of text")
+    dump.add_argument("--start", type=int, help="first step to convert")
+    dump.add_argument("--stop", type=int, help="last step to convert")
+    dump.set_defaults(handler=cmd_dump)
+
+    query = commands.add_parser("query", help="query register/memory history in a binary trace")
+    query.add_argument("file", help="binary trace file written by trace --output")
+    query.add_argument("queries", nargs="+", metavar="QUERY",
+                       help="'$t2' (all changes), '$t2 @ N' (value at step N), "
+                            "'M[0x40] < N' (last change before step N)")
+    query.set_defaults(handler=cmd_query)
+
+    serve = commands.add_parser("serve", help="start the JSON-RPC simulation server")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    serve.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    serve.add_argument("--workers", type=int, help="worker processes for long runs")
+    serve.set_defaults(handler=cmd_serve)
+
+    fuzz = commands.add_parser("fuzz", help="differentially fuzz the execution engines")
+    fuzz.add_argument("--count", type=int, default=1000, help="number of random programs")
+    fuzz.add_argument("--seed", type=int, default=0, help="seed of the first program")
+    fuzz.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    fuzz.add_argument("--engines", help="comma separated engines to compare with the reference")
+    fuzz.add_argument("--length", type=int, default=40, help="approximate program length")
+    fuzz.set_defaults(handler=cmd_fuzz)
+
+    gui = commands.add_parser("gui", help="open the PyQt5 graphical interface")
+    gui.add_argument("file", nargs="?", help="assembly source file to load into the editor")
+    gui.set_defaults(handler=cmd_gui)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1272 @@
+import csv
+import sys
+from array import array
+
+try:
+    from .pipeline import BRANCH_OPS, PipelineModel, register_operands
+    from .branch_predictor import make_predictor
+    from .hooks import HookRegistry, POST_EXECUTE, BRANCH_RESOLVED
+    from .breakpoints import BreakpointManager, compile_condition
+    from .fusion import CompileError, compile_program
+    from .trace_file import TraceWriter
+    from .trace_index import TraceIndex
+    from .log_sink import LogSink, VERBOSE
+    from .cfg import ControlFlowGraph
+    from .assembler import AssemblyError, Assembler, assemble_file, tokenize_line
+    from .program_cache import CachedProgram
+    from .profiler import StageProfiler
+    from .fingerprint import StateFingerprint, state_fingerprint
+except ImportError:
+    from pipeline import BRANCH_OPS, PipelineModel, register_operands
+    from branch_predictor import make_predictor
+    from hooks import HookRegistry, POST_EXECUTE, BRANCH_RESOLVED
+    from breakpoints import BreakpointManager, compile_condition
+    from fusion import CompileError, compile_program
+    from trace_file import TraceWriter
+    from trace_index import TraceIndex
+    from log_sink import LogSink, VERBOSE
+    from cfg import ControlFlowGraph
+    from assembler import AssemblyError, Assembler, assemble_file, tokenize_line
+    from program_cache import CachedProgram
+    from profiler import StageProfiler
+    from fingerprint import StateFingerprint, state_fingerprint
+
+
+# Assemble/kodlama çıktısını değiştiren her sürümde artırılır; disk
+# önbelleğindeki eski kayıtlar bu sayede kullanılmaz
+SIMULATOR_VERSION = "1.2"
+
+# current_instruction'ı kendisi değiştiren komutlar
+CONTROL_OPS = ('beq', 'bne', 'j', 'jal', 'jr')
+
+# run_limited'in until koşulu sağlandığında döndürdüğü durma sebebi
+CONDITION_MET = "Condition met"
+
+# Komut bütçesi bittiğinde döndürülen durma sebebi (bütçe ile biçimlenir)
+BUDGET_EXHAUSTED = "Step budget of {} instructions exhausted"
+
+# Tekrar eden durum aranırken run_limited'e verilen varsayılan bütçe
+LOOP_DETECTION_STEPS = 1000000
+
+
+def wrap32(value):
+    """Değeri 32-bit two's complement aralığına sarar"""
+    return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def register_file(count):
+    """Sıfırlanmış, 32-bit işaretli kelimelerden oluşan register dosyası"""
+    return array('i', [0]) * count
+
+
+def make_sink(log):
+    """LogSink'i olduğu gibi, callable'ı tüm seviyeleri alan bir sink olarak döndürür"""
+    if log is None:
+        return LogSink()
+    if isinstance(log, LogSink):
+        return log
+    return LogSink(emit=lambda lines: [log(line) for line in lines], level=VERBOSE)
+
+
+def read_binary_words(path):
+    """Dosyayı little-endian işaretli 32-bit kelimeler olarak okur"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if len(raw) % 4:
+        raise ValueError(f"{path}: size {len(raw)} is not a multiple of 4 bytes")
+    words = array("i")
+    words.frombytes(raw)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words.tolist()
+
+
+def read_csv_words(path):
+    """CSV dosyasındaki tüm sayıları (ondalık ya da 0x onaltılık) satır sırasıyla okur"""
+    words = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            for field in row:
+                field = field.strip()
+                if field:
+                    try:
+                        value = int(field, 0)
+                    except ValueError:
+                        raise ValueError(f"{path}: invalid value '{field}'")
+                    if not -0x80000000 <= value <= 0xFFFFFFFF:
+                        raise ValueError(f"{path}: value {value} does not fit in 32 bits")
+                    words.append(value - 0x100000000 if value > 0x7FFFFFFF else value)
+    return words
+
+
+class MIPSCPU:
+    """Qt'ye bağımlı olmayan MIPS simülasyon çekirdeği.
+
+    Register/bellek durumu, assemble, yürütme döngüleri, trace, hook'lar,
+    breakpoint'ler ve pipeline/branch tahmini burada tutulur. GUI
+    (MIPSSimulator) ve komut satırı arayüzü bu sınıfı kullanır. Çıktı
+    mesajları seviyeleriyle birlikte log sink'ine (LogSink) gönderilir;
+    düz bir callable verilirse her mesajı alan bir sink ile sarılır.
+    """
+
+#Başlangıç
+    def __init__(self, log=None):
+        # Memory configuration
+        self.MEMORY_SIZE = 512  # 512 bytes
+        self.WORD_SIZE = 4      # 4 bytes per word
+        self.instruction_memory = [0] * (self.MEMORY_SIZE // self.WORD_SIZE)  # 512 bytes / 4 = 128 words
+        self.data_memory = [0] * (self.MEMORY_SIZE // self.WORD_SIZE)        # 512 bytes / 4 = 128 words
+        
+        # Register configuration
+        self.NUM_REGISTERS = 32
+        # array('i') kelime başına 4 bayt tutar ve 32 bit dışındaki değerleri reddeder;
+        # tüm yazmalar write_register (ya da derlenmiş handler'lar) üzerinden sarılır
+        self.registers = register_file(self.NUM_REGISTERS)
+        self.register_names = {
+            "$zero": 0,  # Constant 0
+            "$at": 1,    # Assembler temporary
+            "$v0": 2, "$v1": 3,  # Values for results and expression evaluation
+            "$a0": 4, "$a1": 5, "$a2": 6, "$a3": 7,  # Arguments
+            "$t0": 8, "$t1": 9, "$t2": 10, "$t3": 11,  # Temporaries
+            "$t4": 12, "$t5": 13, "$t6": 14, "$t7": 15,
+            "$s0": 16, "$s1": 17, "$s2": 18, "$s3": 19,  # Saved temporaries
+            "$s4": 20, "$s5": 21, "$s6": 22, "$s7": 23,
+            "$t8": 24, "$t9": 25,  # More temporaries
+            "$k0": 26, "$k1": 27,  # Reserved for OS kernel
+            "$gp": 28,  # Global pointer
+            "$sp": 29,  # Stack pointer
+            "$fp": 30,  # Frame pointer
+            "$ra": 31   # Return address
+        }
+        # Add numeric register names
+        self.register_map = {f"$r{i}": i for i in range(32)}
+        self.register_map.update(self.register_names)  # Add named registers
+        
+        # Initialize other components
+        self.log = make_sink(log)
+        self.current_instruction = 0
+        self.labels = {}
+        self.data_labels = {}  # .data label -> byte adresi
+        self.machine_code = []
+        self.decoded_instructions = []  # Komut başına (op, parametreler); yüklemede bir kez çözülür
+        self.execution_trace = []
+        self.instruction_count = 0
+        self.pc = 0
+        self.last_error = None  # Son yürütme hatası (yoksa None)
+        self.pipeline_model = None  # Pipeline timing modeli (kapalıyken None)
+        self.branch_predictors = []  # Her beq/bne'de değerlendirilen tahminciler
+        self.hooks = HookRegistry()  # Yürütmeyi gözlemleyen harici hook'lar
+        self.breakpoints = BreakpointManager(self.WORD_SIZE, self.MEMORY_SIZE // self.WORD_SIZE)
+        self.program_instructions = []  # Yüklü programın komutları
+        self.trace_enabled = True  # Her komut için execution trace kaydı
+        self.trace_text = True  # Kayıtların execution_trace'e metin olarak da yazılması
+        self.trace_writer = None  # Açıksa trace kayıtları bellekte değil diskte tutulur
+        self.trace_index = TraceIndex(self.WORD_SIZE)  # Register/adres bazlı trace sorguları
+        self.fusion_enabled = False  # Trace kapalıyken birleştirilmiş komutlarla çalıştır
+        self.fusion_profile = None  # İsteğe bağlı pc -> yürütme sayısı profili
+        self.program_cache = None  # Assemble edilmiş programların disk önbelleği (ProgramCache)
+        self.profiler = None  # Açıkken aşama bazlı süre ölçen StageProfiler
+        self.fingerprint = None  # Açıkken her yazmada güncellenen StateFingerprint
+        self.shared_memory = False  # data_memory başka çekirdeklerle paylaşılıyorsa True
+        self._compiled_cache = (None, None)
+        self.program_generation = 0  # Her program yüklemesinde artar; CFG önbelleğinin anahtarı
+        self._cfg_cache = (None, None)
+
+#Program kontrolü
+    def reset(self):
+        """Register, bellek, program ve istatistikleri sıfırlar"""
+        self.registers = register_file(self.NUM_REGISTERS)
+        self.data_memory = [0] * (self.MEMORY_SIZE // self.WORD_SIZE)
+        self.pc = 0
+        self.current_instruction = 0
+        self.labels = {}
+        self.data_labels = {}
+        self.machine_code = []
+        self.decoded_instructions = []
+        self.program_instructions = []
+        self.program_generation += 1
+        self.execution_trace = []
+        self.instruction_count = 0
+        self.last_error = None
+        self.close_trace_file()
+        self.trace_index.clear()
+        self.sync_fingerprint()
+        if self.pipeline_model is not None:
+            self.pipeline_model.reset()
+        for predictor in self.branch_predictors:
+            predictor.reset()
+
+    @staticmethod
+    def assemble(assembly_code):
+        """Kaynaktan (komut listesi, label -> komut indeksi) çıkarır"""
+        instructions, labels, _, _ = MIPSCPU.assemble_sections(assembly_code)
+        return instructions, labels
+
+    @staticmethod
+    def assemble_sections(assembly_code, word_size=4, register_map=None):
+        """Kaynaktan (komutlar, label'lar, .data kelimeleri, data label -> byte adresi)
+        çıkarır; hatalı satırlarda tüm hatalarla AssemblyError yükseltir.
+        register_map verilirse opcode, register ve label'lar da doğrulanır."""
+        program = Assembler(register_map, word_size).feed(assembly_code.splitlines()).finish()
+        MIPSCPU.raise_errors(program)
+        return program.instructions, program.labels, program.data, program.data_labels
+
+    @staticmethod
+    def raise_errors(program):
+        errors = [d for d in program.diagnostics if d.severity == "error"]
+        if errors:
+            raise AssemblyError(errors)
+
+    def load_program(self, assembly_code):
+        """Kaynağı assemble eder, machine code'u üretir, .data bölümünü belleğe
+        kopyalar ve programı yükler"""
+        if self.program_cache is not None:
+            key = self.program_cache.key(assembly_code, *self.cache_context())
+            return self.load_cached(
+                key, lambda: self.assemble_sections(assembly_code, self.WORD_SIZE, self.register_map)
+            )
+        return self.load_assembled(*self.assemble_sections(assembly_code, self.WORD_SIZE, self.register_map))
+
+    def load_file(self, path):
+        """Kaynak dosyayı satır satır okuyarak assemble eder ve yükler"""
+        if self.program_cache is not None:
+            key = self.program_cache.file_key(path, *self.cache_context())
+            return self.load_cached(key, lambda: self.assemble_path(path))
+        return self.load_assembled(*self.assemble_path(path))
+
+    def assemble_path(self, path):
+        program = assemble_file(path, self.register_map, self.WORD_SIZE)
+        self.raise_errors(program)
+        return program.instructions, program.labels, program.data, program.data_labels
+
+    def cache_context(self):
+        """Önbellek anahtarına kaynakla birlikte giren bağlam"""
+        return (SIMULATOR_VERSION, self.WORD_SIZE)
+
+    def load_cached(self, key, assemble):
+        """Önbellekteki programı ayrıştırmadan yükler; yoksa assemble edip kaydeder"""
+        entry = self.program_cache.get(key)
+        if entry is not None:
+            return self.load_assembled(*entry)
+        instructions, labels, data, data_labels = assemble()
+        self.load_assembled(instructions, labels, data, data_labels)
+        self.program_cache.put(key, CachedProgram(
+            instructions, labels, data, data_labels, self.machine_code, self.decoded_instructions
+        ))
+        return instructions
+
+    def load_assembled(self, instructions, labels, data_image, data_labels, machine_code=None, decoded=None):
+        if data_image:
+            self.load_data(data_image)
+        self.data_labels = data_labels
+        self.labels = labels
+        if machine_code is None:
+            # Aynı metinli komutlar aynı machine code'u üretir; her farklı komut bir kez
+            # kodlanır. Branch offset'i komutun indeksine bağlı olduğu için beq/bne hariç.
+            encoded = {}
+            machine_code = []
+            for index, instruction in enumerate(instructions):
+                key = (instruction, index) if instruction.split(None, 1)[0].lower() in BRANCH_OPS else instruction
+                code = encoded.get(key)
+                if code is None:
+                    code = encoded[key] = self.generate_machine_code(instruction, index)
+                machine_code.append(code)
+        self.machine_code = machine_code
+        self.decoded_instructions = self.decode_program(instructions) if decoded is None else decoded
+        self.program_instructions = instructions
+        self.program_generation += 1
+        self.current_instruction = 0
+        self.breakpoints.resolve_labels(self.labels)
+        self.log.flush()
+        return instructions
+
+    def decode_program(self, instructions):
+        """Her komut için (op, parametreler) kaydı"""
+        decoded = []
+        for instruction in instructions:
+            params, op = self.clean_instruction_params(instruction)
+            decoded.append((op, tuple(params)))
+        return decoded
+
+    def decoded(self, index, instruction):
+        """index'teki komutun (parametreler, op) ikilisi; yüklenen programda
+        önceden çözülmüş kayıt kullanılır"""
+        records = self.decoded_instructions
+        if index < len(records) and self.program_instructions[index] == instruction:
+            op, params = records[index]
+            return params, op
+        return self.clean_instruction_params(instruction)
+
+    def control_flow_graph(self):
+        """Yüklü programın CFG'si; yeni bir program yüklenene kadar aynı nesne döndürülür"""
+        generation, cfg = self._cfg_cache
+        if generation != self.program_generation:
+            cfg = ControlFlowGraph(self.program_instructions, self.labels, self.register_map)
+            self._cfg_cache = (self.program_generation, cfg)
+        return cfg
+
+    def adopt_control_flow_graph(self, cfg):
+        """Başka yerde (ör. editörün arka plan analizi) kurulmuş CFG'yi yüklü program
+        için kullanır; program, label'lar ve register eşlemesi aynı değilse reddeder"""
+        if (cfg.instructions != self.program_instructions or cfg.labels != self.labels
+                or cfg.register_map != self.register_map):
+            return False
+        self._cfg_cache = (self.program_generation, cfg)
+        return True
+
+    def load_data(self, words, address=0):
+        """Kelimeleri byte adresinden başlayarak data memory'ye tek seferde kopyalar"""
+        if address % self.WORD_SIZE:
+            raise ValueError(f"Data address 0x{address:x} is not word aligned")
+        first = address // self.WORD_SIZE
+        if first < 0 or first + len(words) > len(self.data_memory):
+            raise ValueError(
+                f"{len(words)} words at 0x{address:x} do not fit in {self.MEMORY_SIZE} bytes of data memory"
+            )
+        self.data_memory[first:first + len(words)] = words
+        self.sync_fingerprint()
+
+    def load_data_file(self, path, address=0):
+        """Binary (little-endian 32-bit) ya da .csv dosyasını data memory'ye yükler"""
+        if path.lower().endswith(".csv"):
+            words = read_csv_words(path)
+        else:
+            words = read_binary_words(path)
+        self.load_data(words, address)
+        return len(words)
+
+    @property
+    def finished(self):
+        return self.current_instruction >= len(self.program_instructions)
+
+    def run(self, resume=False, max_steps=None, until=None):
+        """Yüklü programı çalıştırır; breakpoint'te, max_steps komut sonunda
+        ya da until(self) sağlandığında durulduysa sebebini döndürür"""
+        if max_steps is None and until is None:
+            stop_reason = self.run_loop(self.program_instructions, resume)
+        else:
+            stop_reason = self.run_limited(
+                self.program_instructions, sys.maxsize if max_steps is None else max_steps,
+                resume, until,
+            )
+        if stop_reason is None and self.trace_writer is not None:
+            self.close_trace_file()
+        elif stop_reason is None:
+            self.execution_trace.append(
+                f"\nProgram completed in {self.instruction_count} steps\n{'-'*50}\n"
+            )
+        self.log.flush()
+        return stop_reason
+
+    def run_until(self, condition, max_steps=None, resume=True):
+        """Koşul ("$t0 == 10" gibi bir ifade ya da sim -> bool) bir komuttan
+        sonra sağlanana kadar çalıştırır; durma sebebini döndürür"""
+        if isinstance(condition, str):
+            text = condition
+            condition = compile_condition(
+                text, self.register_map, self.WORD_SIZE, self.MEMORY_SIZE // self.WORD_SIZE
+            )
+        else:
+            text = getattr(condition, "__name__", "condition")
+        stop_reason = self.run(resume, max_steps, until=condition)
+        if stop_reason == CONDITION_MET:
+            return f"Condition met: {text}"
+        return stop_reason
+
+    def run_to(self, target, max_steps=None, resume=True):
+        """Hedef komuta (indeks, "0x.." adresi ya da label) ulaşılana kadar çalıştırır"""
+        if isinstance(target, str) and target in self.labels:
+            index = self.labels[target]
+        else:
+            index = self.breakpoints.resolve(target)
+        if not 0 <= index < len(self.program_instructions):
+            raise ValueError(f"No instruction at {target}")
+        stop_reason = self.run(resume, max_steps, until=lambda cpu: cpu.current_instruction == index)
+        if stop_reason == CONDITION_MET:
+            return f"Reached 0x{index * self.WORD_SIZE:08x}: {self.program_instructions[index]}"
+        return stop_reason
+
+    def step(self):
+        """Mevcut komutu yürütür ve bir sonrakine geçer"""
+        try:
+            self.execute_and_advance(self.program_instructions[self.current_instruction])
+        finally:
+            self.log.flush()
+
+    def snapshot(self):
+        """Programı ve mimari durumu kopyalanabilir bir sözlük olarak döndürür"""
+        return {
+            "registers": list(self.registers),
+            "data_memory": list(self.data_memory),
+            "current_instruction": self.current_instruction,
+            "instruction_count": self.instruction_count,
+            "program_instructions": list(self.program_instructions),
+            "labels": dict(self.labels),
+            "machine_code": list(self.machine_code),
+        }
+
+    def restore(self, state):
+        """snapshot() ile alınan durumu geri yükler"""
+        self.registers = array('i', [wrap32(value) for value in state["registers"]])
+        self.registers[0] = 0
+        self.data_memory = list(state["data_memory"])
+        self.current_instruction = state["current_instruction"]
+        self.instruction_count = state["instruction_count"]
+        self.program_instructions = list(state["program_instructions"])
+        self.labels = dict(state["labels"])
+        self.machine_code = list(state["machine_code"])
+        self.decoded_instructions = self.decode_program(self.program_instructions)
+        self.program_generation += 1
+        self.last_error = None
+        self.sync_fingerprint()
+
+#Çalıştırma döngüleri
+    def run_loop(self, instructions, resume=False):
+        """Duruma uygun döngüyü seçer; durulduysa sebebini döndürür"""
+        watching = self.breakpoints.register_mask or self.breakpoints.memory_words
+        if self.fusion_enabled and not self.trace_enabled and not self.hooks and not watching:
+            compiled = self.compile_instructions(instructions)
+            if compiled is not None:
+                return self.run_compiled(compiled, instructions, resume)
+        if self.breakpoints:
+            return self.run_with_breakpoints(instructions, resume)
+        if self.hooks:
+            self.run_hooked(instructions)
+        else:
+            self.run_fast(instructions)
+        return None
+
+    def run_fast(self, instructions):
+        """Hook kayıtlı değilken kullanılan, hook kontrolü yapmayan döngü"""
+        execute = self.execute_instruction
+        count = len(instructions)
+        while self.current_instruction < count:
+            instruction = instructions[self.current_instruction]
+            try:
+                execute(instruction)
+                # Branch/jump değilse sonraki komuta geç
+                if instruction.split()[0].lower() not in CONTROL_OPS:
+                    self.current_instruction += 1
+            except Exception as e:
+                self.log.error(f"Error executing: {instruction}")
+                self.log.error(f"Error: {str(e)}")
+                self.last_error = f"{instruction}: {e}"
+                break
+
+    def run_hooked(self, instructions):
+        """Her komutta kayıtlı hook'ları çağıran döngü"""
+        count = len(instructions)
+        while self.current_instruction < count:
+            instruction = instructions[self.current_instruction]
+            try:
+                self.execute_and_advance(instruction)
+            except Exception as e:
+                self.log.error(f"Error executing: {instruction}")
+                self.log.error(f"Error: {str(e)}")
+                self.last_error = f"{instruction}: {e}"
+                break
+
+    def compile_instructions(self, instructions):
+        """Komutları birleştirilmiş handler tablosuna derler, derlenemezse None döner"""
+        breakpoints = frozenset(self.breakpoints.breakpoints)
+        key = (tuple(instructions), tuple(sorted(self.labels.items())), breakpoints,
+               id(self.fusion_profile))
+        cached_key, compiled = self._compiled_cache
+        if cached_key == key:
+            return compiled
+        # Döngü gövdeleri yüklü programın (editörden devralınmış olabilen) CFG'sinden gelir
+        loops = None
+        if instructions is self.program_instructions:
+            loops = self.control_flow_graph().loop_ranges()
+        try:
+            compiled = compile_program(
+                instructions, self.labels, self.register_map,
+                self.WORD_SIZE, self.MEMORY_SIZE // self.WORD_SIZE,
+                boundaries=breakpoints, profile=self.fusion_profile, loops=loops,
+            )
+        except CompileError as e:
+            self.log.info(f"Fusion disabled: {str(e)}")
+            compiled = None
+        else:
+            self.log.info(
+                f"Fused {len(compiled.fused)} sequences ({compiled.fused_instructions} instructions)"
+            )
+        self._compiled_cache = (key, compiled)
+        return compiled
+
+    def run_compiled(self, compiled, instructions, resume=False):
+        """Derlenmiş handler'larla çalıştırır; her handler bir veya birkaç komut yürütür"""
+        handlers = compiled.handlers
+        registers = self.registers
+        memory = self.data_memory
+        breakpoints = self.breakpoints.breakpoints
+        conditions = self.breakpoints.conditions
+        count = len(handlers)
+        pc = self.current_instruction
+        executed = 0
+        skip_breakpoint = resume
+        try:
+            if breakpoints:
+                while pc < count:
+                    if pc in breakpoints and not skip_breakpoint:
+                        condition = conditions.get(pc)
+                        if condition is None or condition[1](self):
+                            return self.breakpoint_reason(pc, instructions[pc])
+                    skip_breakpoint = False
+                    handler, weight = handlers[pc]
+                    pc = handler(registers, memory)
+                    executed += weight
+            else:
+                while pc < count:
+                    handler, weight = handlers[pc]
+                    pc = handler(registers, memory)
+                    executed += weight
+        except Exception as e:
+            self.log.error(f"Error executing: {instructions[pc]}")
+            self.log.error(f"Error: {str(e)}")
+            self.last_error = f"{instructions[pc]}: {e}"
+        finally:
+            self.current_instruction = pc
+            self.instruction_count += executed
+            # Handler'lar listelere doğrudan yazar; parmak izi sonunda bir kez hesaplanır
+            self.sync_fingerprint()
+        return None
+
+    def run_limited(self, instructions, max_steps, resume=False, until=None):
+        """En fazla max_steps komut yürüten döngü; bütçe biterse sebebini döndürür.
+
+        until verilirse her komuttan sonra until(self) kontrol edilir ve
+        sağlandığında CONDITION_MET döndürülür.
+        """
+        if self.breakpoints.register_mask or self.breakpoints.memory_words:
+            return self.run_with_breakpoints(instructions, resume, max_steps, until)
+        step = self.execute_and_advance if self.hooks else self.execute_plain
+        breakpoints = self.breakpoints.breakpoints
+        conditions = self.breakpoints.conditions
+        count = len(instructions)
+        skip_breakpoint = resume
+        for _ in range(max_steps):
+            index = self.current_instruction
+            if index >= count:
+                return None
+            instruction = instructions[index]
+            if index in breakpoints and not skip_breakpoint:
+                condition = conditions.get(index)
+                if condition is None or condition[1](self):
+                    return self.breakpoint_reason(index, instruction)
+            skip_breakpoint = False
+            try:
+                step(instruction)
+            except Exception as e:
+                self.log.error(f"Error executing: {instruction}")
+                self.log.error(f"Error: {str(e)}")
+                self.last_error = f"{instruction}: {e}"
+                return None
+            if until is not None and until(self):
+                return CONDITION_MET
+        if self.current_instruction >= count:
+            return None
+        return BUDGET_EXHAUSTED.format(max_steps)
+
+    def breakpoint_reason(self, index, instruction):
+        return f"Breakpoint at 0x{index * self.WORD_SIZE:08x}: {instruction}"
+
+    def run_with_breakpoints(self, instructions, resume=False, max_steps=None, until=None):
+        """Breakpoint ve watchpoint'lerde duran döngü, durma sebebini döndürür.
+
+        max_steps ve until run_limited'dekiyle aynı anlamdadır.
+        """
+        breakpoints = self.breakpoints.breakpoints
+        conditions = self.breakpoints.conditions
+        register_mask = self.breakpoints.register_mask
+        memory_words = self.breakpoints.memory_words
+        dest_regs, store_operands = self.watch_targets(instructions)
+        step = self.execute_and_advance if self.hooks else self.execute_plain
+        memory_words_count = self.MEMORY_SIZE // self.WORD_SIZE
+        count = len(instructions)
+        skip_breakpoint = resume
+        executed = 0
+        while self.current_instruction < count:
+            if max_steps is not None and executed >= max_steps:
+                return BUDGET_EXHAUSTED.format(max_steps)
+            executed += 1
+            index = self.current_instruction
+            instruction = instructions[index]
+            if index in breakpoints and not skip_breakpoint:
+                condition = conditions.get(index)
+                if condition is None or condition[1](self):
+                    return self.breakpoint_reason(index, instruction)
+            skip_breakpoint = False
+
+            # Yalnızca izlenen konumlara yazabilecek komutlarda eski değeri sakla
+            watched_reg = dest_regs[index]
+            if watched_reg is not None and register_mask >> watched_reg & 1:
+                old_value = self.registers[watched_reg]
+            else:
+                watched_reg = None
+            watched_word = None
+            if memory_words and store_operands[index] is not None:
+                base_idx, offset = store_operands[index]
+                word = (self.registers[base_idx] + offset) // self.WORD_SIZE
+                if word in memory_words and 0 <= word < memory_words_count:
+                    watched_word = word
+                    old_word = self.data_memory[word]
+
+            try:
+                step(instruction)
+            except Exception as e:
+                self.log.error(f"Error executing: {instruction}")
+                self.log.error(f"Error: {str(e)}")
+                self.last_error = f"{instruction}: {e}"
+                return None
+
+            if watched_reg is not None and self.registers[watched_reg] != old_value:
+                name = next((k for k, v in self.register_names.items() if v == watched_reg), f"$r{watched_reg}")
+                return f"Watchpoint {name}: {old_value} -> {self.registers[watched_reg]}"
+            if watched_word is not None and self.data_memory[watched_word] != old_word:
+                return (f"Watchpoint M[0x{watched_word * self.WORD_SIZE:03x}]: "
+                        f"{old_word} -> {self.data_memory[watched_word]}")
+            if until is not None and until(self):
+                return CONDITION_MET
+        return None
+
+    def watch_targets(self, instructions):
+        """Her komutun yazdığı register'ı ve sw için (base, offset) bilgisini çıkarır"""
+        dest_regs = []
+        store_operands = []
+        for index, instruction in enumerate(instructions):
+            clean_params, op = self.decoded(index, instruction)
+            dest = None
+            store = None
+            try:
+                if op:
+                    dest, _ = register_operands(op, clean_params, self.register_map)
+                if op == 'sw':
+                    offset, base = clean_params[1].split('(')
+                    store = (self.register_map[base.strip(')')], int(offset))
+            except (KeyError, IndexError, ValueError):
+                pass
+            dest_regs.append(dest)
+            store_operands.append(store)
+        return dest_regs, store_operands
+
+    def execute_plain(self, instruction):
+        """Komutu hook'suz yürütür, branch/jump değilse sonrakine geçer"""
+        self.execute_instruction(instruction)
+        if instruction.split()[0].lower() not in CONTROL_OPS:
+            self.current_instruction += 1
+
+    def execute_and_advance(self, instruction):
+        """Komutu hook'larla birlikte yürütür, branch/jump değilse sonrakine geçer"""
+        hooks = self.hooks
+        index = self.current_instruction
+        for callback in hooks.pre_fetch:
+            callback(self, index)
+
+        clean_params, op = self.clean_instruction_params(instruction)
+
+        # Bellek hook'ları için erişilecek adresi yürütmeden önce hesapla
+        address = None
+        if op in ('lw', 'sw') and (hooks.memory_read or hooks.memory_write):
+            offset, base = clean_params[1].split('(')
+            word = (self.registers[self.register_map[base.strip(')')]] + int(offset)) // self.WORD_SIZE
+            if 0 <= word < (self.MEMORY_SIZE // self.WORD_SIZE):
+                address = word
+                old_value = self.data_memory[word]
+
+        self.execute_instruction(instruction)
+        if op not in CONTROL_OPS:
+            self.current_instruction += 1
+        next_index = self.current_instruction
+
+        if address is not None:
+            if op == 'lw':
+                for callback in hooks.memory_read:
+                    callback(self, address * self.WORD_SIZE, old_value)
+            else:
+                for callback in hooks.memory_write:
+                    callback(self, address * self.WORD_SIZE, old_value, self.data_memory[address])
+        if op in ('beq', 'bne') and hooks.branch_resolved:
+            rs_val = self.registers[self.register_map[clean_params[0]]]
+            rt_val = self.registers[self.register_map[clean_params[1]]]
+            taken = (rs_val == rt_val) == (op == 'beq')
+            for callback in hooks.branch_resolved:
+                callback(self, index, instruction, taken, next_index)
+        for callback in hooks.post_execute:
+            callback(self, index, instruction, next_index)
+
+#Profil
+    def enable_profiling(self, profile_path=None):
+        """Parse/encode/execute/trace aşamalarını ölçmeye başlar; profile_path
+        verilirse stop() sırasında cProfile istatistikleri de yazılır"""
+        self.disable_profiling()
+        self.profiler = StageProfiler(self, profile_path)
+        self.profiler.start()
+        return self.profiler
+
+    def disable_profiling(self):
+        if self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+
+#Durum parmak izi
+    def enable_fingerprint(self, memory=None):
+        """Register ve bellek yazmalarında artımlı güncellenen parmak izini açar.
+
+        Paylaşılan bellekte memory, tüm çekirdeklerin güncellediği ortak
+        MemoryFingerprint olmalıdır (MultiCoreSystem.enable_fingerprint).
+        """
+        if memory is not None:
+            self.fingerprint = StateFingerprint(self.registers, self.data_memory, memory)
+        elif self.shared_memory:
+            raise ValueError("Data memory is shared between cores; "
+                             "use MultiCoreSystem.enable_fingerprint()")
+        elif self.fingerprint is None:
+            self.fingerprint = StateFingerprint(self.registers, self.data_memory)
+
+    def disable_fingerprint(self):
+        self.fingerprint = None
+
+    def sync_fingerprint(self):
+        """Listeler toptan değiştiğinde parmak izini baştan hesaplar"""
+        if self.fingerprint is not None:
+            self.fingerprint.recompute(self.registers, self.data_memory)
+
+    def state_fingerprint(self):
+        """Register ve data memory'nin 64-bit parmak izi; takip kapalıysa baştan hesaplanır"""
+        if self.fingerprint is not None:
+            return self.fingerprint.value
+        return state_fingerprint(self.registers, self.data_memory)
+
+    def run_until_repeat(self, max_steps=LOOP_DETECTION_STEPS, resume=False):
+        """Aynı (komut, durum) ikilisine yeniden gelinene kadar çalıştırır.
+
+        Program girdi almadığından tekrar eden durum sonsuz döngü demektir.
+        Brent'in döngü bulma algoritmasıyla yalnızca bir kayıtlı (komut,
+        parmak izi) ikilisi tutulur: bellek sabit, her adımda tek bir
+        karşılaştırma yapılır ve döngü en geç ~2*(giriş + döngü boyu)
+        adımda bulunur.
+        """
+        tracking = self.fingerprint is not None
+        self.enable_fingerprint()
+        # [kayıtlı ikili, sonraki kayda kadarki adım sayısı (2'nin kuvveti), kayıttan beri adım]
+        brent = [(self.current_instruction, self.fingerprint.value), 1, 0]
+
+        def repeated(cpu):
+            key = (cpu.current_instruction, cpu.fingerprint.value)
+            brent[2] += 1
+            if key == brent[0]:
+                return True
+            if brent[2] == brent[1]:
+                brent[0] = key
+                brent[1] *= 2
+                brent[2] = 0
+            return False
+
+        try:
+            stop_reason = self.run(resume, max_steps, until=repeated)
+        finally:
+            if not tracking:
+                self.disable_fingerprint()
+        if stop_reason == CONDITION_MET:
+            cycle = brent[2]
+            return (f"State repeated at step {self.instruction_count} "
+                    f"(also at step {self.instruction_count - cycle}, cycle of {cycle} steps): infinite loop")
+        return stop_reason
+
+#Pipeline timing ve branch tahmini
+    def enable_pipeline_timing(self, forwarding=True, branch_policy="flush", predictor="2bit"):
+        """Fonksiyonel yürütmenin üzerine 5 aşamalı pipeline zamanlamasını açar"""
+        if branch_policy == "predict" and isinstance(predictor, str):
+            predictor = make_predictor(predictor)
+        self.pipeline_model = PipelineModel(
+            forwarding=forwarding,
+            branch_policy=branch_policy,
+            predictor=predictor if branch_policy == "predict" else None,
+        )
+        if not self.hooks.is_registered(POST_EXECUTE, self.record_pipeline_timing):
+            self.hooks.register(POST_EXECUTE, self.record_pipeline_timing)
+        return self.pipeline_model
+
+    def disable_pipeline_timing(self):
+        self.pipeline_model = None
+        self.hooks.unregister(POST_EXECUTE, self.record_pipeline_timing)
+
+    def add_branch_predictor(self, predictor):
+        """Her koşullu branch'te değerlendirilecek bir tahminci ekler"""
+        if isinstance(predictor, str):
+            predictor = make_predictor(predictor)
+        self.branch_predictors.append(predictor)
+        if not self.hooks.is_registered(BRANCH_RESOLVED, self.record_branch_prediction):
+            self.hooks.register(BRANCH_RESOLVED, self.record_branch_prediction)
+        return predictor
+
+    def clear_branch_predictors(self):
+        self.branch_predictors = []
+        self.hooks.unregister(BRANCH_RESOLVED, self.record_branch_prediction)
+
+    def record_pipeline_timing(self, sim, index, instruction, next_index):
+        """post_execute hook'u: yürütülen komutu pipeline modeline bildirir"""
+        clean_params, op = self.decoded(index, instruction)
+        if not op:
+            return
+        dest, srcs = register_operands(op, clean_params, self.register_map)
+        self.pipeline_model.issue(
+            op, dest, srcs, next_index != index + 1,
+            instruction.split('#')[0].strip(), index * self.WORD_SIZE
+        )
+
+    def record_branch_prediction(self, sim, index, instruction, taken, next_index):
+        """branch_resolved hook'u: sonucu tüm tahmincilere bildirir"""
+        text = instruction.split('#')[0].strip()
+        for predictor in self.branch_predictors:
+            predictor.record(index * self.WORD_SIZE, taken, text)
+
+#Komut işleme
+    def write_register(self, index, value):
+        """Değeri 32 bite sararak yazar; $zero'a yazmalar yok sayılır"""
+        if index:
+            value = wrap32(value)
+            if self.fingerprint is not None:
+                self.fingerprint.write_register(index, self.registers[index], value)
+            self.registers[index] = value
+
+    def fetch_instruction(self):
+        if self.pc // 4 < len(self.instruction_memory):
+            instruction = self.instruction_memory[self.pc // 4]
+            self.log.verbose(f"Fetch: PC = 0x{self.pc:08x}, Instruction = {instruction}")
+            return instruction
+        return None
+
+    def decode_instruction(self, instruction):
+        parts = instruction.split()
+        op = parts[0].lower()
+        self.log.verbose(f"Decode: Operation = {op}")
+        return parts
+
+    def execute_instruction(self, instruction):
+        """Komutları yürütür"""
+        # Yorumları kaldır
+        instruction = instruction.split('#')[0].strip()
+        
+        # Mevcut durumu kaydet
+        if self.trace_enabled:
+            index = self.current_instruction
+            old_reg_values = self.registers[:]
+            old_mem_values = self.data_memory.copy()
+        
+        # Parametreleri temizle
+        clean_params, op = self.clean_instruction_params(instruction)
+        
+        try:
+            if op == "addi":
+                rt, rs, imm = clean_params
+                rt_idx = self.register_map[rt]
+                rs_idx = self.register_map[rs]
+                self.write_register(rt_idx, self.registers[rs_idx] + int(imm))
+                self.log.verbose(f"{rt} = {self.registers[rt_idx]}")
+            
+            elif op == "add":
+                rd, rs, rt = clean_params
+                rd_idx = self.register_map[rd]
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                # 32-bit taşma write_register içinde sarılır
+                self.write_register(rd_idx, self.registers[rs_idx] + self.registers[rt_idx])
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "sub":
+                rd, rs, rt = clean_params
+                rd_idx = self.register_map[rd]
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                self.write_register(rd_idx, self.registers[rs_idx] - self.registers[rt_idx])
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "and":
+                rd, rs, rt = clean_params
+                rd_idx = self.register_map[rd]
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                self.write_register(rd_idx, self.registers[rs_idx] & self.registers[rt_idx])
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "or":
+                rd, rs, rt = clean_params
+                rd_idx = self.register_map[rd]
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                self.write_register(rd_idx, self.registers[rs_idx] | self.registers[rt_idx])
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "slt":
+                rd, rs, rt = clean_params
+                rd_idx = self.register_map[rd]
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                self.write_register(rd_idx, int(self.registers[rs_idx] < self.registers[rt_idx]))
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "sll":
+                rd, rt, shamt_or_reg = clean_params
+                rd_idx = self.register_map[rd]
+                rt_idx = self.register_map[rt]
+                try:
+                    # Eğer üçüncü parametre bir sayı (immediate) ise doğrudan kullanılır
+                    shamt = int(shamt_or_reg)
+                except ValueError:
+                    # Eğer üçüncü parametre bir register ise onun değerini kullan
+                    shamt = self.registers[self.register_map[shamt_or_reg]]
+                # Donanımdaki gibi kaydırma miktarının yalnızca alt 5 biti kullanılır
+                self.write_register(rd_idx, self.registers[rt_idx] << (shamt & 0x1F))
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+                        
+            elif op == "srl":
+                rd, rt, shamt_or_reg = clean_params
+                rd_idx = self.register_map[rd]
+                rt_idx = self.register_map[rt]
+                try:
+                    # Eğer üçüncü parametre bir sayı (immediate) ise doğrudan kullanılır
+                    shamt = int(shamt_or_reg)
+                except ValueError:
+                    # Eğer üçüncü parametre bir register ise onun değerini kullan
+                    shamt = self.registers[self.register_map[shamt_or_reg]]
+                # Mantıksal kaydırma: soldan sıfır girer
+                self.write_register(rd_idx, (self.registers[rt_idx] & 0xFFFFFFFF) >> (shamt & 0x1F))
+                self.log.verbose(f"{rd} = {self.registers[rd_idx]}")
+            
+            elif op == "beq":
+                rs, rt, label = clean_params
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                if self.registers[rs_idx] == self.registers[rt_idx]:
+                    if label in self.labels:
+                        self.current_instruction = self.labels[label]
+                    else:
+                        raise Exception(f"Label not found: {label}")
+                else:
+                    # Eğer branch alınmazsa, bir sonraki komuta geç
+                    self.current_instruction += 1
+                self.log.verbose(f"beq evaluated to {'taken' if self.registers[rs_idx] == self.registers[rt_idx] else 'not taken'}")
+            
+            elif op == "bne":
+                rs, rt, label = clean_params
+                rs_idx = self.register_map[rs]
+                rt_idx = self.register_map[rt]
+                if self.registers[rs_idx] != self.registers[rt_idx]:
+                    if label in self.labels:
+                        self.current_instruction = self.labels[label]
+                    else:
+                        raise Exception(f"Label not found: {label}")
+                else:
+                    # Eğer branch alınmazsa, bir sonraki komuta geç
+                    self.current_instruction += 1
+                self.log.verbose(f"bne evaluated to {'taken' if self.registers[rs_idx] != self.registers[rt_idx] else 'not taken'}")
+            
+            elif op == "j":
+                target = clean_params[0]
+                self.current_instruction = self.labels[target]
+                self.log.verbose(f"Jump to {target}")
+            
+            elif op == "jal":
+                target = clean_params[0]
+                self.write_register(self.register_map['$ra'], self.current_instruction + 1)
+                self.current_instruction = self.labels[target]
+                self.log.verbose(f"Jump and link to {target}")
+            
+            elif op == "jr":
+                rs = clean_params[0]
+                rs_idx = self.register_map[rs]
+                self.current_instruction = self.registers[rs_idx]
+                self.log.verbose(f"Jump to register {rs}")
+            
+            elif op == "lw":
+                rt = clean_params[0]
+                offset_base = clean_params[1]
+                offset, base = offset_base.split('(')
+                base = base.strip(')')
+                rt_idx = self.register_map[rt]
+                base_idx = self.register_map[base]
+                address = (self.registers[base_idx] + int(offset)) // self.WORD_SIZE
+                if 0 <= address < (self.MEMORY_SIZE // self.WORD_SIZE):
+                    self.write_register(rt_idx, self.data_memory[address])
+                    self.log.verbose(f"{rt} = {self.registers[rt_idx]}")
+            
+            elif op == "sw":
+                rt = clean_params[0]
+                offset_base = clean_params[1]
+                offset, base = offset_base.split('(')
+                base = base.strip(')')
+                rt_idx = self.register_map[rt]
+                base_idx = self.register_map[base]
+                address = (self.registers[base_idx] + int(offset)) // self.WORD_SIZE
+                if 0 <= address < (self.MEMORY_SIZE // self.WORD_SIZE):
+                    if self.fingerprint is not None:
+                        self.fingerprint.write_memory(address, self.data_memory[address], self.registers[rt_idx])
+                    self.data_memory[address] = self.registers[rt_idx]
+                    self.log.verbose(f"Memory[{address*4}] = {self.registers[rt_idx]}")
+
+            # Trace'e ekle
+            if self.trace_enabled:
+                machine_code = None
+                if self.trace_text or self.trace_writer is not None:
+                    machine_code = self.generate_machine_code(instruction, index)
+                self.add_to_trace(instruction, machine_code, old_reg_values, old_mem_values, index)
+            else:
+                self.instruction_count += 1
+
+        except Exception as e:
+            self.log.error(f"Error executing: {instruction}")
+            self.log.error(f"Error: {str(e)}")
+            raise
+
+    def clean_instruction_params(self, instruction):
+        """Temiz parametre listesi döndürür"""
+        # Önce yorumları kaldır
+        instruction = instruction.split('#')[0].strip()
+        
+        parts = instruction.split(None, 1)  # İlk boşluktan böl (opcode ve parametreleri ayır)
+        if len(parts) < 2:
+            return [], ""
+        
+        op = parts[0].lower()
+        params_str = parts[1]
+        
+        # Tüm boşlukları kaldır ve virgülle ayrılmış parametreleri al
+        clean_params = [p.strip() for p in params_str.replace(" ", "").split(",")]
+        return clean_params, op
+
+    def clean_params(self, params):
+        # Önce tüm virgülleri boşluğa çevir
+        params = params.replace(',', ' ')
+        # Birden fazla boşluğu tek boşluğa çevir
+        params = ' '.join(params.split())
+        # Boşluklarla ayır ve temizle
+        return [p.strip() for p in params.split()]
+
+#Makine kodu üretimi
+    def generate_machine_code(self, instruction, index=None):
+        """MIPS komutları için binary machine code üretimi; kodlanamayan komut
+        loglanır ve sıfır kelime döner (trace ve tablo gösterimi için)"""
+        try:
+            return self.encode_instruction(instruction, index)
+        except ValueError as e:
+            self.log.error(f"Error in machine code generation: {str(e)}")
+            return "00000000000000000000000000000000"
+
+    def encode_instruction(self, instruction, index=None):
+        """Komutun 32 bitlik machine code'u; kodlanamazsa ValueError fırlatır.
+
+        Çıktı yalnızca komut metnine, label tablosuna ve komutun indeksine
+        (branch offset'leri; verilmezse current_instruction) bağlıdır.
+        """
+        try:
+            # Komut ve operandlar assembler'ın tokenizer'ıyla ayrılır; "addi $t0,$zero,3"
+            # gibi yalnızca virgülle ayrılmış operandlar da assemble edildiği gibi kodlanır
+            statement = tokenize_line(instruction)
+            if statement is None or not statement.op:
+                return "00000000000000000000000000000000"
+            op = statement.op
+            params = statement.operands
+
+            # R-Format Instructions
+            if op == "add":  # 000000 rs rt rd 00000 100000
+                rd = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                rt = self.register_map[params[2]] & 0x1F
+                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100000"
+
+            elif op == "sub":  # 000000 rs rt rd 00000 100010
+                rd = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                rt = self.register_map[params[2]] & 0x1F
+                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100010"
+
+            elif op == "and":  # 000000 rs rt rd 00000 100100
+                rd = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                rt = self.register_map[params[2]] & 0x1F
+                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100100"
+
+            elif op == "or":   # 000000 rs rt rd 00000 100101
+                rd = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                rt = self.register_map[params[2]] & 0x1F
+                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100101"
+
+            elif op == "slt":  # 000000 rs rt rd 00000 101010
+                rd = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                rt = self.register_map[params[2]] & 0x1F
+                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}101010"
+
+            elif op == "sll":  # 000000 00000 rt rd shamt 000000
+                rd = self.register_map[params[0]] & 0x1F
+                rt = self.register_map[params[1]] & 0x1F
+                if params[2] in self.register_map:
+                    # Register'lı kaydırma sllv olarak kodlanır: 000000 rs rt rd 00000 000100
+                    rs = self.register_map[params[2]] & 0x1F
+                    return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}000100"
+                shamt = int(params[2]) & 0x1F
+                return f"{0:06b}{0:05b}{rt:05b}{rd:05b}{shamt:05b}000000"
+
+
+            elif op == "srl":  # 000000 00000 rt rd shamt 000010
+                rd = self.register_map[params[0]] & 0x1F
+                rt = self.register_map[params[1]] & 0x1F
+                if params[2] in self.register_map:
+                    # srlv: 000000 rs rt rd 00000 000110
+                    rs = self.register_map[params[2]] & 0x1F
+                    return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}000110"
+                shamt = int(params[2]) & 0x1F
+                return f"{0:06b}{0:05b}{rt:05b}{rd:05b}{shamt:05b}000010"
+
+            # I-Format Instructions
+            elif op == "addi":  # 001000 rs rt immediate
+                rt = self.register_map[params[0]] & 0x1F
+                rs = self.register_map[params[1]] & 0x1F
+                imm = int(params[2]) & 0xFFFF
+                return f"001000{rs:05b}{rt:05b}{imm:016b}"
+
+            elif op == "lw":    # 100011 rs rt offset
+                rt = self.register_map[params[0]] & 0x1F
+                offset_base = params[1]
+                offset, base = offset_base.split('(')
+                base = base.rstrip(')')
+                rs = self.register_map[base] & 0x1F
+                offset = int(offset) & 0xFFFF
+                return f"100011{rs:05b}{rt:05b}{offset:016b}"
+
+            elif op == "sw":    # 101011 rs rt offset
+                rt = self.register_map[params[0]] & 0x1F
+                offset_base = params[1]
+                offset, base = offset_base.split('(')
+                base = base.rstrip(')')
+                rs = self.register_map[base] & 0x1F
+                offset = int(offset) & 0xFFFF
+                return f"101011{rs:05b}{rt:05b}{offset:016b}"
+
+            elif op == "beq":   # 000100 rs rt offset
+                rs = self.register_map[params[0]] & 0x1F
+                rt = self.register_map[params[1]] & 0x1F
+                if index is None:
+                    index = self.current_instruction
+                offset = (self.labels.get(params[2], 0) - index - 1) & 0xFFFF
+                return f"000100{rs:05b}{rt:05b}{offset:016b}"
+
+            elif op == "bne":   # 000101 rs rt offset
+                rs = self.register_map[params[0]] & 0x1F
+                rt = self.register_map[params[1]] & 0x1F
+                if index is None:
+                    index = self.current_instruction
+                offset = (self.labels.get(params[2], 0) - index - 1) & 0xFFFF
+                return f"000101{rs:05b}{rt:05b}{offset:016b}"
+
+            # J-Format Instructions
+            elif op == "j":     # 000010 target
+                target = params[0]
+                if target in self.labels:
+                    target_address = self.labels[target] & 0x3FFFFFF
+                    return f"000010{target_address:026b}"
+                else:
+                    self.log.info(f"Warning: Label '{target}' not found")
+                    return "00001000000000000000000000000000"
+
+            elif op == "jal":   # 000011 target
+                target = params[0]
+                if target in self.labels:
+                    target_address = self.labels[target] & 0x3FFFFFF
+                    return f"000011{target_address:026b}"
+                else:
+                    self.log.info(f"Warning: Label '{target}' not found")
+                    return "00001100000000000000000000000000"
+
+            elif op == "jr":    # 000000 rs 00000 00000 00000 001000
+                rs = self.register_map[params[0]] & 0x1F
+                return f"000000{rs:05b}000000000000000001000"
+
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Cannot encode '{instruction}': {e}") from e
+        raise ValueError(f"Cannot encode '{instruction}': unknown opcode '{op}'")
+
+#Durum takibi
+    def get_register_changes(self, old_values):
+        changes = []
+        for i in range(len(self.registers)):
+            if self.registers[i] != old_values[i]:
+                reg_name = f"${next((k[1:] for k, v in self.register_names.items() if v == i), f'r{i}')}"
+                changes.append(f"{reg_name}: {old_values[i]} -> {self.registers[i]}")
+        return ", ".join(changes) if changes else "No changes"
+
+    def get_memory_changes(self, old_values):
+        changes = []
+        for i in range(len(self.data_memory)):
+            if self.data_memory[i] != old_values[i]:
+                changes.append(f"M[0x{i*4:03x}]: {old_values[i]} -> {self.data_memory[i]}")
+        return ", ".join(changes) if changes else "No changes"
+
+#Trace ekleme
+    def open_trace_file(self, path, compress=False):
+        """Yüklü programın trace'ini ikili dosyaya akıtmaya başlar"""
+        self.close_trace_file()
+        self.trace_writer = TraceWriter(
+            path, self.program_instructions, self.NUM_REGISTERS, self.WORD_SIZE, compress,
+            registers=self.registers, memory=self.data_memory,
+        )
+        return self.trace_writer
+
+    def close_trace_file(self):
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+            self.trace_writer = None
+
+    def add_to_trace(self, instruction, machine_code, old_reg_values, old_mem_values, index=None):
+        # Instruction count'u tutmak için yeni bir sınıf değişkeni
+        if not hasattr(self, 'instruction_count'):
+            self.instruction_count = 0
+        self.instruction_count += 1
+
+        # Komutun byte adresi
+        pc = self.pc if index is None else index * self.WORD_SIZE
+        delta = self.trace_delta(old_reg_values, old_mem_values)
+        if not self.trace_index.seeded:
+            # İlk kaydın eski değerleri trace başlangıcındaki durumdur
+            self.trace_index.seed(old_reg_values, old_mem_values)
+        self.trace_index.add(self.instruction_count, **delta)
+        if self.trace_writer is not None:
+            try:
+                code = int(machine_code, 2)
+            except ValueError:
+                code = 0
+            self.trace_writer.write(self.instruction_count, pc, code, **delta)
+            return
+        if not self.trace_text:
+            # Yalnızca trace_index sorguları için kayıt; metin biçimlendirilmez
+            return
+
+        trace_entry = (
+            f"Step {self.instruction_count}\n"
+            f"PC: 0x{pc:08x}\n"
+            f"Instruction: {instruction}\n"
+            f"Machine Code: {machine_code}\n"
+            f"Register Changes: {self.get_register_changes(old_reg_values)}\n"
+            f"Memory Changes: {self.get_memory_changes(old_mem_values)}\n"
+            f"{'-'*50}\n"
+        )
+        self.execution_trace.append(trace_entry)
+
+    def trace_delta(self, old_reg_values, old_mem_values):
+        """Komutun değiştirdiği register ve bellek kelimesini döndürür"""
+        delta = {}
+        # Bir komut en fazla bir register ve bir bellek kelimesi değiştirir
+        if self.registers != old_reg_values:
+            register = next(i for i, (old, new) in enumerate(zip(old_reg_values, self.registers))
+                            if old != new)
+            delta.update(register=register, old_register=old_reg_values[register],
+                         new_register=self.registers[register])
+        if self.data_memory != old_mem_values:
+            word = next(i for i, (old, new) in enumerate(zip(old_mem_values, self.data_memory))
+                        if old != new)
+            delta.update(word=word, old_word=old_mem_values[word],
+                         new_word=self.data_memory[word])
+        return delta
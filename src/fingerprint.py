@@ -0,0 +1,102 @@
+"""Mimari durumun (register'lar ve data memory) artımlı parmak izi.
+
+Parmak izi, sıfır olmayan her konum için (konum, değer) çiftinin 64-bit
+karışımının XOR'udur (Zobrist hashing). XOR kendi tersi olduğundan bir
+yazma eski katkıyı çıkarıp yenisini ekleyerek O(1)'de işlenir; iki
+durumun eşitliği, bir regresyonun altın çıktısı ya da tekrar eden durum
+tek bir tamsayı karşılaştırmasına iner. Sıfır değerlerin katkısı sıfır
+olduğundan boş durumun parmak izi 0'dır ve değerler sürümler/süreçler
+arasında sabittir (Python'un hash()'i kullanılmaz).
+"""
+
+MASK = 0xFFFFFFFFFFFFFFFF
+# Bellek kelimeleri register'larla çakışmasın diye bu konumdan başlar
+MEMORY_BASE = 1 << 20
+
+
+def mix64(x):
+    """splitmix64 karıştırma fonksiyonu"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+    return x ^ (x >> 31)
+
+
+def contribution(location, value):
+    """Bir konumdaki değerin parmak izine katkısı; -1 ve 0xFFFFFFFF aynı kelimedir"""
+    value &= 0xFFFFFFFF
+    if not value:
+        return 0
+    return mix64(location << 32 | value)
+
+
+def register_fingerprint(registers):
+    fingerprint = 0
+    for index, value in enumerate(registers):
+        if value:
+            fingerprint ^= contribution(index, value)
+    return fingerprint
+
+
+def memory_fingerprint(memory):
+    fingerprint = 0
+    for index, value in enumerate(memory):
+        if value:
+            fingerprint ^= contribution(MEMORY_BASE + index, value)
+    return fingerprint
+
+
+def state_fingerprint(registers, memory):
+    """Durumun parmak izini baştan hesaplar"""
+    return register_fingerprint(registers) ^ memory_fingerprint(memory)
+
+
+def system_fingerprint(register_fingerprints, memory):
+    """Çekirdeklerin register parmak izleri ve ortak belleğin parmak izinden sistemin
+    parmak izi; çekirdek sırası önemlidir"""
+    fingerprint = memory
+    for number, registers in enumerate(register_fingerprints):
+        fingerprint ^= mix64(registers ^ mix64(number + 1))
+    return fingerprint
+
+
+class MemoryFingerprint:
+    """Data memory'nin parmak izi; çok çekirdekte tüm çekirdekler aynı nesneyi günceller"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, memory=()):
+        self.value = memory_fingerprint(memory)
+
+    def recompute(self, memory):
+        self.value = memory_fingerprint(memory)
+
+    def write(self, index, old, new):
+        if old != new:
+            location = MEMORY_BASE + index
+            self.value ^= contribution(location, old) ^ contribution(location, new)
+
+
+class StateFingerprint:
+    """Yazmalarla birlikte güncellenen parmak izi: register'lar ve (paylaşılabilen) bellek"""
+
+    __slots__ = ("registers", "memory")
+
+    def __init__(self, registers=(), memory=(), shared=None):
+        self.registers = register_fingerprint(registers)
+        self.memory = MemoryFingerprint(memory) if shared is None else shared
+
+    @property
+    def value(self):
+        return self.registers ^ self.memory.value
+
+    def recompute(self, registers, memory):
+        self.registers = register_fingerprint(registers)
+        self.memory.recompute(memory)
+
+    def write_register(self, index, old, new):
+        if old != new:
+            self.registers ^= contribution(index, old) ^ contribution(index, new)
+
+    def write_memory(self, index, old, new):
+        self.memory.write(index, old, new)
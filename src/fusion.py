@@ -0,0 +1,230 @@
+CONTROL_OPS = ("beq", "bne", "j", "jal", "jr")
+
+
+class CompileError(Exception):
+    pass
+
+
+class CompiledProgram:
+    """Önceden decode edilmiş (ve isteğe bağlı birleştirilmiş) komut tablosu.
+
+    handlers[pc], (fonksiyon, komut sayısı) ikilisidir. Fonksiyon
+    register dosyası ve data memory listesi ile çağrılır ve bir sonraki
+    pc'yi döndürür. Birleştirilmiş (fused) bir handler birden fazla
+    komutu tek çağrıda yürütür; ortadaki komutların kendi tekil
+    handler'ları tabloda durmaya devam eder, böylece ortaya atlayan
+    branch'ler birleştirilmemiş yürütmeyle aynı sonucu verir.
+    """
+
+    def __init__(self, handlers, fused, singles=None):
+        self.handlers = handlers
+        self.fused = fused  # pc -> birleştirilen komut sayısı
+        self.singles = singles if singles is not None else handlers  # Tekil handler'lar
+
+    @property
+    def fused_instructions(self):
+        return sum(self.fused.values())
+
+    def unfused(self):
+        """Aynı derlemenin birleştirilmemiş (yalnızca tekil handler'lı) hali"""
+        return CompiledProgram(self.singles, {})
+
+
+def _parse(instruction):
+    """clean_instruction_params ile aynı ayrıştırma"""
+    instruction = instruction.split('#')[0].strip()
+    parts = instruction.split(None, 1)
+    if len(parts) < 2:
+        return [], ""
+    return [p.strip() for p in parts[1].replace(" ", "").split(",")], parts[0].lower()
+
+
+def _write(dest, expression, wrap=True):
+    """dest register'ına yazan satır; $zero'a yazma atılır, değer 32 bite sarılır"""
+    if dest == 0:
+        return []
+    if wrap:
+        expression = f"((({expression}) + 0x80000000) & 0xFFFFFFFF) - 0x80000000"
+    return [f"r[{dest}] = {expression}"]
+
+
+def _snippet(instruction, pc, labels, register_map, word_size, memory_words):
+    """Komutu Python kaynak satırlarına çevirir.
+
+    (satırlar, sonlandırıcı mı, birleştirilebilir mi) döndürür. Sonlandırıcı
+    komutların son satırı bir sonraki pc'yi döndüren return'dür.
+    """
+    params, op = _parse(instruction)
+    if not op and instruction.split()[0].lower() in CONTROL_OPS:
+        # Parametresiz branch/jump referans döngüde ilerlemez, derlenmez
+        raise CompileError(f"Cannot compile '{instruction}': missing operands")
+    reg = register_map.__getitem__
+    try:
+        if op == "addi":
+            rt, rs, imm = params
+            return _write(reg(rt), f"r[{reg(rs)}] + {int(imm)}"), False, True
+        if op in ("add", "sub"):
+            rd, rs, rt = params
+            symbol = "+" if op == "add" else "-"
+            return _write(reg(rd), f"r[{reg(rs)}] {symbol} r[{reg(rt)}]"), False, True
+        if op in ("and", "or"):
+            rd, rs, rt = params
+            symbol = "&" if op == "and" else "|"
+            return _write(reg(rd), f"r[{reg(rs)}] {symbol} r[{reg(rt)}]", wrap=False), False, True
+        if op == "slt":
+            rd, rs, rt = params
+            return _write(reg(rd), f"int(r[{reg(rs)}] < r[{reg(rt)}])", wrap=False), False, True
+        if op in ("sll", "srl"):
+            rd, rt, shamt = params
+            try:
+                amount = str(int(shamt) & 0x1F)
+            except ValueError:
+                amount = f"(r[{reg(shamt)}] & 31)"
+            if op == "sll":
+                return _write(reg(rd), f"r[{reg(rt)}] << {amount}"), False, True
+            if amount == "0":
+                return _write(reg(rd), f"r[{reg(rt)}]", wrap=False), False, True
+            # Sabit, sıfırdan büyük mantıksal kaydırmanın sonucu zaten 31 bite sığar
+            return _write(reg(rd), f"(r[{reg(rt)}] & 0xFFFFFFFF) >> {amount}",
+                          wrap=not amount.isdigit()), False, True
+        if op in ("lw", "sw"):
+            rt = params[0]
+            offset, base = params[1].split('(')
+            base = base.strip(')')
+            lines = [f"a = (r[{reg(base)}] + {int(offset)}) // {word_size}"]
+            if op == "lw":
+                if reg(rt) == 0:
+                    return [], False, True
+                lines.append(f"if 0 <= a < {memory_words}: " + _write(reg(rt), "m[a]")[0])
+            else:
+                lines.append(f"if 0 <= a < {memory_words}: m[a] = r[{reg(rt)}]")
+            return lines, False, True
+        if op in ("beq", "bne"):
+            rs, rt, label = params
+            compare = "==" if op == "beq" else "!="
+            condition = f"r[{reg(rs)}] {compare} r[{reg(rt)}]"
+            if label not in labels:
+                return [
+                    f"if {condition}: raise Exception({('Label not found: ' + label)!r})",
+                    f"return {pc + 1}",
+                ], True, False
+            return [f"return {labels[label]} if {condition} else {pc + 1}"], True, True
+        if op in ("j", "jal"):
+            target = params[0]
+            lines = [f"r[{register_map['$ra']}] = {pc + 1}"] if op == "jal" else []
+            if target not in labels:
+                return lines + [f"raise KeyError({target!r})"], True, False
+            return lines + [f"return {labels[target]}"], True, True
+        if op == "jr":
+            return [f"return r[{reg(params[0])}]"], True, True
+    except (KeyError, ValueError, IndexError) as e:
+        raise CompileError(f"Cannot compile '{instruction}': {e}")
+    # Desteklenmeyen komutlar referans yorumlayıcıda da etkisizdir
+    return [], False, True
+
+
+def plan_fusion(ops, fusable, boundaries=(), loops=(), profile=None, max_length=3, min_count=2):
+    """Birleştirilecek komut dizilerini seçer, {başlangıç pc: uzunluk} döndürür.
+
+    Aday diziler ardışık 2-3 komuttur; yalnızca son komut branch/jump
+    olabilir ve breakpoint gibi gözlem noktaları (boundaries) dizinin
+    ortasına düşemez. Profil verisi (pc -> yürütme sayısı) verilirse en
+    az min_count kez yürütülen diziler, verilmezse bir döngü gövdesindeki
+    (loops, (başlangıç, son) pc aralıkları) ya da programda en az
+    min_count kez tekrar eden op dizileri seçilir.
+    """
+    count = len(ops)
+    windows = {}
+    for pc in range(count):
+        length = 1
+        while (length < max_length and pc + length < count
+               and ops[pc + length - 1] not in CONTROL_OPS
+               and fusable[pc + length - 1] and fusable[pc + length]
+               and pc + length not in boundaries):
+            length += 1
+        if length >= 2:
+            windows[pc] = length
+
+    if profile is None:
+        pattern_counts = {}
+        for pc, length in windows.items():
+            pattern = tuple(ops[pc:pc + length])
+            pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
+
+        def hot(pc, length):
+            if pattern_counts[tuple(ops[pc:pc + length])] >= min_count:
+                return True
+            return any(start <= pc <= end for start, end in loops)
+    else:
+        def hot(pc, length):
+            return profile.get(pc, 0) >= min_count
+
+    plan = {}
+    pc = 0
+    while pc < count:
+        length = windows.get(pc)
+        if length and hot(pc, length):
+            plan[pc] = length
+            pc += length
+        else:
+            pc += 1
+    return plan
+
+
+def _function_source(name, pcs, snippets):
+    """Verilen pc'lerdeki komutları tek bir fonksiyon gövdesinde birleştirir"""
+    lines = [f"def {name}(r, m):"]
+    for pc in pcs:
+        lines.extend("    " + line for line in snippets[pc][0])
+    last = pcs[-1]
+    if not snippets[last][1]:
+        lines.append(f"    return {last + 1}")
+    return lines
+
+
+def compile_program(instructions, labels, register_map, word_size=4, memory_words=128,
+                    fuse=True, boundaries=(), profile=None, max_length=3, min_count=2,
+                    loops=None):
+    """Komutları Python fonksiyonlarına derler ve sık dizileri birleştirir.
+
+    loops, döngü gövdelerinin (ilk, son) pc aralıklarıdır (ör.
+    ControlFlowGraph.loop_ranges()); verilmezse geriye dönük branch/jump'lardan
+    çıkarılır. Derlenemeyen bir komut varsa CompileError fırlatılır; çağıran
+    taraf bu durumda referans yorumlayıcıya (execute_instruction) döner.
+    """
+    snippets = []
+    ops = []
+    fusable = []
+    backward = []
+    for pc, instruction in enumerate(instructions):
+        lines, terminator, can_fuse = _snippet(
+            instruction, pc, labels, register_map, word_size, memory_words
+        )
+        params, op = _parse(instruction)
+        snippets.append((lines, terminator))
+        ops.append(op)
+        fusable.append(can_fuse)
+        # Geriye dönük branch/jump'lar bir döngü gövdesini kapsar
+        if loops is None and op in ("beq", "bne", "j") and params and labels.get(params[-1], pc + 1) <= pc:
+            backward.append((labels[params[-1]], pc))
+    if loops is None:
+        loops = backward
+
+    fused = {}
+    if fuse:
+        fused = plan_fusion(ops, fusable, set(boundaries), loops, profile, max_length, min_count)
+
+    source = []
+    for pc in range(len(instructions)):
+        source.extend(_function_source(f"h{pc}", [pc], snippets))
+    for pc, length in fused.items():
+        source.extend(_function_source(f"f{pc}", list(range(pc, pc + length)), snippets))
+
+    namespace = {}
+    exec(compile("\n".join(source), "<mips-compiled>", "exec"), namespace)
+
+    singles = [(namespace[f"h{pc}"], 1) for pc in range(len(instructions))]
+    handlers = list(singles)
+    for pc, length in fused.items():
+        handlers[pc] = (namespace[f"f{pc}"], length)
+    return CompiledProgram(handlers, fused, singles)
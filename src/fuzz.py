@@ -0,0 +1,286 @@
+"""Yürütme motorları için diferansiyel fuzzing.
+
+Rastgele fakat geçerli ve her zaman sonlanan programlar üretilir, referans
+yorumlayıcı (her komut için execute_instruction çağıran adım bütçeli
+döngü) ve alternatif motorlarla çalıştırılır ve son durumlar
+karşılaştırılır. Programlar tohum (seed) ile belirlenir; bir
+farklılık aynı tohumla yeniden üretilebilir ve küçültülerek raporlanır.
+"""
+import random
+import time
+from multiprocessing import Pool
+
+try:
+    from .cpu import MIPSCPU
+    from .fusion import CompileError, compile_program
+    from .hooks import POST_EXECUTE
+except ImportError:
+    from cpu import MIPSCPU
+    from fusion import CompileError, compile_program
+    from hooks import POST_EXECUTE
+
+
+# Gövdede serbestçe yazılan register'lar; $s6/$s7 döngü sayaçları, $ra jal için ayrılmıştır
+DATA_REGISTERS = ("$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t6", "$t7",
+                  "$s0", "$s1", "$s2", "$s3")
+LOOP_COUNTERS = ("$s6", "$s7")
+SOURCE_REGISTERS = DATA_REGISTERS + ("$zero",)
+ALU_OPS = ("add", "sub", "and", "or", "slt")
+STATE_FIELDS = ("registers", "data_memory", "current_instruction", "instruction_count", "error")
+
+
+class ProgramGenerator:
+    """Desteklenen ISA üzerinde sonlanması garanti programlar üretir.
+
+    Döngüler yalnızca gövdede yazılmayan bir sayaç register'ı ile kurulur,
+    branch ve jump'lar döngü dışında hep ileriye gider, alt programlar
+    jal/jr ile çağrılır ve bellek erişimleri çoğunlukla 512 baytlık data
+    memory içinde kalır.
+    """
+
+    def __init__(self, seed, length=40, memory_bytes=512):
+        self.random = random.Random(seed)
+        self.length = length
+        self.memory_bytes = memory_bytes
+        self.labels = 0
+
+    def label(self):
+        self.labels += 1
+        return f"L{self.labels}"
+
+    def register(self):
+        # Ara sıra $zero'ya yazılır; yazma her motorda yok sayılmalı
+        if self.random.random() < 0.03:
+            return "$zero"
+        return self.random.choice(DATA_REGISTERS)
+
+    def source(self):
+        return self.random.choice(SOURCE_REGISTERS)
+
+    def straight(self):
+        """Kontrol akışı değiştirmeyen tek bir komut"""
+        rnd = self.random
+        kind = rnd.random()
+        if kind < 0.35:
+            return f"addi {self.register()}, {self.source()}, {rnd.randint(-100, 100)}"
+        if kind < 0.6:
+            return f"{rnd.choice(ALU_OPS)} {self.register()}, {self.source()}, {self.source()}"
+        if kind < 0.7:
+            # Büyük kaydırmalar 32-bit sarmayı ve mantıksal srl'yi sınar
+            amount = self.source() if rnd.random() < 0.2 else rnd.randint(0, 31)
+            return f"{rnd.choice(('sll', 'srl'))} {self.register()}, {self.source()}, {amount}"
+        offset = rnd.randrange(0, self.memory_bytes, 4)
+        base = "$zero"
+        if rnd.random() < 0.1:
+            # Aralık dışı erişimler her iki motorda da etkisiz olmalı
+            offset = rnd.choice((self.memory_bytes, -4, self.memory_bytes + 64))
+        return f"{rnd.choice(('lw', 'sw'))} {self.register()}, {offset}({base})"
+
+    def block(self, size, depth=0):
+        lines = []
+        while len(lines) < size:
+            kind = self.random.random()
+            if kind < 0.12 and depth < len(LOOP_COUNTERS):
+                lines.extend(self.loop(depth))
+            elif kind < 0.2:
+                # İleriye dönük koşullu atlama
+                target = self.label()
+                op = self.random.choice(("beq", "bne"))
+                lines.append(f"{op} {self.source()}, {self.source()}, {target}")
+                lines.extend(self.straight() for _ in range(self.random.randint(1, 3)))
+                lines.append(f"{target}:")
+            elif kind < 0.24:
+                target = self.label()
+                lines.append(f"j {target}")
+                lines.append(self.straight())
+                lines.append(f"{target}:")
+            else:
+                lines.append(self.straight())
+        return lines
+
+    def loop(self, depth):
+        counter = LOOP_COUNTERS[depth]
+        start = self.label()
+        return ([f"addi {counter}, $zero, {self.random.randint(1, 6)}", f"{start}:"]
+                + self.block(self.random.randint(2, 6), depth + 1)
+                + [f"addi {counter}, {counter}, -1", f"bne {counter}, $zero, {start}"])
+
+    def program(self):
+        functions = [self.label() for _ in range(self.random.randint(0, 2))]
+        lines = [f"addi {self.register()}, $zero, {self.random.randint(-50, 50)}" for _ in range(3)]
+        body = self.block(self.length)
+        for function in functions:
+            body.insert(self.random.randint(0, len(body)), f"jal {function}")
+        lines.extend(body)
+        end = self.label()
+        lines.append(f"j {end}")
+        for function in functions:
+            lines.append(f"{function}:")
+            lines.extend(self.straight() for _ in range(self.random.randint(1, 4)))
+            lines.append("jr $ra")
+        lines.append(f"{end}:")
+        return "\n".join(lines)
+
+
+def generate_program(seed, length=40):
+    return ProgramGenerator(seed, length).program()
+
+
+# Motorlar: (komutlar, label'lar), derlenmiş program -> son durum
+def _new_cpu(program):
+    """Programı machine code üretmeden yükler"""
+    cpu = MIPSCPU()
+    cpu.trace_enabled = False
+    cpu.program_instructions, cpu.labels = program
+    return cpu
+
+
+def _state(cpu):
+    return {
+        "registers": list(cpu.registers),
+        "data_memory": list(cpu.data_memory),
+        "current_instruction": cpu.current_instruction,
+        "instruction_count": cpu.instruction_count,
+        "error": cpu.last_error is not None,
+    }
+
+
+def run_reference(program, max_steps):
+    """Referans yorumlayıcı; max_steps içinde bitmezse None döndürür"""
+    cpu = _new_cpu(program)
+    if cpu.run_limited(cpu.program_instructions, max_steps) is not None:
+        return None
+    return _state(cpu)
+
+
+def run_fast(program, compiled):
+    cpu = _new_cpu(program)
+    cpu.run_fast(cpu.program_instructions)
+    return _state(cpu)
+
+
+def run_fused(program, compiled):
+    cpu = _new_cpu(program)
+    if compiled is None:
+        cpu.run_fast(cpu.program_instructions)
+    else:
+        cpu.run_compiled(compiled, cpu.program_instructions)
+    return _state(cpu)
+
+
+def run_compiled(program, compiled):
+    """Aynı derlemenin birleştirilmemiş handler'larıyla çalıştırır"""
+    return run_fused(program, compiled and compiled.unfused())
+
+
+def run_hooked(program, compiled):
+    cpu = _new_cpu(program)
+    cpu.hooks.register(POST_EXECUTE, lambda sim, index, instruction, next_index: None)
+    cpu.run()
+    return _state(cpu)
+
+
+ENGINES = {
+    "fast": run_fast,
+    "fused": run_fused,
+    "compiled": run_compiled,
+    "hooked": run_hooked,
+}
+
+
+def compare(source, engines, max_steps=200000):
+    """İlk farklılığı (motor, alan, referans, motor değeri) döndürür, yoksa None.
+
+    Referans yorumlayıcı max_steps içinde bitmeyen programlar için
+    karşılaştırma yapılmaz (küçültme sırasında sonsuz döngüye dönen
+    adaylar böyle elenir).
+    """
+    program = MIPSCPU.assemble(source)
+    expected = run_reference(program, max_steps)
+    if expected is None:
+        return None
+    # Derleme pahalıdır; fused ve compiled motorları aynı derlemeyi paylaşır
+    compiled = None
+    if "fused" in engines or "compiled" in engines:
+        cpu = _new_cpu(program)
+        try:
+            compiled = compile_program(program[0], program[1], cpu.register_map,
+                                       cpu.WORD_SIZE, len(cpu.data_memory))
+        except CompileError:
+            pass
+    for name in engines:
+        try:
+            actual = ENGINES[name](program, compiled)
+        except Exception as e:
+            return name, "exception", None, repr(e)
+        for field in STATE_FIELDS:
+            if actual[field] != expected[field]:
+                return name, field, expected[field], actual[field]
+    return None
+
+
+def minimize(source, engines):
+    """Farklılığı koruyarak kaynak satırlarını azaltır (delta debugging)"""
+    lines = source.splitlines()
+    engine = compare(source, engines)[0]
+    chunk = max(1, len(lines) // 2)
+    while chunk >= 1:
+        i = 0
+        removed = False
+        while i < len(lines):
+            candidate = lines[:i] + lines[i + chunk:]
+            if candidate and compare("\n".join(candidate), [engine]) is not None:
+                lines = candidate
+                removed = True
+            else:
+                i += chunk
+        if not removed:
+            chunk //= 2
+    return "\n".join(lines)
+
+
+def check_seed(task):
+    """Havuz işçisi: tohumdan program üretir ve motorları karşılaştırır"""
+    seed, length, engines = task
+    source = generate_program(seed, length)
+    divergence = compare(source, engines)
+    if divergence is None:
+        return seed, None
+    return seed, (source, divergence)
+
+
+def fuzz(count=1000, seed=0, workers=None, engines=None, length=40, chunksize=16):
+    """count program çalıştırır; özet ve (varsa) küçültülmüş ilk farklılığı döndürür"""
+    engines = list(engines or ENGINES)
+    tasks = [(seed + i, length, engines) for i in range(count)]
+    start = time.perf_counter()
+    first = None
+    checked = 0
+    with Pool(workers) as pool:
+        for task_seed, result in pool.imap(check_seed, tasks, chunksize):
+            checked += 1
+            if result is not None:
+                first = (task_seed, result)
+                pool.terminate()
+                break
+    elapsed = time.perf_counter() - start
+    report = {
+        "programs": checked,
+        "seconds": elapsed,
+        "programs_per_second": checked / elapsed if elapsed else 0.0,
+        "engines": engines,
+        "divergence": None,
+    }
+    if first is not None:
+        task_seed, (source, (engine, field, expected, actual)) = first
+        reduced = minimize(source, [engine])
+        engine, field, expected, actual = compare(reduced, [engine])
+        report["divergence"] = {
+            "seed": task_seed,
+            "engine": engine,
+            "field": field,
+            "reference": expected,
+            "actual": actual,
+            "program": reduced,
+        }
+    return report
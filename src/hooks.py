@@ -0,0 +1,59 @@
+PRE_FETCH = "pre_fetch"
+POST_EXECUTE = "post_execute"
+MEMORY_READ = "memory_read"
+MEMORY_WRITE = "memory_write"
+BRANCH_RESOLVED = "branch_resolved"
+
+HOOK_EVENTS = (PRE_FETCH, POST_EXECUTE, MEMORY_READ, MEMORY_WRITE, BRANCH_RESOLVED)
+
+
+class HookRegistry:
+    """Komut yürütmesini gözlemlemek için hook kaydı.
+
+    Callback imzaları (sim, MIPSCPU çekirdeğidir; index, komutun
+    instruction memory'deki sırası, address byte adresidir):
+
+        pre_fetch(sim, index)
+        post_execute(sim, index, instruction, next_index)
+        memory_read(sim, address, value)
+        memory_write(sim, address, old_value, new_value)
+        branch_resolved(sim, index, instruction, taken, next_index)
+
+    Maliyet: hiç hook kayıtlı değilken run döngüsü hook kontrolü
+    yapmayan ayrı bir döngüde (run_fast) çalışır, yani ek maliyet
+    sıfırdır. En az bir hook kayıtlıyken (run_hooked) her komut için
+    parametreler bir kez daha ayrıştırılır, lw/sw için adres önceden
+    hesaplanır ve her event için kayıtlı callback'ler sırayla çağrılır
+    (callback başına bir Python fonksiyon çağrısı ve callback'in kendi
+    maliyeti). Kayıtlı olmayan event'ler için yalnızca boş liste kontrolü
+    yapılır.
+    """
+
+    def __init__(self):
+        for event in HOOK_EVENTS:
+            setattr(self, event, [])
+
+    def _callbacks(self, event):
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unknown hook event: {event}")
+        return getattr(self, event)
+
+    def register(self, event, callback):
+        """Callback'i kaydeder ve unregister için geri döndürür"""
+        self._callbacks(event).append(callback)
+        return callback
+
+    def unregister(self, event, callback):
+        callbacks = self._callbacks(event)
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def is_registered(self, event, callback):
+        return callback in self._callbacks(event)
+
+    def clear(self, event=None):
+        for name in (event,) if event else HOOK_EVENTS:
+            self._callbacks(name).clear()
+
+    def __bool__(self):
+        return any(getattr(self, event) for event in HOOK_EVENTS)
@@ -0,0 +1,66 @@
+from collections import deque
+
+
+ERROR = 0
+INFO = 1
+VERBOSE = 2
+LEVELS = {"error": ERROR, "info": INFO, "verbose": VERBOSE}
+
+
+class LogSink:
+    """Seviye filtreli, tamponlu mesaj çıkışı.
+
+    Mesajlar seviyeleri (error/info/verbose) sink seviyesinden yüksekse
+    hemen atılır; geçenler tamponda biriktirilir ve batch_size mesajda
+    bir ya da flush() çağrıldığında emit(lines) ile toplu olarak
+    gönderilir. Son max_lines mesaj messages içinde tutulur, daha
+    eskileri atılır ve dropped sayacına eklenir.
+    """
+
+    def __init__(self, emit=None, level=INFO, max_lines=5000, batch_size=256):
+        self.emit = emit
+        self.level = level
+        self.batch_size = batch_size
+        self.messages = deque(maxlen=max_lines)
+        self.dropped = 0
+        self._pending = []
+
+    def enabled(self, level):
+        return level <= self.level
+
+    def log(self, message, level=INFO):
+        if level > self.level:
+            return
+        if len(self.messages) == self.messages.maxlen:
+            self.dropped += 1
+        self.messages.append(message)
+        if self.emit is not None:
+            self._pending.append(message)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    __call__ = log
+
+    def error(self, message):
+        self.log(message, ERROR)
+
+    def info(self, message):
+        self.log(message, INFO)
+
+    def verbose(self, message):
+        self.log(message, VERBOSE)
+
+    def flush(self):
+        """Tampondaki mesajları tek bir emit çağrısıyla gönderir"""
+        if self._pending:
+            lines = self._pending
+            self._pending = []
+            self.emit(lines)
+
+    def clear(self):
+        self._pending = []
+        self.messages.clear()
+        self.dropped = 0
+
+    def text(self):
+        return "\n".join(self.messages)
@@ -1,52 +1,159 @@
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
-    QSplitter, QHeaderView, QFrame, QGroupBox, QSizePolicy, QAbstractItemView
+    QSplitter, QHeaderView, QFrame, QGroupBox, QSizePolicy, QAbstractItemView,
+    QCheckBox, QComboBox, QLineEdit, QFileDialog, QSpinBox
 )
-from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QColor, QTextCursor, QTextFormat
+from PyQt5.QtCore import Qt, QEventLoop, QObject, QTimer, pyqtSignal
 import sys
+import threading
+import time
+
+try:
+    from .cpu import MIPSCPU, CONTROL_OPS
+    from .branch_predictor import PREDICTOR_NAMES
+    from .assembler import Diagnostic, check_source
+    from .log_sink import LogSink, LEVELS, INFO, VERBOSE
+    from .cfg import ControlFlowGraph
+    from .multicore import MultiCoreSystem, SCHEDULERS, make_scheduler
+    from .profiler import GUI_STAGES
+except ImportError:
+    from cpu import MIPSCPU, CONTROL_OPS
+    from branch_predictor import PREDICTOR_NAMES
+    from assembler import Diagnostic, check_source
+    from log_sink import LogSink, LEVELS, INFO, VERBOSE
+    from cfg import ControlFlowGraph
+    from multicore import MultiCoreSystem, SCHEDULERS, make_scheduler
+    from profiler import GUI_STAGES
+
+
+# Tablo vurgu renkleri
+CURRENT_COLOR = QColor(255, 255, 0)
+BREAKPOINT_COLOR = QColor(255, 200, 200)
+WATCH_COLOR = QColor(200, 220, 255)
+ERROR_COLOR = QColor(255, 160, 160)
+WARNING_COLOR = QColor(255, 230, 170)
+
+# Son tuş vuruşundan sonra arka plan assemble'ı için bekleme süresi
+ASSEMBLY_DELAY_MS = 300
+MAX_DIAGNOSTICS_SHOWN = 5
+# Event loop'a dönmeden önce güncellenen tablo satırı sayısı
+ASSEMBLY_CHUNK_ROWS = 500
+# Output panelinde tutulan en fazla satır
+MAX_LOG_LINES = 5000
+# Run to Cursor / Run Until için komut bütçesi; arka plandaki sonsuz döngü de biter
+BATCH_STEP_LIMIT = 1000000
+
+
+def assemble_for_editor(source, register_map):
+    """Editör için kaynağı doğrular ve hatasız komutların machine code'unu üretir.
+
+    Kaynak hatasızsa CFG analizinin uyarıları (erişilemeyen kod, yazılmadan
+    okunan register'lar) da tanılamalara eklenir ve CFG, program yüklenirken
+    CPU'ya verilebilsin diye döndürülür (hatalı kaynakta None). Kodlanamayan
+    bir komut sıfır kelime olarak gösterilmez, hata tanılaması olur. Qt'ye
+    dokunmadığı için arka plan thread'inde çalıştırılabilir.
+    """
+    check = check_source(source, register_map)
+    encoder = MIPSCPU()
+    encoder.labels = check.labels
+    error_lines = {d.line for d in check.diagnostics if d.severity == "error"}
+    cfg = None
+    if not error_lines:
+        cfg = ControlFlowGraph(check.instructions, check.labels, register_map)
+        diagnostics = sorted(check.diagnostics + cfg.diagnostics(check.lines), key=lambda d: d.line)
+        check = check._replace(diagnostics=diagnostics)
+    machine_code = []
+    failures = []
+    for index, (instruction, line) in enumerate(zip(check.instructions, check.lines)):
+        code = None
+        if line not in error_lines:
+            try:
+                code = encoder.encode_instruction(instruction, index)
+            except ValueError as e:
+                # Kodlanamayan komut sıfır kelime olarak gösterilmez, hata olarak raporlanır
+                failures.append(Diagnostic(line, "error", str(e)))
+        machine_code.append(code)
+    if failures:
+        diagnostics = sorted(check.diagnostics + failures, key=lambda d: d.line)
+        check = check._replace(diagnostics=diagnostics)
+    return check, machine_code, cfg
+
+
+class AssemblyNotifier(QObject):
+    """Arka plan assemble sonucunu GUI thread'ine taşıyan sinyal"""
+    finished = pyqtSignal(int, object)
+
+
+class BatchNotifier(QObject):
+    """Arka planda çalışan Step N/Run to Cursor/Run Until'in log satırlarını ve
+    sonucunu GUI thread'ine taşıyan sinyaller"""
+    log = pyqtSignal(object)
+    finished = pyqtSignal(object)
+
+
+def _cpu_attribute(name):
+    """Eski API uyumluluğu için MIPSCPU özelliğine yönlendiren property"""
+    return property(
+        lambda self: getattr(self.cpu, name),
+        lambda self, value: setattr(self.cpu, name, value),
+    )
 
 
 class MIPSSimulator(QMainWindow):
+    # Simülasyon durumu MIPSCPU'da tutulur
+    MEMORY_SIZE = _cpu_attribute("MEMORY_SIZE")
+    WORD_SIZE = _cpu_attribute("WORD_SIZE")
+    NUM_REGISTERS = _cpu_attribute("NUM_REGISTERS")
+    instruction_memory = _cpu_attribute("instruction_memory")
+    data_memory = _cpu_attribute("data_memory")
+    registers = _cpu_attribute("registers")
+    register_names = _cpu_attribute("register_names")
+    register_map = _cpu_attribute("register_map")
+    current_instruction = _cpu_attribute("current_instruction")
+    labels = _cpu_attribute("labels")
+    machine_code = _cpu_attribute("machine_code")
+    execution_trace = _cpu_attribute("execution_trace")
+    instruction_count = _cpu_attribute("instruction_count")
+    pc = _cpu_attribute("pc")
+    pipeline_model = _cpu_attribute("pipeline_model")
+    branch_predictors = _cpu_attribute("branch_predictors")
+    hooks = _cpu_attribute("hooks")
+    breakpoints = _cpu_attribute("breakpoints")
+    program_instructions = _cpu_attribute("program_instructions")
+    trace_enabled = _cpu_attribute("trace_enabled")
+    fusion_enabled = _cpu_attribute("fusion_enabled")
+    fusion_profile = _cpu_attribute("fusion_profile")
+    _compiled_cache = _cpu_attribute("_compiled_cache")
+
+    # Çekirdek API'si
+    execute_instruction = _cpu_attribute("execute_instruction")
+    clean_instruction_params = _cpu_attribute("clean_instruction_params")
+    clean_params = _cpu_attribute("clean_params")
+    generate_machine_code = _cpu_attribute("generate_machine_code")
+    get_register_changes = _cpu_attribute("get_register_changes")
+    get_memory_changes = _cpu_attribute("get_memory_changes")
+    enable_pipeline_timing = _cpu_attribute("enable_pipeline_timing")
+    disable_pipeline_timing = _cpu_attribute("disable_pipeline_timing")
+    add_branch_predictor = _cpu_attribute("add_branch_predictor")
+    clear_branch_predictors = _cpu_attribute("clear_branch_predictors")
+    fetch_instruction = _cpu_attribute("fetch_instruction")
+    decode_instruction = _cpu_attribute("decode_instruction")
+    execute_and_advance = _cpu_attribute("execute_and_advance")
+    control_flow_graph = _cpu_attribute("control_flow_graph")
+
 #Başlangıç ve UI    
     def __init__(self):
         super().__init__()
-        # Memory configuration
-        self.MEMORY_SIZE = 512  # 512 bytes
-        self.WORD_SIZE = 4      # 4 bytes per word
-        self.instruction_memory = [0] * (self.MEMORY_SIZE // self.WORD_SIZE)  # 512 bytes / 4 = 128 words
-        self.data_memory = [0] * (self.MEMORY_SIZE // self.WORD_SIZE)        # 512 bytes / 4 = 128 words
-        
-        # Register configuration
-        self.NUM_REGISTERS = 32
-        self.registers = [0] * self.NUM_REGISTERS
-        self.register_names = {
-            "$zero": 0,  # Constant 0
-            "$at": 1,    # Assembler temporary
-            "$v0": 2, "$v1": 3,  # Values for results and expression evaluation
-            "$a0": 4, "$a1": 5, "$a2": 6, "$a3": 7,  # Arguments
-            "$t0": 8, "$t1": 9, "$t2": 10, "$t3": 11,  # Temporaries
-            "$t4": 12, "$t5": 13, "$t6": 14, "$t7": 15,
-            "$s0": 16, "$s1": 17, "$s2": 18, "$s3": 19,  # Saved temporaries
-            "$s4": 20, "$s5": 21, "$s6": 22, "$s7": 23,
-            "$t8": 24, "$t9": 25,  # More temporaries
-            "$k0": 26, "$k1": 27,  # Reserved for OS kernel
-            "$gp": 28,  # Global pointer
-            "$sp": 29,  # Stack pointer
-            "$fp": 30,  # Frame pointer
-            "$ra": 31   # Return address
-        }
-        # Add numeric register names
-        self.register_map = {f"$r{i}": i for i in range(32)}
-        self.register_map.update(self.register_names)  # Add named registers
-        
-        # Initialize other components
-        self.current_instruction = 0
-        self.labels = {}
-        self.machine_code = []
-        self.execution_trace = []
-        self.pc = 0
+        # Simülasyon çekirdeği; mesajlar toplu halde Output paneline yazılır
+        self.log = LogSink(emit=self.write_log, level=INFO, max_lines=MAX_LOG_LINES)
+        self.cpu = MIPSCPU(log=self.log)
+        # Çok çekirdekli çalıştırmada self.cpu görüntülenen çekirdeğe geçer
+        self.main_cpu = self.cpu
+        self.system = None
+        # Her yüklemede data memory'ye kopyalanan binary/CSV dosyası
+        self.data_file = None
         
         # Initialize UI
         self.initUI()
@@ -60,6 +167,43 @@ class MIPSSimulator(QMainWindow):
         self.run_button.clicked.connect(self.run_program)
         self.step_button.clicked.connect(self.step_program)
         self.reset_button.clicked.connect(self.reset_program)
+        self.continue_button.clicked.connect(self.continue_program)
+        self.load_data_button.clicked.connect(self.choose_data_file)
+        self.step_n_button.clicked.connect(self.step_n)
+        self.run_to_cursor_button.clicked.connect(self.run_to_cursor)
+        self.run_until_button.clicked.connect(self.run_until_condition)
+        self.run_until_edit.returnPressed.connect(self.run_until_condition)
+        self.trace_checkbox.toggled.connect(self.set_trace_enabled)
+        self.fusion_checkbox.toggled.connect(self.set_fusion_enabled)
+        self.profile_checkbox.toggled.connect(self.set_profiling_enabled)
+        self.machine_code_table.cellDoubleClicked.connect(self.toggle_breakpoint_row)
+        self.register_file_table.cellDoubleClicked.connect(self.toggle_register_watch_row)
+        self.data_memory_table.cellDoubleClicked.connect(self.toggle_memory_watch_row)
+        self.pipeline_checkbox.toggled.connect(self.update_pipeline_settings)
+        self.forwarding_checkbox.toggled.connect(self.update_pipeline_settings)
+        self.branch_policy_combo.currentTextChanged.connect(self.update_pipeline_settings)
+        self.predictor_combo.currentTextChanged.connect(self.update_predictor_settings)
+        self.cores_combo.currentTextChanged.connect(self.update_core_controls)
+        self.log_level_combo.currentTextChanged.connect(self.set_log_level)
+        self.core_combo.currentIndexChanged.connect(self.select_core)
+
+        # Debounce edilmiş arka plan assemble
+        self.assembly_generation = 0
+        self.assembly_diagnostics = []
+        self.editor_cfg = None  # Son hatasız arka plan assemble'ın CFG'si
+        self.assembly_notifier = AssemblyNotifier()
+        self.assembly_notifier.finished.connect(self.apply_background_assembly)
+        self.assembly_timer = QTimer(self)
+        self.assembly_timer.setSingleShot(True)
+        self.assembly_timer.setInterval(ASSEMBLY_DELAY_MS)
+        self.assembly_timer.timeout.connect(self.start_background_assembly)
+        self.assembly_editor.textChanged.connect(self.assembly_timer.start)
+
+        # Arka plan toplu yürütme (Step N, Run to Cursor, Run Until)
+        self.batch_running = False
+        self.batch_notifier = BatchNotifier()
+        self.batch_notifier.log.connect(self.write_log)
+        self.batch_notifier.finished.connect(self.finish_batch)
 
         # Initialize tables
         self.populate_memory()
@@ -94,6 +238,12 @@ class MIPSSimulator(QMainWindow):
         self.assembly_editor.setPlaceholderText("Enter your MIPS assembly code here...")
         self.assembly_editor.setFont(QFont("Courier", 12))
         code_layout.addWidget(self.assembly_editor)
+
+        # Yazarken arka planda üretilen tanılamalar
+        self.diagnostics_label = QLabel("")
+        self.diagnostics_label.setStyleSheet("font-weight: normal; color: #b00020;")
+        self.diagnostics_label.setWordWrap(True)
+        code_layout.addWidget(self.diagnostics_label)
         left_panel.addWidget(code_editor_group)
 
         # Machine Code Display (new addition)
@@ -148,6 +298,7 @@ class MIPSSimulator(QMainWindow):
         self.run_button = QPushButton("Run")
         self.step_button = QPushButton("Step")
         self.reset_button = QPushButton("Reset")
+        self.continue_button = QPushButton("Continue")
         
         # Buton stilleri
         self.run_button.setStyleSheet("""
@@ -192,6 +343,77 @@ class MIPSSimulator(QMainWindow):
         controls_layout.addWidget(self.run_button)
         controls_layout.addWidget(self.step_button)
         controls_layout.addWidget(self.reset_button)
+        controls_layout.addWidget(self.continue_button)
+
+        # Toplu yürütme: görünümler yalnızca durma noktasında bir kez yenilenir
+        self.step_n_button = QPushButton("Step N")
+        self.step_count_spin = QSpinBox()
+        self.step_count_spin.setRange(1, BATCH_STEP_LIMIT)
+        self.step_count_spin.setValue(10)
+        self.run_to_cursor_button = QPushButton("Run to Cursor")
+        self.run_to_cursor_button.setToolTip("Run until the selected Machine Code row is reached")
+        self.run_until_button = QPushButton("Run Until")
+        self.run_until_edit = QLineEdit()
+        self.run_until_edit.setPlaceholderText("e.g. $t0 == 10")
+        controls_layout.addWidget(self.step_n_button)
+        controls_layout.addWidget(self.step_count_spin)
+        controls_layout.addWidget(self.run_to_cursor_button)
+        controls_layout.addWidget(self.run_until_button)
+        controls_layout.addWidget(self.run_until_edit)
+        self.load_data_button = QPushButton("Load Data")
+        self.load_data_button.setToolTip("Copy a binary or CSV file into data memory before each run")
+        controls_layout.addWidget(self.load_data_button)
+
+        # Breakpoint koşulu (Machine Code tablosunda çift tıklanan satıra uygulanır)
+        self.breakpoint_condition_edit = QLineEdit()
+        self.breakpoint_condition_edit.setPlaceholderText("Break if, e.g. $t0 == 10")
+        controls_layout.addWidget(self.breakpoint_condition_edit)
+
+        # Çalıştırma modu ayarları
+        self.trace_checkbox = QCheckBox("Trace")
+        self.trace_checkbox.setChecked(True)
+        self.fusion_checkbox = QCheckBox("Fusion")
+        self.fusion_checkbox.setToolTip("Run fused instruction sequences when trace is off")
+        self.profile_checkbox = QCheckBox("Profile")
+        self.profile_checkbox.setToolTip("Report time per stage and instructions/s after each Run")
+        controls_layout.addWidget(self.trace_checkbox)
+        controls_layout.addWidget(self.fusion_checkbox)
+        controls_layout.addWidget(self.profile_checkbox)
+
+        # Pipeline timing ayarları
+        self.pipeline_checkbox = QCheckBox("Pipeline Timing")
+        self.forwarding_checkbox = QCheckBox("Forwarding")
+        self.forwarding_checkbox.setChecked(True)
+        self.branch_policy_combo = QComboBox()
+        self.branch_policy_combo.addItems(["flush", "stall", "predict"])
+        self.predictor_combo = QComboBox()
+        self.predictor_combo.addItems(["none"] + list(PREDICTOR_NAMES))
+        controls_layout.addWidget(self.pipeline_checkbox)
+        controls_layout.addWidget(self.forwarding_checkbox)
+        controls_layout.addWidget(QLabel("Branch:"))
+        controls_layout.addWidget(self.branch_policy_combo)
+        controls_layout.addWidget(QLabel("Predictor:"))
+        controls_layout.addWidget(self.predictor_combo)
+
+        # Çekirdek sayısı, zamanlayıcı ve register'ları gösterilen çekirdek
+        self.cores_combo = QComboBox()
+        self.cores_combo.addItems(["1", "2", "4", "8"])
+        self.scheduler_combo = QComboBox()
+        self.scheduler_combo.addItems(list(SCHEDULERS))
+        self.core_combo = QComboBox()
+        self.core_combo.addItem("0")
+        controls_layout.addWidget(QLabel("Cores:"))
+        controls_layout.addWidget(self.cores_combo)
+        controls_layout.addWidget(self.scheduler_combo)
+        controls_layout.addWidget(QLabel("Core:"))
+        controls_layout.addWidget(self.core_combo)
+
+        # Output seviyesi
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(list(LEVELS))
+        self.log_level_combo.setCurrentText("info")
+        controls_layout.addWidget(QLabel("Log:"))
+        controls_layout.addWidget(self.log_level_combo)
         bottom_layout.addWidget(controls_group)
 
         # Create horizontal layout for Output and Trace
@@ -206,6 +428,7 @@ class MIPSSimulator(QMainWindow):
         self.output_log = QTextEdit()
         self.output_log.setReadOnly(True)
         self.output_log.setFont(QFont("Courier", 12))
+        self.output_log.document().setMaximumBlockCount(MAX_LOG_LINES)
         output_layout.addWidget(self.output_log)
         output_trace_layout.addWidget(output_group)
 
@@ -218,6 +441,12 @@ class MIPSSimulator(QMainWindow):
         self.trace_display.setReadOnly(True)
         self.trace_display.setFont(QFont("Courier", 10))
         trace_layout.addWidget(self.trace_display)
+
+        # Trace sorgusu: "$t2", "$s0 @ 120", "M[0x40] < 300"
+        self.trace_query_edit = QLineEdit()
+        self.trace_query_edit.setPlaceholderText("Query, e.g. $t2, $s0 @ 120, M[0x40] < 300")
+        self.trace_query_edit.returnPressed.connect(self.run_trace_query)
+        trace_layout.addWidget(self.trace_query_edit)
         
         # Add trace_group to output_trace_layout
         output_trace_layout.addWidget(trace_group)
@@ -228,568 +457,606 @@ class MIPSSimulator(QMainWindow):
 
 #Program kontrol butonları
     def reset_program(self):
-        # Registers'ları sıfırla
-        self.registers = [0] * 32
-        
-        # Memory'i sıfırla
-        self.data_memory = [0] * self.MEMORY_SIZE
-        
-        # Program counter'ı sıfırla
-        self.pc = 0
-        
-        # Current instruction'ı sıfırla
-        self.current_instruction = 0
-        
-        # Machine code'u sıfırla
-        self.machine_code = []
+        # Çok çekirdekli sistemden tek çekirdeğe dön
+        if self.system is not None:
+            self.system = None
+            self.cpu = self.main_cpu
+            self.set_core_choices(1)
+
+        # Register, memory, program ve istatistikleri sıfırla
+        self.cpu.reset()
         
         # Machine code tablosunu temizle
         self.machine_code_table.setRowCount(0)
         
-        # Execution trace'i temizle
-        self.execution_trace = []
+        # Execution trace görünümünü temizle
         self.update_trace_display()
         
-        # Instruction count'u sıfırla
-        self.instruction_count = 0
-        
         # Register ve memory tablolarını güncelle
         self.populate_registers()
         self.populate_memory()
         
         # Output log'u temizle
-        self.output_log.clear()
-        self.output_log.append("System reset completed")
+        self.clear_log()
+        self.log.info("System reset completed")
+        self.log.flush()
+
+    def fill_machine_code_table(self, instructions, machine_code):
+        """Machine code tablosunu adres, komut ve kod sütunlarıyla doldurur"""
+        table = self.machine_code_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(instructions))
+            for i, (instruction, code) in enumerate(zip(instructions, machine_code)):
+                table.setItem(i, 0, QTableWidgetItem(f"0x{i*4:08x}"))
+                table.setItem(i, 1, QTableWidgetItem(instruction))
+                table.setItem(i, 2, QTableWidgetItem(code))
+        finally:
+            table.setUpdatesEnabled(True)
+
 
     def run_program(self):
         try:
-            # Program durumunu sıfırla
+            # Program durumunu sıfırla ve kodu yükle
             self.reset_program()
-            self.labels = {}
-            self.machine_code = []  # Machine code listesini temizle
-            
-            # Assembly kodunu al ve temizle
-            assembly_code = self.assembly_editor.toPlainText()
-            instructions = [line.strip() for line in assembly_code.splitlines() 
-                           if line.strip() and not line.strip().startswith('#')]
-            
-            # Etiketleri topla
-            cleaned_instructions = []
-            instruction_index = 0
-            for line in instructions:
-                if ':' in line:
-                    parts = line.split(':')
-                    label = parts[0].strip()
-                    self.labels[label] = instruction_index
-                    if len(parts) > 1 and parts[1].strip():
-                        cleaned_instructions.append(parts[1].strip())
-                        instruction_index += 1
-                else:
-                    cleaned_instructions.append(line)
-                    instruction_index += 1
-            
-            # Machine code table'ı hazırla
-            self.machine_code_table.setRowCount(len(cleaned_instructions))
-            
-            # Her komut için machine code oluştur ve tabloya ekle
-            for i, instruction in enumerate(cleaned_instructions):
-                # Adres sütunu
-                addr_item = QTableWidgetItem(f"0x{i*4:08x}")
-                self.machine_code_table.setItem(i, 0, addr_item)
-                
-                # Komut sütunu
-                inst_item = QTableWidgetItem(instruction)
-                self.machine_code_table.setItem(i, 1, inst_item)
-                
-                # Machine code sütunu
-                code = self.generate_machine_code(instruction)
-                code_item = QTableWidgetItem(code)
-                self.machine_code_table.setItem(i, 2, code_item)
-                
-                # Machine code listesine ekle
-                self.machine_code.append(code)
-            
-            # Komutları çalıştır
-            self.current_instruction = 0
-            while self.current_instruction < len(cleaned_instructions):
-                instruction = cleaned_instructions[self.current_instruction]
-                try:
-                    self.execute_instruction(instruction)
-                    # Branch/jump değilse sonraki komuta geç
-                    parts = instruction.split()
-                    op = parts[0].lower()
-                    if op not in ['beq', 'bne', 'j', 'jal', 'jr']:
-                        self.current_instruction += 1
-                except Exception as e:
-                    self.output_log.append(f"Error executing: {instruction}")
-                    self.output_log.append(f"Error: {str(e)}")
-                    break
-            
-            # Program tamamlandı
-            self.output_log.append("\nProgram execution completed!")
-            self.output_log.append("-" * 40)
-            
-            # Bellek ve register tablolarını güncelle
-            self.populate_memory()
-            self.populate_registers()
-            
+            if int(self.cores_combo.currentText()) > 1:
+                self.start_multicore()
+                stop_reason = self.system.run()
+                self.log.info(self.system.report())
+                self.finish_run(stop_reason)
+                self.log.flush()
+                return
+            profiler = self.cpu.profiler
+            if profiler is not None:
+                profiler.start()
+            try:
+                self.load_editor_program()
+                self.fill_machine_code_table(self.program_instructions, self.machine_code)
+
+                # Komutları çalıştır
+                self.mark_breakpoint_rows()
+                stop_reason = self.cpu.run()
+                self.finish_run(stop_reason)
+            finally:
+                # Hata olsa da ölçüm kapatılır (cProfile açık kalmasın) ve rapor yazılır
+                if profiler is not None:
+                    profiler.stop()
+                    self.log.info(profiler.report())
+
         except Exception as e:
-            self.output_log.append(f"Program execution failed: {str(e)}")
+            self.log.error(f"Program execution failed: {str(e)}")
+        self.log.flush()
 
     def step_program(self):
+        # Adım açıklaması için komutun verbose mesajları da gösterilir
+        level = self.log.level
+        self.log.level = max(level, VERBOSE)
         try:
-            # Assembly kodunu al ve temizle
-            assembly_code = self.assembly_editor.toPlainText()
-            instructions = [line.strip() for line in assembly_code.splitlines() 
-                           if line.strip() and not line.strip().startswith('#')]
-            
-            # Etiketleri topla (eğer henüz toplanmamışsa)
-            if not hasattr(self, 'labels') or not self.labels:
-                self.labels = {}
-                instruction_index = 0
-                for line in instructions:
-                    if ':' in line:
-                        parts = line.split(':')
-                        label = parts[0].strip()
-                        self.labels[label] = instruction_index
-                        if len(parts) > 1 and parts[1].strip():
-                            instruction_index += 1
-                    else:
-                        instruction_index += 1
-            
-            # Temiz komutları oluştur
-            cleaned_instructions = []
-            for line in instructions:
-                if ':' in line:
-                    parts = line.split(':')
-                    if len(parts) > 1 and parts[1].strip():
-                        cleaned_instructions.append(parts[1].strip())
-                else:
-                    cleaned_instructions.append(line)
+            if int(self.cores_combo.currentText()) > 1:
+                self.step_multicore()
+            else:
+                self.show_step()
+        finally:
+            self.log.level = level
+            self.log.flush()
+
+    def show_step(self):
+        """Mevcut komutu yürütür ve açıklamasını Output paneline yazar"""
+        try:
+            # İlk adımda programı (ve .data bölümünü) yükle
+            if not self.program_instructions:
+                self.load_editor_program()
+            cleaned_instructions = self.program_instructions
             
             # Program tamamlandı mı kontrol et
             if self.current_instruction >= len(cleaned_instructions):
-                self.output_log.clear()
-                self.output_log.append("Program execution completed!")
-                self.output_log.append("-" * 40)
+                self.clear_log()
+                self.log.info("Program execution completed!")
+                self.log.info("-" * 40)
                 return
             
             # Machine code table'ı hazırla (eğer henüz hazır değilse)
             if self.machine_code_table.rowCount() != len(cleaned_instructions):
-                self.machine_code_table.setRowCount(len(cleaned_instructions))
-                # Tüm komutlar için machine code'ları oluştur
-                for i, inst in enumerate(cleaned_instructions):
-                    addr_item = QTableWidgetItem(f"0x{i*4:08x}")
-                    inst_item = QTableWidgetItem(inst)
-                    code = self.generate_machine_code(inst)
-                    code_item = QTableWidgetItem(code)
-                    
-                    self.machine_code_table.setItem(i, 0, addr_item)
-                    self.machine_code_table.setItem(i, 1, inst_item)
-                    self.machine_code_table.setItem(i, 2, code_item)
+                self.fill_machine_code_table(cleaned_instructions, self.machine_code)
             
             # Mevcut komutu highlight et ve görünür yap
-            for i in range(len(cleaned_instructions)):
-                for j in range(3):
-                    item = self.machine_code_table.item(i, j)
-                    if item:
-                        item.setBackground(Qt.yellow if i == self.current_instruction else Qt.white)
-            
-            # Mevcut komutu görünür yap
-            self.machine_code_table.scrollToItem(
-                self.machine_code_table.item(self.current_instruction, 0),
-                QAbstractItemView.PositionAtCenter
-            )
+            self.highlight_instruction(self.current_instruction)
             
             instruction = cleaned_instructions[self.current_instruction]
-            machine_code = self.generate_machine_code(instruction)
+            machine_code = self.generate_machine_code(instruction, self.current_instruction)
             
             # Output log'u güncelle
-            self.output_log.clear()
-            self.output_log.append(f"Step {self.current_instruction + 1}")
-            self.output_log.append("-" * 40)
-            self.output_log.append(f"Instruction: {instruction}")
-            self.output_log.append(f"Machine Code: {machine_code}")
-            self.output_log.append("")
-            self.output_log.append("Explanation:")
+            self.clear_log()
+            self.log.info(f"Step {self.current_instruction + 1}")
+            self.log.info("-" * 40)
+            self.log.info(f"Instruction: {instruction}")
+            self.log.info(f"Machine Code: {machine_code}")
+            self.log.info("")
+            self.log.info("Explanation:")
             
             # Execute instruction and track changes
-            old_reg_values = self.registers.copy()
+            old_reg_values = self.registers[:]
             old_mem_values = self.data_memory.copy()
             
             try:
-                old_instruction = self.current_instruction
-                self.execute_instruction(instruction)
+                self.execute_and_advance(instruction)
                 
                 # Show changes
                 reg_changes = self.get_register_changes(old_reg_values)
                 mem_changes = self.get_memory_changes(old_mem_values)
                 
-                self.output_log.append("")
-                self.output_log.append("Result:")
+                self.log.info("")
+                self.log.info("Result:")
                 if reg_changes != "No changes":
-                    self.output_log.append(f"• Register: {reg_changes}")
+                    self.log.info(f"• Register: {reg_changes}")
                 if mem_changes != "No changes":
-                    self.output_log.append(f"• Memory: {mem_changes}")
+                    self.log.info(f"• Memory: {mem_changes}")
+
+                # Pipeline diyagramı
+                if self.pipeline_model is not None:
+                    self.log.info("")
+                    self.log.info(self.pipeline_model.diagram(last=5))
+                    self.log.info(
+                        f"Cycles: {self.pipeline_model.cycles}, CPI: {self.pipeline_model.cpi:.2f}"
+                    )
                 
                 # Register ve memory tablolarını güncelle ve değişiklikleri vurgula
                 self.populate_registers(old_reg_values)
                 self.populate_memory(old_mem_values)
+                self.update_trace_display()
                 
             except Exception as e:
-                self.output_log.append(f"Error executing: {instruction}")
-                self.output_log.append(f"Error: {str(e)}")
-            
-            self.output_log.append("-" * 40)
+                self.log.error(f"Error executing: {instruction}")
+                self.log.error(f"Error: {str(e)}")
+                # Hatalı komutu atla
+                if instruction.split()[0].lower() not in CONTROL_OPS:
+                    self.current_instruction += 1
             
-            # Move to next instruction if not a branch/jump
-            parts = instruction.split()
-            op = parts[0].lower()
-            if op not in ['beq', 'bne', 'j', 'jal', 'jr']:
-                self.current_instruction += 1
+            self.log.info("-" * 40)
                 
         except Exception as e:
-            self.output_log.append(f"Error: {str(e)}")
-
-#Komut işleme
-    def fetch_instruction(self):
-        if self.pc // 4 < len(self.instruction_memory):
-            instruction = self.instruction_memory[self.pc // 4]
-            self.output_log.append(f"Fetch: PC = 0x{self.pc:08x}, Instruction = {instruction}")
-            return instruction
-        return None
-
-    def decode_instruction(self, instruction):
-        parts = instruction.split()
-        op = parts[0].lower()
-        self.output_log.append(f"Decode: Operation = {op}")
-        return parts
-
-    def execute_instruction(self, instruction):
-        """Komutları yürütür"""
-        # Yorumları kaldır
-        instruction = instruction.split('#')[0].strip()
-        
-        # Mevcut durumu kaydet
-        old_reg_values = self.registers.copy()
-        old_mem_values = self.data_memory.copy()
-        
-        # Parametreleri temizle
-        clean_params, op = self.clean_instruction_params(instruction)
-        
+            self.log.error(f"Error: {str(e)}")
+
+    def continue_program(self):
+        """Breakpoint'te duran programı bir sonraki durma noktasına kadar sürdürür"""
+        if not self.program_instructions:
+            self.run_program()
+            return
+        if self.system.finished if self.system is not None else self.cpu.finished:
+            self.log.info("Program execution completed!")
+            self.log.flush()
+            return
         try:
-            if op == "addi":
-                rt, rs, imm = clean_params
-                rt_idx = self.register_map[rt]
-                rs_idx = self.register_map[rs]
-                self.registers[rt_idx] = self.registers[rs_idx] + int(imm)
-                self.output_log.append(f"{rt} = {self.registers[rt_idx]}")
-            
-            elif op == "add":
-                rd, rs, rt = clean_params
-                rd_idx = self.register_map[rd]
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                rs_val = self.registers[rs_idx]
-                rt_val = self.registers[rt_idx]
-                result = rs_val + rt_val
-                # 32-bit integer taşma kontrolü
-                if result > 0x7FFFFFFF:  # Pozitif taşma
-                    result = (result & 0xFFFFFFFF) - (1 << 32)
-                elif result < -0x80000000:  # Negatif taşma
-                    result = (result & 0xFFFFFFFF)
-                self.registers[rd_idx] = result
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "sub":
-                rd, rs, rt = clean_params
-                rd_idx = self.register_map[rd]
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                self.registers[rd_idx] = self.registers[rs_idx] - self.registers[rt_idx]
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "and":
-                rd, rs, rt = clean_params
-                rd_idx = self.register_map[rd]
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                self.registers[rd_idx] = self.registers[rs_idx] & self.registers[rt_idx]
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "or":
-                rd, rs, rt = clean_params
-                rd_idx = self.register_map[rd]
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                self.registers[rd_idx] = self.registers[rs_idx] | self.registers[rt_idx]
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "slt":
-                rd, rs, rt = clean_params
-                rd_idx = self.register_map[rd]
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                self.registers[rd_idx] = int(self.registers[rs_idx] < self.registers[rt_idx])
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "sll":
-                rd, rt, shamt_or_reg = clean_params
-                rd_idx = self.register_map[rd]
-                rt_idx = self.register_map[rt]
-                try:
-                    # Eğer üçüncü parametre bir sayı (immediate) ise doğrudan kullanılır
-                    shamt = int(shamt_or_reg)
-                except ValueError:
-                    # Eğer üçüncü parametre bir register ise onun değerini kullan
-                    shamt = self.registers[self.register_map[shamt_or_reg]]
-                self.registers[rd_idx] = self.registers[rt_idx] << shamt
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-                        
-            elif op == "srl":
-                rd, rt, shamt_or_reg = clean_params
-                rd_idx = self.register_map[rd]
-                rt_idx = self.register_map[rt]
-                try:
-                    # Eğer üçüncü parametre bir sayı (immediate) ise doğrudan kullanılır
-                    shamt = int(shamt_or_reg)
-                except ValueError:
-                    # Eğer üçüncü parametre bir register ise onun değerini kullan
-                    shamt = self.registers[self.register_map[shamt_or_reg]]
-                self.registers[rd_idx] = self.registers[rt_idx] >> shamt
-                self.output_log.append(f"{rd} = {self.registers[rd_idx]}")
-            
-            elif op == "beq":
-                rs, rt, label = clean_params
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                if self.registers[rs_idx] == self.registers[rt_idx]:
-                    if label in self.labels:
-                        self.current_instruction = self.labels[label]
-                    else:
-                        raise Exception(f"Label not found: {label}")
-                else:
-                    # Eğer branch alınmazsa, bir sonraki komuta geç
-                    self.current_instruction += 1
-                self.output_log.append(f"beq evaluated to {'taken' if self.registers[rs_idx] == self.registers[rt_idx] else 'not taken'}")
-            
-            elif op == "bne":
-                rs, rt, label = clean_params
-                rs_idx = self.register_map[rs]
-                rt_idx = self.register_map[rt]
-                if self.registers[rs_idx] != self.registers[rt_idx]:
-                    if label in self.labels:
-                        self.current_instruction = self.labels[label]
-                    else:
-                        raise Exception(f"Label not found: {label}")
-                else:
-                    # Eğer branch alınmazsa, bir sonraki komuta geç
-                    self.current_instruction += 1
-                self.output_log.append(f"bne evaluated to {'taken' if self.registers[rs_idx] != self.registers[rt_idx] else 'not taken'}")
-            
-            elif op == "j":
-                target = clean_params[0]
-                self.current_instruction = self.labels[target]
-                self.output_log.append(f"Jump to {target}")
-            
-            elif op == "jal":
-                target = clean_params[0]
-                self.registers[self.register_map['$ra']] = self.current_instruction + 1
-                self.current_instruction = self.labels[target]
-                self.output_log.append(f"Jump and link to {target}")
-            
-            elif op == "jr":
-                rs = clean_params[0]
-                rs_idx = self.register_map[rs]
-                self.current_instruction = self.registers[rs_idx]
-                self.output_log.append(f"Jump to register {rs}")
-            
-            elif op == "lw":
-                rt = clean_params[0]
-                offset_base = clean_params[1]
-                offset, base = offset_base.split('(')
-                base = base.strip(')')
-                rt_idx = self.register_map[rt]
-                base_idx = self.register_map[base]
-                address = (self.registers[base_idx] + int(offset)) // self.WORD_SIZE
-                if 0 <= address < (self.MEMORY_SIZE // self.WORD_SIZE):
-                    self.registers[rt_idx] = self.data_memory[address]
-                    self.output_log.append(f"{rt} = {self.registers[rt_idx]}")
-            
-            elif op == "sw":
-                rt = clean_params[0]
-                offset_base = clean_params[1]
-                offset, base = offset_base.split('(')
-                base = base.strip(')')
-                rt_idx = self.register_map[rt]
-                base_idx = self.register_map[base]
-                address = (self.registers[base_idx] + int(offset)) // self.WORD_SIZE
-                if 0 <= address < (self.MEMORY_SIZE // self.WORD_SIZE):
-                    self.data_memory[address] = self.registers[rt_idx]
-                    self.output_log.append(f"Memory[{address*4}] = {self.registers[rt_idx]}")
-
-            # Trace'e ekle
-            machine_code = self.generate_machine_code(instruction)
-            self.add_to_trace(instruction, machine_code, old_reg_values, old_mem_values)
-
+            self.log.info("Continuing...")
+            if self.system is not None:
+                # Adım adım ilerletilen çok çekirdekli sistemi sonuna kadar çalıştır
+                stop_reason = self.system.run()
+                self.log.info(self.system.report())
+            else:
+                stop_reason = self.cpu.run(resume=True)
+            self.finish_run(stop_reason)
         except Exception as e:
-            self.output_log.append(f"Error executing: {instruction}")
-            self.output_log.append(f"Error: {str(e)}")
-            raise
-
-    def clean_instruction_params(self, instruction):
-        """Temiz parametre listesi döndürür"""
-        # Önce yorumları kaldır
-        instruction = instruction.split('#')[0].strip()
-        
-        parts = instruction.split(None, 1)  # İlk boşluktan böl (opcode ve parametreleri ayır)
-        if len(parts) < 2:
-            return [], ""
-        
-        op = parts[0].lower()
-        params_str = parts[1]
+            self.log.error(f"Program execution failed: {str(e)}")
+        self.log.flush()
+
+    def finish_run(self, stop_reason):
+        """Run sonunda ya durma noktasını ya da tamamlanma özetini gösterir"""
+        self.update_trace_display()
+        if stop_reason is not None:
+            # Breakpoint/watchpoint: step görünümüne devret
+            self.log.info(f"\nPaused: {stop_reason}")
+            self.log.info("Use Step or Continue to resume")
+            self.log.info("-" * 40)
+            self.highlight_instruction(self.current_instruction)
+            self.populate_memory()
+            self.populate_registers()
+            return
+
+        # Program tamamlandı
+        self.log.info("\nProgram execution completed!")
+        self.log.info("-" * 40)
+        if self.pipeline_model is not None:
+            self.log.info(self.pipeline_model.report())
+            self.log.info("-" * 40)
+        for predictor in self.branch_predictors:
+            self.log.info(predictor.report())
+            self.log.info("-" * 40)
         
-        # Tüm boşlukları kaldır ve virgülle ayrılmış parametreleri al
-        clean_params = [p.strip() for p in params_str.replace(" ", "").split(",")]
-        return clean_params, op
-
-    def clean_params(self, params):
-        # Önce tüm virgülleri boşluğa çevir
-        params = params.replace(',', ' ')
-        # Birden fazla boşluğu tek boşluğa çevir
-        params = ' '.join(params.split())
-        # Boşluklarla ayır ve temizle
-        return [p.strip() for p in params.split()]
-
-#Makine kodu üretimi
-    def generate_machine_code(self, instruction):
-        """MIPS komutları için binary machine code üretimi"""
-        try:
-            # Yorum satırını kaldır
-            instruction = instruction.split('#')[0].strip()
-            if not instruction:
-                return "00000000000000000000000000000000"
-
-            # Komut ve parametreleri ayır
-            parts = instruction.split()
-            op = parts[0].lower()
-            params = [p.strip().rstrip(',') for p in parts[1:]]
-
-            # R-Format Instructions
-            if op == "add":  # 000000 rs rt rd 00000 100000
-                rd = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                rt = self.register_map[params[2]] & 0x1F
-                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100000"
-
-            elif op == "sub":  # 000000 rs rt rd 00000 100010
-                rd = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                rt = self.register_map[params[2]] & 0x1F
-                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100010"
-
-            elif op == "and":  # 000000 rs rt rd 00000 100100
-                rd = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                rt = self.register_map[params[2]] & 0x1F
-                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100100"
-
-            elif op == "or":   # 000000 rs rt rd 00000 100101
-                rd = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                rt = self.register_map[params[2]] & 0x1F
-                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}100101"
-
-            elif op == "slt":  # 000000 rs rt rd 00000 101010
-                rd = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                rt = self.register_map[params[2]] & 0x1F
-                return f"{0:06b}{rs:05b}{rt:05b}{rd:05b}{0:05b}101010"
-
-            elif op == "sll":  # 000000 00000 rt rd shamt 000000
-                rd = self.register_map[params[0]] & 0x1F
-                rt = self.register_map[params[1]] & 0x1F
-                try:
-                    shamt = int(params[2]) & 0x1F
-                except ValueError:
-                    shamt = self.registers[self.register_map[params[2]]] & 0x1F
-                return f"{0:06b}{0:05b}{rt:05b}{rd:05b}{shamt:05b}000000"
-
-
-            elif op == "srl":  # 000000 00000 rt rd shamt 000010
-                rd = self.register_map[params[0]] & 0x1F
-                rt = self.register_map[params[1]] & 0x1F
-                try:
-                    shamt = int(params[2]) & 0x1F
-                except ValueError:
-                    shamt = self.registers[self.register_map[params[2]]] & 0x1F
-                return f"{0:06b}{0:05b}{rt:05b}{rd:05b}{shamt:05b}000010"
-
-            # I-Format Instructions
-            elif op == "addi":  # 001000 rs rt immediate
-                rt = self.register_map[params[0]] & 0x1F
-                rs = self.register_map[params[1]] & 0x1F
-                imm = int(params[2]) & 0xFFFF
-                return f"001000{rs:05b}{rt:05b}{imm:016b}"
-
-            elif op == "lw":    # 100011 rs rt offset
-                rt = self.register_map[params[0]] & 0x1F
-                offset_base = params[1]
-                offset, base = offset_base.split('(')
-                base = base.rstrip(')')
-                rs = self.register_map[base] & 0x1F
-                offset = int(offset) & 0xFFFF
-                return f"100011{rs:05b}{rt:05b}{offset:016b}"
-
-            elif op == "sw":    # 101011 rs rt offset
-                rt = self.register_map[params[0]] & 0x1F
-                offset_base = params[1]
-                offset, base = offset_base.split('(')
-                base = base.rstrip(')')
-                rs = self.register_map[base] & 0x1F
-                offset = int(offset) & 0xFFFF
-                return f"101011{rs:05b}{rt:05b}{offset:016b}"
-
-            elif op == "beq":   # 000100 rs rt offset
-                rs = self.register_map[params[0]] & 0x1F
-                rt = self.register_map[params[1]] & 0x1F
-                offset = (self.labels.get(params[2], 0) - self.current_instruction - 1) & 0xFFFF
-                return f"000100{rs:05b}{rt:05b}{offset:016b}"
-
-            elif op == "bne":   # 000101 rs rt offset
-                rs = self.register_map[params[0]] & 0x1F
-                rt = self.register_map[params[1]] & 0x1F
-                offset = (self.labels.get(params[2], 0) - self.current_instruction - 1) & 0xFFFF
-                return f"000101{rs:05b}{rt:05b}{offset:016b}"
-
-            # J-Format Instructions
-            elif op == "j":     # 000010 target
-                target = params[0]
-                if target in self.labels:
-                    target_address = self.labels[target] & 0x3FFFFFF
-                    return f"000010{target_address:026b}"
-                else:
-                    self.output_log.append(f"Warning: Label '{target}' not found")
-                    return "00001000000000000000000000000000"
-
-            elif op == "jal":   # 000011 target
-                target = params[0]
-                if target in self.labels:
-                    target_address = self.labels[target] & 0x3FFFFFF
-                    return f"000011{target_address:026b}"
-                else:
-                    self.output_log.append(f"Warning: Label '{target}' not found")
-                    return "00001100000000000000000000000000"
-
-            elif op == "jr":    # 000000 rs 00000 00000 00000 001000
-                rs = self.register_map[params[0]] & 0x1F
-                return f"000000{rs:05b}000000000000000001000"
-
-            return "00000000000000000000000000000000"
+        # Bellek ve register tablolarını güncelle
+        self.populate_memory()
+        self.populate_registers()
 
+    def load_editor_program(self):
+        """Editördeki programı yükler; seçilmiş bir data dosyası varsa belleğe kopyalar"""
+        self.cpu.load_program(self.assembly_editor.toPlainText())
+        # Editör kaynağı için arka planda kurulan CFG yeniden hesaplanmadan kullanılır
+        if self.editor_cfg is not None:
+            self.cpu.adopt_control_flow_graph(self.editor_cfg)
+        if self.data_file:
+            words = self.cpu.load_data_file(self.data_file)
+            self.log.info(f"Loaded {words} data words from {self.data_file}")
+
+    def choose_data_file(self):
+        """Run öncesi data memory'ye yüklenecek binary ya da CSV dosyasını seçer"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Data", "", "Data files (*.bin *.dat *.csv);;All files (*)"
+        )
+        self.data_file = path or None
+        self.log.info(f"Data file: {self.data_file}" if self.data_file else "Data file cleared")
+        self.log.flush()
+
+#Toplu yürütme
+    def step_n(self):
+        count = self.step_count_spin.value()
+        self.run_batch(lambda: self.cpu.run(resume=True, max_steps=count))
+
+    def run_to_cursor(self):
+        """Machine Code tablosunda seçili satıra kadar çalıştırır"""
+        row = self.machine_code_table.currentRow()
+        if row < 0:
+            self.log.error("Select a row in the Machine Code table first")
+            self.log.flush()
+            return
+        self.run_batch(lambda: self.cpu.run_to(row, max_steps=BATCH_STEP_LIMIT))
+
+    def run_until_condition(self):
+        expression = self.run_until_edit.text().strip()
+        if not expression:
+            self.log.error("Enter a condition, e.g. $t0 == 10")
+            self.log.flush()
+            return
+        self.run_batch(lambda: self.cpu.run_until(expression, max_steps=BATCH_STEP_LIMIT))
+
+    def run_batch(self, action):
+        """action'ı ara güncelleme yapmadan ayrı bir thread'de çalıştırır; GUI bu sırada
+        donmaz. Tablolar, vurgu ve trace durma noktasında bir kez yenilenir (finish_batch)"""
+        if self.batch_running:
+            return
+        if self.system is not None or int(self.cores_combo.currentText()) > 1:
+            self.log.info("Step N, Run to Cursor and Run Until work on a single core")
+            self.log.flush()
+            return
+        try:
+            if not self.program_instructions:
+                self.load_editor_program()
+            if self.machine_code_table.rowCount() != len(self.program_instructions):
+                self.fill_machine_code_table(self.program_instructions, self.machine_code)
+            if self.cpu.finished:
+                self.log.info("Program execution completed!")
+                self.log.flush()
+                return
         except Exception as e:
-            print(f"Error in machine code generation: {str(e)}")
-            return "00000000000000000000000000000000"
+            self.log.error(f"Error: {str(e)}")
+            self.log.flush()
+            return
+
+        cpu = self.cpu
+        start = (self.registers[:], self.data_memory.copy(), self.instruction_count)
+        # Önceki çıktı yürütmeden önce temizlenir; action'ın hata satırları korunur
+        self.clear_log()
+        # Thread'den gelen log satırları sinyalle panele yazılır; adım başına trace
+        # metni üretilmez (trace_index sorguları yine de tüm adımları görür)
+        self.log.emit = self.batch_notifier.log.emit
+        cpu.trace_text = False
+        self.set_batch_running(True)
+
+        def work():
+            try:
+                result = (action(), None)
+            except Exception as e:
+                result = (None, e)
+            self.batch_notifier.finished.emit((cpu, start) + result)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def set_batch_running(self, running):
+        """Toplu yürütme sürerken CPU durumunu değiştiren kontrolleri kapatır"""
+        self.batch_running = running
+        for button in (self.run_button, self.step_button, self.reset_button, self.continue_button,
+                       self.load_data_button, self.step_n_button, self.run_to_cursor_button,
+                       self.run_until_button):
+            button.setEnabled(not running)
+
+    def finish_batch(self, result):
+        """Thread bitince GUI thread'inde görünümleri yeniler, değişiklikleri
+        başlangıç durumuna göre vurgular"""
+        cpu, (old_reg_values, old_mem_values, start_count), stop_reason, error = result
+        self.log.emit = self.write_log
+        cpu.trace_text = True
+        self.set_batch_running(False)
+        try:
+            if error is not None:
+                raise error
+            executed = self.instruction_count - start_count
+            self.log.info(f"Executed {executed} instructions")
+            if cpu.trace_enabled and executed:
+                self.log.info("Trace: batch steps are not listed; query them in the trace box")
+            if self.cpu.last_error is not None:
+                self.log.error(f"Stopped on error: {self.cpu.last_error}")
+            elif stop_reason is not None:
+                self.log.info(f"Paused: {stop_reason}")
+            elif self.cpu.finished:
+                self.log.info("Program execution completed!")
+            self.log.info(f"• Register: {self.get_register_changes(old_reg_values)}")
+            self.log.info(f"• Memory: {self.get_memory_changes(old_mem_values)}")
+            self.log.info("-" * 40)
+            self.highlight_instruction(self.current_instruction)
+            self.populate_registers(old_reg_values)
+            self.populate_memory(old_mem_values)
+            self.update_trace_display()
+        except Exception as e:
+            self.log.error(f"Error: {str(e)}")
+        self.log.flush()
+
+    def wait_for_batch(self, timeout=None):
+        """Süren toplu yürütme bitene kadar olayları işler; bittiyse True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.batch_running:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            QApplication.processEvents(QEventLoop.AllEvents, 50)
+        return True
+
+#Çok çekirdekli yürütme
+    def start_multicore(self):
+        """Editördeki programı her çekirdeğe yükleyen ortak bellekli sistemi kurar"""
+        cores = int(self.cores_combo.currentText())
+        scheduler = make_scheduler(self.scheduler_combo.currentText())
+        trace_enabled = self.main_cpu.trace_enabled
+        self.system = MultiCoreSystem(cores, scheduler, log=self.log)
+        self.system.set_trace_enabled(trace_enabled)
+        # Breakpoint ve watchpoint'ler tüm çekirdeklerde geçerlidir
+        self.system.share_breakpoints(self.main_cpu.breakpoints)
+        if self.main_cpu.pipeline_model is not None or self.main_cpu.branch_predictors:
+            self.log.info("Pipeline timing and branch prediction are single-core only; "
+                          f"not recorded for {cores} cores")
+        self.system.load_program(self.assembly_editor.toPlainText())
+        if self.data_file:
+            self.system.cores[0].load_data_file(self.data_file)
+        self.set_core_choices(cores)
+        self.cpu = self.system.cores[0]
+        self.fill_machine_code_table(self.program_instructions, self.machine_code)
+
+    def step_multicore(self):
+        """Zamanlayıcının seçtiği çekirdekte bir komut yürütür ve o çekirdeği gösterir"""
+        if self.system is None:
+            self.reset_program()
+            self.start_multicore()
+        number = self.system.next_core()
+        if number is None:
+            self.clear_log()
+            self.log.info("Program execution completed!")
+            self.log.info(self.system.report())
+            return
+        core = self.system.cores[number]
+        instruction = core.program_instructions[core.current_instruction]
+        old_reg_values = core.registers[:]
+        old_mem_values = self.system.data_memory.copy()
+        self.clear_log()
+        self.log.info(f"Core {number}, step {self.system.steps + 1}")
+        self.log.info("-" * 40)
+        self.log.info(f"Instruction: {instruction}")
+        self.system.run_slice(number, 1, resume=True)
+        self.core_combo.setCurrentIndex(number)
+        self.populate_registers(old_reg_values)
+        self.populate_memory(old_mem_values)
+        self.log.info("-" * 40)
+
+    def set_core_choices(self, count):
+        self.core_combo.blockSignals(True)
+        self.core_combo.clear()
+        self.core_combo.addItems([str(i) for i in range(count)])
+        self.core_combo.blockSignals(False)
+
+    def select_core(self, index):
+        """Register tablosunu, vurguyu ve trace'i seçilen çekirdeğe geçirir"""
+        if self.system is None or not 0 <= index < len(self.system.cores):
+            return
+        self.cpu = self.system.cores[index]
+        self.populate_registers()
+        self.highlight_instruction(self.current_instruction)
+        self.update_trace_display()
+
+#Output log
+    def write_log(self, lines):
+        """Sink'ten gelen mesaj grubunu tek bir append ile panele yazar"""
+        self.output_log.append("\n".join(lines))
+
+    def clear_log(self):
+        self.log.clear()
+        self.output_log.clear()
+
+    def set_log_level(self, name):
+        self.log.level = LEVELS[name]
+
+#Arka plan assemble ve tanılamalar
+    def start_background_assembly(self):
+        """Editördeki kaynağı ayrı bir thread'de assemble eder"""
+        self.assembly_generation += 1
+        generation = self.assembly_generation
+        source = self.assembly_editor.toPlainText()
+        register_map = dict(self.register_map)
+
+        def work():
+            result = assemble_for_editor(source, register_map)
+            self.assembly_notifier.finished.emit(generation, result)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def apply_background_assembly(self, generation, result):
+        """Güncel assemble sonucunu tabloya ve editöre uygular, eskileri atlar"""
+        if generation != self.assembly_generation:
+            return
+        check, machine_code, self.editor_cfg = result
+        messages = {}
+        for diagnostic in check.diagnostics:
+            messages.setdefault(diagnostic.line, diagnostic)
+        rows = []
+        for i, (instruction, code, line) in enumerate(zip(check.instructions, machine_code, check.lines)):
+            diagnostic = messages.get(line)
+            if code is None:
+                code = f"error: {diagnostic.message}"
+            rows.append((f"0x{i*4:08x}", instruction, code, diagnostic))
+        self.machine_code_table.setRowCount(len(rows))
+        self.show_diagnostics(check.diagnostics)
+        self.apply_assembly_rows(generation, rows, 0)
+
+    def apply_assembly_rows(self, generation, rows, start):
+        """Tablo satırlarını parça parça günceller; yalnızca değişen hücrelere dokunur.
+
+        Parçalar arasında event loop'a dönüldüğü için büyük kaynaklarda da
+        yazmaya devam edilebilir. Daha yeni bir assemble başladıysa durur.
+        """
+        if generation != self.assembly_generation:
+            return
+        table = self.machine_code_table
+        breakpoints = self.breakpoints.breakpoints
+        end = min(start + ASSEMBLY_CHUNK_ROWS, len(rows))
+        for row in range(start, end):
+            *texts, diagnostic = rows[row]
+            if diagnostic is not None:
+                color = ERROR_COLOR if diagnostic.severity == "error" else WARNING_COLOR
+                tooltip = diagnostic.message
+            else:
+                color = BREAKPOINT_COLOR if row in breakpoints else QColor(Qt.white)
+                tooltip = ""
+            for column, text in enumerate(texts):
+                item = table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem(text)
+                    table.setItem(row, column, item)
+                elif item.text() != text:
+                    item.setText(text)
+                if item.background().color() != color:
+                    item.setBackground(color)
+                if item.toolTip() != tooltip:
+                    item.setToolTip(tooltip)
+        if end < len(rows):
+            QTimer.singleShot(0, lambda: self.apply_assembly_rows(generation, rows, end))
+
+    def show_diagnostics(self, diagnostics):
+        """Hatalı satırları editörde vurgular ve ilk mesajları altında listeler"""
+        self.assembly_diagnostics = diagnostics
+        selections = []
+        document = self.assembly_editor.document()
+        for diagnostic in diagnostics:
+            block = document.findBlockByNumber(diagnostic.line - 1)
+            if not block.isValid():
+                continue
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(block)
+            color = ERROR_COLOR if diagnostic.severity == "error" else WARNING_COLOR
+            selection.format.setBackground(color)
+            selection.format.setProperty(QTextFormat.FullWidthSelection, True)
+            selection.format.setToolTip(diagnostic.message)
+            selections.append(selection)
+        self.assembly_editor.setExtraSelections(selections)
+
+        lines = [f"Line {d.line}: {d.severity}: {d.message}"
+                 for d in diagnostics[:MAX_DIAGNOSTICS_SHOWN]]
+        if len(diagnostics) > MAX_DIAGNOSTICS_SHOWN:
+            lines.append(f"... and {len(diagnostics) - MAX_DIAGNOSTICS_SHOWN} more")
+        self.diagnostics_label.setText("\n".join(lines))
+
+#Yürütme ayarları
+    def set_trace_enabled(self, enabled):
+        self.trace_enabled = enabled
+
+    def set_fusion_enabled(self, enabled):
+        self.fusion_enabled = enabled
+
+    def set_profiling_enabled(self, enabled):
+        """Ana çekirdeğin aşamalarını ve tablo/trace güncellemelerini ölçer"""
+        if enabled:
+            self.main_cpu.enable_profiling().attach(self, GUI_STAGES)
+        else:
+            self.main_cpu.disable_profiling()
+
+#Pipeline timing ve branch tahmini
+    def update_pipeline_settings(self):
+        """Controls grubundaki pipeline ayarlarını uygular"""
+        if self.pipeline_checkbox.isChecked():
+            predictor = self.predictor_combo.currentText()
+            self.enable_pipeline_timing(
+                forwarding=self.forwarding_checkbox.isChecked(),
+                branch_policy=self.branch_policy_combo.currentText(),
+                predictor=predictor if predictor != "none" else "2bit",
+            )
+        else:
+            self.disable_pipeline_timing()
+
+    def update_core_controls(self, cores):
+        """Pipeline ve tahminci ayarları yalnızca tek çekirdekte uygulanır"""
+        single = int(cores) == 1
+        for widget in (self.pipeline_checkbox, self.forwarding_checkbox,
+                       self.branch_policy_combo, self.predictor_combo):
+            widget.setEnabled(single)
+
+    def update_predictor_settings(self):
+        """Controls grubunda seçilen tahminciyi uygular"""
+        self.clear_branch_predictors()
+        name = self.predictor_combo.currentText()
+        if name != "none":
+            self.add_branch_predictor(name)
+        self.update_pipeline_settings()
+
+#Tablo vurguları ve breakpoint işaretleri
+    def highlight_instruction(self, index):
+        """Mevcut komutu sarı, breakpoint satırlarını kırmızı gösterir ve görünür yapar"""
+        breakpoints = self.breakpoints.breakpoints
+        for i in range(self.machine_code_table.rowCount()):
+            if i == index:
+                color = CURRENT_COLOR
+            elif i in breakpoints:
+                color = BREAKPOINT_COLOR
+            else:
+                color = Qt.white
+            for j in range(3):
+                item = self.machine_code_table.item(i, j)
+                if item:
+                    item.setBackground(color)
+        item = self.machine_code_table.item(index, 0)
+        if item:
+            self.machine_code_table.scrollToItem(item, QAbstractItemView.PositionAtCenter)
+
+    def mark_breakpoint_rows(self):
+        """Breakpoint satırlarını renklendirir"""
+        breakpoints = self.breakpoints.breakpoints
+        for i in range(self.machine_code_table.rowCount()):
+            color = BREAKPOINT_COLOR if i in breakpoints else Qt.white
+            for j in range(3):
+                item = self.machine_code_table.item(i, j)
+                if item:
+                    item.setBackground(color)
+
+    def toggle_breakpoint_row(self, row, column):
+        """Machine Code tablosunda çift tıklanan satırda breakpoint açar/kapatır"""
+        condition = self.breakpoint_condition_edit.text().strip() or None
+        try:
+            enabled = self.breakpoints.toggle_breakpoint(row, condition, self.register_map)
+        except ValueError as e:
+            self.log.error(f"Error: {str(e)}")
+            self.log.flush()
+            return
+        state = "set" if enabled else "removed"
+        suffix = f" if {condition}" if enabled and condition else ""
+        self.log.info(f"Breakpoint {state} at 0x{row * self.WORD_SIZE:08x}{suffix}")
+        self.log.flush()
+        self.mark_breakpoint_rows()
+
+    def toggle_register_watch_row(self, row, column):
+        """Register tablosunda çift tıklanan register'ı izler"""
+        enabled = self.breakpoints.toggle_register_watch(row)
+        self.log.info(f"Watchpoint {'set' if enabled else 'removed'} on $r{row}")
+        self.log.flush()
+        self.populate_registers()
+
+    def toggle_memory_watch_row(self, row, column):
+        """Data Memory tablosunda çift tıklanan kelimeyi izler"""
+        enabled = self.breakpoints.toggle_memory_watch(row * self.WORD_SIZE)
+        self.log.info(f"Watchpoint {'set' if enabled else 'removed'} on M[0x{row * self.WORD_SIZE:03x}]")
+        self.log.flush()
+        self.populate_memory()
 
     def update_machine_code_display(self, instructions):
         self.machine_code_table.setRowCount(len(instructions))
@@ -806,6 +1073,8 @@ class MIPSSimulator(QMainWindow):
         for i in range(self.MEMORY_SIZE // self.WORD_SIZE):
             # Adres sütunu
             addr_item = QTableWidgetItem(f"0x{i*4:08x}")
+            if i in self.breakpoints.memory_words:
+                addr_item.setBackground(WATCH_COLOR)
             self.data_memory_table.setItem(i, 0, addr_item)
             
             # Değer sütunu
@@ -872,6 +1141,8 @@ class MIPSSimulator(QMainWindow):
         for i, (name, number, desc) in enumerate(register_info):
             # Numeric isim
             numeric_item = QTableWidgetItem(f"$r{number}")
+            if self.breakpoints.is_register_watched(number):
+                numeric_item.setBackground(WATCH_COLOR)
             
             # Sembolik isim
             symbolic_item = QTableWidgetItem(name)
@@ -908,21 +1179,6 @@ class MIPSSimulator(QMainWindow):
         # Symbolic sütununun genişliğini manuel ayarla
         self.register_file_table.setColumnWidth(1, 80)  # Piksel cinsinden genişlik
 
-    def get_register_changes(self, old_values):
-        changes = []
-        for i in range(len(self.registers)):
-            if self.registers[i] != old_values[i]:
-                reg_name = f"${next((k[1:] for k, v in self.register_names.items() if v == i), f'r{i}')}"
-                changes.append(f"{reg_name}: {old_values[i]} -> {self.registers[i]}")
-        return ", ".join(changes) if changes else "No changes"
-
-    def get_memory_changes(self, old_values):
-        changes = []
-        for i in range(len(self.data_memory)):
-            if self.data_memory[i] != old_values[i]:
-                changes.append(f"M[0x{i*4:03x}]: {old_values[i]} -> {self.data_memory[i]}")
-        return ", ".join(changes) if changes else "No changes"
-
     def show_changes(self, old_reg_values, old_mem_values):
         """Register ve bellek değişikliklerini gösterir"""
         # Register değişikliklerini kontrol et
@@ -940,42 +1196,31 @@ class MIPSSimulator(QMainWindow):
         
         # Değişiklikleri output_log'a ekle
         if reg_changes:
-            self.output_log.append("\nRegister Changes:")
+            self.log.info("\nRegister Changes:")
             for change in reg_changes:
-                self.output_log.append(f"  {change}")
+                self.log.info(f"  {change}")
             
         if mem_changes:
-            self.output_log.append("\nMemory Changes:")
+            self.log.info("\nMemory Changes:")
             for change in mem_changes:
-                self.output_log.append(f"  {change}")
+                self.log.info(f"  {change}")
             
         if not reg_changes and not mem_changes:
-            self.output_log.append("\nNo changes in registers or memory")
+            self.log.info("\nNo changes in registers or memory")
+        self.log.flush()
 
 #Trace ekleme
-    def add_to_trace(self, instruction, machine_code, old_reg_values, old_mem_values):
-        # Instruction count'u tutmak için yeni bir sınıf değişkeni
-        if not hasattr(self, 'instruction_count'):
-            self.instruction_count = 0
-        self.instruction_count += 1
-        
-        trace_entry = (
-            f"Step {self.instruction_count}\n"
-            f"PC: 0x{self.pc:08x}\n"
-            f"Instruction: {instruction}\n"
-            f"Machine Code: {machine_code}\n"
-            f"Register Changes: {self.get_register_changes(old_reg_values)}\n"
-            f"Memory Changes: {self.get_memory_changes(old_mem_values)}\n"
-            f"{'-'*50}\n"
-        )
-        self.execution_trace.append(trace_entry)
-        self.update_trace_display()
-
-        # Program sonunda toplam adım sayısını göster
-        if instruction.strip().lower() == 'beq $s1, $s0, end_sort' and self.registers[self.register_map['$s1']] == self.registers[self.register_map['$s0']]:
-            summary = f"\nProgram completed in {self.instruction_count} steps\n{'-'*50}\n"
-            self.execution_trace.append(summary)
-            self.update_trace_display()
+    def run_trace_query(self):
+        """Trace sorgu kutusundaki sorgunun sonucunu Output paneline yazar"""
+        text = self.trace_query_edit.text().strip()
+        if not text:
+            return
+        try:
+            self.log.info(self.cpu.trace_index.query(text, self.register_map))
+        except ValueError as e:
+            self.log.error(f"Error: {str(e)}")
+        self.log.info("-" * 40)
+        self.log.flush()
 
     def update_trace_display(self):
         self.trace_display.setText("".join(self.execution_trace))
@@ -985,9 +1230,12 @@ class MIPSSimulator(QMainWindow):
         )
 
 
-def main():
+def main(path=None):
     app = QApplication(sys.argv)
     window = MIPSSimulator()
+    if path:
+        with open(path, encoding="utf-8") as f:
+            window.assembly_editor.setPlainText(f.read())
     window.show()
     sys.exit(app.exec_())
 
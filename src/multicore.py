@@ -0,0 +1,284 @@
+"""Ortak data memory'yi paylaşan çok çekirdekli simülasyon.
+
+Her çekirdek kendi register'larına ve komut sayacına sahip bir
+MIPSCPU'dur; data_memory listesi tüm çekirdeklerde aynı nesnedir.
+Çekirdeklerin hangi sırayla çalışacağını bir zamanlayıcı belirler:
+sabit dilimli round-robin ya da tohumla tekrarlanabilir rastgele seçim.
+Her çekirdeğin $k0 register'ı çekirdek numarasıyla başlatılır, böylece
+aynı program çekirdeğe göre farklı işler yapabilir. Bir çekirdek
+breakpoint ya da watchpoint'te durursa run sebebini çekirdek numarasıyla
+döndürür; sonraki run o çekirdeği durduğu komuttan sürdürür.
+
+Birbirleriyle haberleşmeyen bağımsız programlar run_independent ile
+ayrı süreçlerde paralel çalıştırılabilir.
+"""
+import random
+from multiprocessing import Pool
+
+try:
+    from .cpu import BUDGET_EXHAUSTED, MIPSCPU
+    from .fingerprint import MemoryFingerprint, register_fingerprint, memory_fingerprint, system_fingerprint
+except ImportError:
+    from cpu import BUDGET_EXHAUSTED, MIPSCPU
+    from fingerprint import MemoryFingerprint, register_fingerprint, memory_fingerprint, system_fingerprint
+
+
+CORE_ID_REGISTER = "$k0"
+SCHEDULERS = ("round-robin", "random")
+
+
+class RoundRobinScheduler:
+    """Çalışabilir çekirdekleri sırayla quantum komutluk dilimlerle çalıştırır"""
+
+    def __init__(self, quantum=1):
+        if quantum < 1:
+            raise ValueError("Quantum must be at least 1")
+        self.quantum = quantum
+        self.last = -1
+
+    def reset(self):
+        self.last = -1
+
+    def next_slice(self, runnable):
+        """runnable: artan sıralı çekirdek numaraları -> (çekirdek, komut sayısı)"""
+        for core in runnable:
+            if core > self.last:
+                break
+        else:
+            core = runnable[0]
+        self.last = core
+        return core, self.quantum
+
+
+class RandomScheduler:
+    """Her dilimde rastgele bir çekirdek seçer; aynı tohum aynı sırayı üretir"""
+
+    def __init__(self, seed=0, quantum=1):
+        if quantum < 1:
+            raise ValueError("Quantum must be at least 1")
+        self.seed = seed
+        self.quantum = quantum
+        self.random = random.Random(seed)
+
+    def reset(self):
+        self.random = random.Random(self.seed)
+
+    def next_slice(self, runnable):
+        return self.random.choice(runnable), self.quantum
+
+
+def make_scheduler(name, quantum=1, seed=0):
+    if name == "round-robin":
+        return RoundRobinScheduler(quantum)
+    if name == "random":
+        return RandomScheduler(seed, quantum)
+    raise ValueError(f"Unknown scheduler: {name}")
+
+
+class CoreStats:
+    """Tek bir çekirdeğin yürütme istatistikleri"""
+
+    __slots__ = ("instructions", "slices", "finished_at")
+
+    def __init__(self):
+        self.instructions = 0
+        self.slices = 0
+        self.finished_at = None  # Çekirdek bittiğinde sistemin toplam adım sayısı
+
+    def as_dict(self):
+        return {
+            "instructions": self.instructions,
+            "slices": self.slices,
+            "finished_at": self.finished_at,
+        }
+
+
+class MultiCoreSystem:
+    """Ortak data memory'li çekirdekler ve zamanlayıcı"""
+
+    def __init__(self, cores=2, scheduler=None, log=None):
+        if cores < 1:
+            raise ValueError("At least one core is required")
+        self.scheduler = scheduler or RoundRobinScheduler()
+        self.cores = [MIPSCPU(log=log) for _ in range(cores)]
+        for core in self.cores:
+            core.trace_enabled = False
+        self.memory_fingerprint = None  # Açıkken tüm çekirdeklerin sw'lerinin güncellediği ortak parmak izi
+        self.reset()
+
+    @property
+    def data_memory(self):
+        return self.cores[0].data_memory
+
+    def reset(self):
+        """Çekirdekleri sıfırlar ve tek bir data memory'yi paylaştırır"""
+        memory = [0] * (self.cores[0].MEMORY_SIZE // self.cores[0].WORD_SIZE)
+        for number, core in enumerate(self.cores):
+            core.reset()
+            core.data_memory = memory
+            core.shared_memory = True
+            core.registers[core.register_map[CORE_ID_REGISTER]] = number
+            core.sync_fingerprint()
+        self.stats = [CoreStats() for _ in self.cores]
+        self.resuming = set()  # Breakpoint'te durmuş, sürdürülecek çekirdekler
+        self.stop_reason = None  # Son dilimin breakpoint/watchpoint sebebi
+        self.steps = 0
+        self.context_switches = 0
+        self.last_core = None
+        self.scheduler.reset()
+
+    def load_program(self, source, core=None):
+        """Programı bir çekirdeğe ya da (core None ise) tüm çekirdeklere yükler"""
+        targets = self.cores if core is None else [self.cores[core]]
+        for target in targets:
+            target.load_program(source)
+
+    def enable_fingerprint(self):
+        """Her çekirdekte, ortak bellek parmak izini paylaşan artımlı takibi açar"""
+        if self.memory_fingerprint is None:
+            self.memory_fingerprint = MemoryFingerprint(self.data_memory)
+            for core in self.cores:
+                core.enable_fingerprint(self.memory_fingerprint)
+
+    def disable_fingerprint(self):
+        self.memory_fingerprint = None
+        for core in self.cores:
+            core.disable_fingerprint()
+
+    def state_fingerprint(self):
+        """Tüm çekirdeklerin register'ları ve ortak belleğin parmak izi"""
+        if self.memory_fingerprint is not None:
+            registers = [core.fingerprint.registers for core in self.cores]
+            return system_fingerprint(registers, self.memory_fingerprint.value)
+        registers = [register_fingerprint(core.registers) for core in self.cores]
+        return system_fingerprint(registers, memory_fingerprint(self.data_memory))
+
+    def set_trace_enabled(self, enabled):
+        for core in self.cores:
+            core.trace_enabled = enabled
+
+    def halted(self, number):
+        core = self.cores[number]
+        return core.finished or core.last_error is not None
+
+    def runnable(self):
+        return [number for number in range(len(self.cores)) if not self.halted(number)]
+
+    @property
+    def finished(self):
+        return not self.runnable()
+
+    def share_breakpoints(self, manager):
+        """Tüm çekirdeklere aynı BreakpointManager'ı verir (aynı program, aynı indeksler)"""
+        for core in self.cores:
+            core.breakpoints = manager
+
+    def run_slice(self, number, steps, resume=False):
+        """Bir çekirdeği en fazla steps komut çalıştırır, yürütülen komut sayısını döndürür.
+
+        Breakpoint/watchpoint'te durulursa sebep stop_reason'a yazılır;
+        resume True ise (ya da çekirdek önceki dilimde durduysa) ilk
+        komuttaki breakpoint atlanır.
+        """
+        core = self.cores[number]
+        stats = self.stats[number]
+        if self.last_core is not None and number != self.last_core:
+            self.context_switches += 1
+        self.last_core = number
+        before = core.instruction_count
+        resume = resume or number in self.resuming
+        self.resuming.discard(number)
+        reason = core.run_limited(core.program_instructions, steps, resume=resume)
+        self.stop_reason = None
+        if reason is not None and reason != BUDGET_EXHAUSTED.format(steps):
+            self.stop_reason = f"Core {number}: {reason}"
+            self.resuming.add(number)
+        executed = core.instruction_count - before
+        stats.instructions += executed
+        stats.slices += 1
+        self.steps += executed
+        if self.halted(number) and stats.finished_at is None:
+            stats.finished_at = self.steps
+        return executed
+
+    def next_core(self):
+        """Zamanlayıcıdan sıradaki çekirdeği alır; hepsi bittiyse None"""
+        runnable = self.runnable()
+        if not runnable:
+            return None
+        return self.scheduler.next_slice(runnable)[0]
+
+    def step(self):
+        """Zamanlayıcının seçtiği çekirdekte tek komut yürütür; çekirdek numarasını döndürür"""
+        number = self.next_core()
+        if number is not None:
+            self.run_slice(number, 1, resume=True)
+        return number
+
+    def run(self, max_steps=None):
+        """Tüm çekirdekler bitene kadar çalıştırır; bütçe biterse sebebini döndürür"""
+        scheduler = self.scheduler
+        while True:
+            runnable = self.runnable()
+            if not runnable:
+                for core in self.cores:
+                    core.log.flush()
+                return None
+            if max_steps is not None and self.steps >= max_steps:
+                return BUDGET_EXHAUSTED.format(max_steps)
+            number, steps = scheduler.next_slice(runnable)
+            if max_steps is not None:
+                steps = min(steps, max_steps - self.steps)
+            executed = self.run_slice(number, steps)
+            if self.stop_reason is not None:
+                return self.stop_reason
+            if executed == 0 and not self.halted(number):
+                # Komut yürütmeden kalan çekirdek (ör. breakpoint) sonsuz döngüye sokmasın
+                return f"Core {number} made no progress"
+
+    def core_stats(self):
+        """Çekirdek başına istatistikler ve toplam adımdaki payları"""
+        report = []
+        for number, stats in enumerate(self.stats):
+            entry = stats.as_dict()
+            entry["core"] = number
+            entry["share"] = stats.instructions / self.steps if self.steps else 0.0
+            entry["error"] = self.cores[number].last_error
+            report.append(entry)
+        return report
+
+    def report(self):
+        lines = [f"Cores: {len(self.cores)}, steps: {self.steps}, context switches: {self.context_switches}"]
+        for entry in self.core_stats():
+            line = (f"Core {entry['core']}: {entry['instructions']} instructions "
+                    f"({entry['share']:.0%}), {entry['slices']} slices")
+            if entry["finished_at"] is not None:
+                line += f", finished at step {entry['finished_at']}"
+            if entry["error"]:
+                line += f", error: {entry['error']}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def run_instance(task):
+    """Süreç havuzu işçisi: bağımsız bir programı çalıştırır ve son durumunu döndürür"""
+    source, max_steps = task
+    cpu = MIPSCPU()
+    cpu.trace_enabled = False
+    cpu.load_program(source)
+    stop_reason = cpu.run(max_steps=max_steps)
+    return {
+        "registers": list(cpu.registers),
+        "data_memory": list(cpu.data_memory),
+        "fingerprint": cpu.state_fingerprint(),
+        "instruction_count": cpu.instruction_count,
+        "stop_reason": stop_reason,
+        "error": cpu.last_error,
+    }
+
+
+def run_independent(sources, workers=None, max_steps=None, chunksize=1):
+    """Haberleşmeyen programları ayrı süreçlerde çalıştırır; sonuçlar girdi sırasındadır"""
+    tasks = [(source, max_steps) for source in sources]
+    with Pool(workers) as pool:
+        return pool.map(run_instance, tasks, chunksize)
@@ -0,0 +1,225 @@
+from collections import deque
+
+
+STAGES = ("IF", "ID", "EX", "MEM", "WB")
+BRANCH_OPS = ("beq", "bne")
+JUMP_OPS = ("j", "jal", "jr")
+LOAD_OPS = ("lw",)
+BRANCH_POLICIES = ("flush", "stall", "predict")
+
+
+def register_operands(op, params, register_map):
+    """Komutun yazdığı register'ı ve okuduğu register'ları döndürür"""
+    def reg(name):
+        return register_map[name]
+
+    dest = None
+    srcs = ()
+    if op in ("add", "sub", "and", "or", "slt"):
+        dest = reg(params[0])
+        srcs = (reg(params[1]), reg(params[2]))
+    elif op in ("sll", "srl"):
+        dest = reg(params[0])
+        srcs = (reg(params[1]),)
+        if params[2] in register_map:
+            srcs += (reg(params[2]),)
+    elif op == "addi":
+        dest = reg(params[0])
+        srcs = (reg(params[1]),)
+    elif op in ("lw", "sw"):
+        base = params[1].split('(')[1].rstrip(')')
+        if op == "lw":
+            dest = reg(params[0])
+            srcs = (reg(base),)
+        else:
+            srcs = (reg(params[0]), reg(base))
+    elif op in BRANCH_OPS:
+        srcs = (reg(params[0]), reg(params[1]))
+    elif op == "jr":
+        srcs = (reg(params[0]),)
+    elif op == "jal":
+        dest = register_map["$ra"]
+
+    # $zero'a yazma donanımda etkisizdir, bağımlılık yaratmaz
+    if dest == 0:
+        dest = None
+    return dest, tuple(r for r in srcs if r != 0)
+
+
+class PipelineModel:
+    """Klasik 5 aşamalı (IF/ID/EX/MEM/WB) MIPS pipeline zamanlama modeli.
+
+    Fonksiyonel yürütmenin üzerine eklenir: her yürütülen komut için
+    issue() çağrılır ve komutun hangi cycle'da hangi aşamada olduğu
+    hesaplanır. Branch ve jump'lar ID aşamasında çözülür.
+
+    forwarding=False ise değer ancak üreten komutun WB aşamasında (ilk
+    yarıda yazma, ikinci yarıda okuma) kullanılabilir.
+    branch_policy="stall" her branch/jump sonrası bir bubble ekler,
+    "flush" ise not-taken tahmin eder ve yalnızca alınan branch'lerde
+    yanlış getirilen komutu temizler. "predict" verilen branch tahmincisini
+    kullanır; yalnızca yanlış tahmin edilen branch'ler ceza öder.
+    """
+
+    def __init__(self, forwarding=True, branch_policy="flush", diagram_depth=32, predictor=None):
+        if branch_policy not in BRANCH_POLICIES:
+            raise ValueError(f"Unknown branch policy: {branch_policy}")
+        if branch_policy == "predict" and predictor is None:
+            raise ValueError("The predict branch policy needs a branch predictor")
+        self.forwarding = forwarding
+        self.branch_policy = branch_policy
+        self.diagram_depth = diagram_depth
+        self.predictor = predictor
+        self.reset()
+
+    def reset(self):
+        self.instructions = 0
+        self.cycles = 0
+        self.load_use_stalls = 0
+        self.data_stalls = 0
+        self.control_stalls = 0
+        self.history = deque(maxlen=self.diagram_depth)
+        # Register -> (EX için hazır olduğu cycle, ID için hazır olduğu cycle, load mu)
+        self._ready = {}
+        self._last_if = 0
+        self._last_id = 1
+        self._next_fetch = 1
+        if self.predictor is not None:
+            self.predictor.reset()
+
+    def issue(self, op, dest, srcs, taken=False, text="", pc=0):
+        """Bir komutu pipeline'a sokar ve aşama cycle'larını döndürür"""
+        if_cycle = max(self._last_if + 1, self._next_fetch)
+        base_id = max(if_cycle + 1, self._last_id + 1)
+        id_cycle = base_id
+        from_load = False
+
+        # RAW bağımlılıkları: branch ve jr operandlarını ID aşamasında okur
+        needs_in_id = op in BRANCH_OPS or op == "jr"
+        for src in srcs:
+            ready = self._ready.get(src)
+            if ready is None:
+                continue
+            ex_ready, id_ready, is_load = ready
+            required = id_ready if needs_in_id else ex_ready - 1
+            if required > id_cycle:
+                id_cycle = required
+                from_load = is_load
+            elif required == id_cycle and is_load and id_cycle > base_id:
+                from_load = True
+
+        stall = id_cycle - base_id
+        if stall:
+            if from_load:
+                self.load_use_stalls += stall
+            else:
+                self.data_stalls += stall
+
+        ex_cycle = id_cycle + 1
+        mem_cycle = ex_cycle + 1
+        wb_cycle = mem_cycle + 1
+
+        if dest is not None:
+            is_load = op in LOAD_OPS
+            if self.forwarding:
+                produced = mem_cycle if is_load else ex_cycle
+                self._ready[dest] = (produced + 1, produced + 1, is_load)
+            else:
+                self._ready[dest] = (wb_cycle + 1, wb_cycle, is_load)
+
+        # Kontrol hazard'ı: hedef ID sonunda belli olur
+        if op in BRANCH_OPS:
+            if self.branch_policy == "stall":
+                penalty = True
+            elif self.branch_policy == "predict":
+                penalty = not self.predictor.record(pc, taken, text)
+            else:
+                penalty = taken
+        else:
+            penalty = op in JUMP_OPS
+
+        flushed = False
+        if penalty:
+            self._next_fetch = id_cycle + 1
+            self.control_stalls += 1
+            flushed = True
+
+        self._last_if = if_cycle
+        self._last_id = id_cycle
+        self.instructions += 1
+        self.cycles = max(self.cycles, wb_cycle)
+
+        slot = {
+            "text": text or op,
+            "IF": if_cycle, "ID": id_cycle, "EX": ex_cycle,
+            "MEM": mem_cycle, "WB": wb_cycle,
+            "stalls": id_cycle - if_cycle - 1,
+            "flushed": flushed,
+        }
+        self.history.append(slot)
+        return slot
+
+    @property
+    def total_stalls(self):
+        return self.load_use_stalls + self.data_stalls + self.control_stalls
+
+    @property
+    def cpi(self):
+        if not self.instructions:
+            return 0.0
+        return self.cycles / self.instructions
+
+    def stats(self):
+        return {
+            "instructions": self.instructions,
+            "cycles": self.cycles,
+            "cpi": self.cpi,
+            "load_use_stalls": self.load_use_stalls,
+            "data_stalls": self.data_stalls,
+            "control_stalls": self.control_stalls,
+            "forwarding": self.forwarding,
+            "branch_policy": self.branch_policy,
+        }
+
+    def report(self):
+        """Toplam cycle, CPI ve stall dağılımını metin olarak döndürür"""
+        return "\n".join([
+            "Pipeline Timing "
+            f"(forwarding {'on' if self.forwarding else 'off'}, {self.branch_policy} policy)",
+            f"Instructions: {self.instructions}",
+            f"Total cycles: {self.cycles}",
+            f"CPI: {self.cpi:.2f}",
+            f"Stalls: {self.total_stalls} "
+            f"(load-use {self.load_use_stalls}, data {self.data_stalls}, "
+            f"control {self.control_stalls})",
+        ])
+
+    def diagram(self, last=None):
+        """Son komutların pipeline diyagramını döndürür"""
+        slots = list(self.history)
+        if last is not None:
+            slots = slots[-last:]
+        if not slots:
+            return ""
+
+        first = slots[0]["IF"]
+        end = max(slot["WB"] for slot in slots)
+        width = max(len(slot["text"]) for slot in slots)
+        header = " " * width + " |" + "".join(f"{c:>4}" for c in range(first, end + 1))
+        lines = [header, "-" * len(header)]
+        for slot in slots:
+            cells = []
+            for cycle in range(first, end + 1):
+                cell = ""
+                if cycle == slot["IF"]:
+                    cell = "IF"
+                elif slot["IF"] < cycle < slot["ID"]:
+                    cell = "**"
+                else:
+                    for stage in STAGES[1:]:
+                        if cycle == slot[stage]:
+                            cell = stage
+                            break
+                cells.append(f"{cell:>4}")
+            lines.append(f"{slot['text']:<{width}} |" + "".join(cells))
+        return "\n".join(lines)
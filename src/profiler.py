@@ -0,0 +1,148 @@
+"""Simülatörün host süresini aşamalara göre bölen profil aracı.
+
+Profil açıkken ilgili metotlar nesne üzerinde zamanlayan sarmalayıcılarla
+gölgelenir; kapalıyken hiçbir ek maliyet yoktur. İç içe çağrılarda
+(ör. execute_instruction içinden add_to_trace) her aşamaya yalnızca
+kendi süresi yazılır, böylece aşamaların toplamı ölçülen süreyi aşmaz.
+İstenirse aynı aralık cProfile ile de kaydedilip pstats dosyasına
+yazılır.
+"""
+import cProfile
+from time import perf_counter
+
+
+PARSE = "parse"
+ENCODE = "encode"
+EXECUTE = "execute"
+TRACE = "trace"
+GUI = "gui"
+STAGES = (PARSE, ENCODE, EXECUTE, TRACE, GUI)
+
+# MIPSCPU metodu -> aşama
+CPU_STAGES = {
+    "assemble_sections": PARSE,
+    "assemble_path": PARSE,
+    "generate_machine_code": ENCODE,
+    "execute_instruction": EXECUTE,
+    "run_compiled": EXECUTE,
+    "add_to_trace": TRACE,
+}
+
+# MIPSSimulator metodu -> aşama
+GUI_STAGES = {
+    "fill_machine_code_table": GUI,
+    "highlight_instruction": GUI,
+    "populate_memory": GUI,
+    "populate_registers": GUI,
+    "update_trace_display": GUI,
+}
+
+
+class StageProfiler:
+    """Aşama başına süre ve çağrı sayaçları, toplam süre ve komut hızı"""
+
+    def __init__(self, cpu, profile_path=None):
+        self.profile_path = profile_path  # Verilirse cProfile istatistikleri buraya yazılır
+        self.cpu = cpu
+        self.baseline = 0
+        self.patched = []
+        self.stack = []  # Açık aşamalar: [başlangıç zamanı, iç aşamalarda geçen süre]
+        self.profile = None
+        self.started = None
+        self.times = dict.fromkeys(STAGES, 0.0)
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.elapsed = 0.0
+        self.instructions = 0
+        self.attach(cpu, CPU_STAGES)
+
+    def reset(self):
+        # Sarmalayıcılar sözlükleri yakaladığı için yerinde sıfırlanır
+        for stage in STAGES:
+            self.times[stage] = 0.0
+            self.calls[stage] = 0
+        self.elapsed = 0.0
+        self.instructions = 0
+
+#Metotların sarılması
+    def wrap(self, obj, name, stage):
+        """obj.name'i stage'e süre yazan bir sarmalayıcıyla gölgeler"""
+        method = getattr(obj, name)
+        times = self.times
+        calls = self.calls
+        stack = self.stack
+
+        def timed(*args, **kwargs):
+            frame = [perf_counter(), 0.0]
+            stack.append(frame)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - frame[0]
+                stack.pop()
+                times[stage] += elapsed - frame[1]
+                calls[stage] += 1
+                if stack:
+                    stack[-1][1] += elapsed
+
+        timed.__wrapped__ = method
+        setattr(obj, name, timed)
+        self.patched.append((obj, name))
+
+    def attach(self, obj, stages):
+        """stages (metot adı -> aşama) içindeki metotları ölçüme ekler"""
+        for name, stage in stages.items():
+            self.wrap(obj, name, stage)
+
+    def detach(self):
+        """Sarmalayıcıları kaldırır; metotlar yeniden sınıftakilere çözülür"""
+        self.stop()
+        for obj, name in reversed(self.patched):
+            delattr(obj, name)
+        self.patched = []
+
+#Ölçüm aralığı
+    def start(self):
+        """Sayaçları sıfırlar ve yeni bir ölçüm aralığı başlatır"""
+        self.reset()
+        self.baseline = self.cpu.instruction_count
+        if self.profile_path:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self.started = perf_counter()
+
+    def stop(self):
+        """Aralığı kapatır; cProfile açıksa istatistikleri dosyaya yazar"""
+        if self.started is None:
+            return
+        self.elapsed += perf_counter() - self.started
+        self.started = None
+        self.instructions = self.cpu.instruction_count - self.baseline
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile.dump_stats(self.profile_path)
+            self.profile = None
+
+    def breakdown(self):
+        """[(aşama, saniye, oran, çağrı)] ve aşamalara düşmeyen 'other' satırı"""
+        total = self.elapsed
+        rows = [(stage, self.times[stage], self.calls[stage]) for stage in STAGES]
+        rows.append(("other", max(total - sum(self.times.values()), 0.0), None))
+        return [(stage, seconds, seconds / total if total else 0.0, calls)
+                for stage, seconds, calls in rows]
+
+    @property
+    def instructions_per_second(self):
+        return self.instructions / self.elapsed if self.elapsed else 0.0
+
+    def report(self):
+        lines = [f"Profile: {self.elapsed * 1000:.3f} ms"]
+        for stage, seconds, share, calls in self.breakdown():
+            line = f"  {stage:<8}{seconds * 1000:>12.3f} ms{share:>8.1%}"
+            if calls is not None:
+                line += f"{calls:>10} calls"
+            lines.append(line)
+        lines.append(f"  {self.instructions} instructions, "
+                     f"{self.instructions_per_second:,.0f} instructions/s")
+        if self.profile_path:
+            lines.append(f"  cProfile stats: {self.profile_path}")
+        return "\n".join(lines)
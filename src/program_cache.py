@@ -0,0 +1,150 @@
+"""Assemble edilmiş programların diskte kalıcı önbelleği.
+
+Bir kayıt komutları, label tablosunu, .data kelimelerini, data
+label'larını, üretilmiş machine code'u ve çözülmüş (op, parametreler)
+komut kayıtlarını tutar; aynı kaynak yeniden
+yüklendiğinde ayrıştırma ve kodlama tamamen atlanır. Anahtar kaynağın
+ve simülatör sürümü gibi kodlamayı etkileyen bağlamın SHA-256
+özetidir; machine code yalnızca kaynağa bağlı olduğundan CPU durumu
+anahtara girmez. Her kayıt dizinde ayrı bir dosyadır; okunan kaydın değişme
+zamanı güncellenir ve toplam boyut max_bytes'ı aşınca en uzun süredir
+kullanılmayan kayıtlar silinir (LRU).
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import namedtuple
+
+
+CachedProgram = namedtuple("CachedProgram", "instructions labels data data_labels machine_code decoded")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+SUFFIX = ".program"
+
+
+def default_cache_dir():
+    """MIPS_CACHE_DIR ortam değişkeni ya da ~/.cache/mips-simulator"""
+    return os.environ.get("MIPS_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "mips-simulator"
+    )
+
+
+class ProgramCache:
+    """Dizin tabanlı, boyut sınırlı LRU program önbelleği"""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("Cache size limit must not be negative")
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def hasher(*context):
+        digest = hashlib.sha256()
+        for part in context:
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest
+
+    @classmethod
+    def key(cls, source, *context):
+        """Kaynak metninin (str ya da bytes) ve bağlamın anahtarı"""
+        digest = cls.hasher(*context)
+        digest.update(source.encode("utf-8") if isinstance(source, str) else source)
+        return digest.hexdigest()
+
+    @classmethod
+    def file_key(cls, path, *context, chunk_size=1 << 16):
+        """Dosyanın anahtarı; dosya parça parça okunarak özetlenir"""
+        digest = cls.hasher(*context)
+        with open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """Kaydı döndürür ve son kullanım zamanını günceller; yoksa None"""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = CachedProgram(*pickle.load(f))
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, TypeError, pickle.UnpicklingError):
+            # Yarım yazılmış ya da eski biçimli kayıt: sil ve yeniden üret
+            self.discard(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Kaydı atomik olarak yazar, sonra sınırı aşan eski kayıtları siler"""
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as f:
+                pickle.dump(tuple(entry), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            self.discard(temporary)
+            raise
+        self.evict()
+
+    def entries(self):
+        """(son kullanım zamanı, boyut, yol) listesi, en eskiden en yeniye"""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for item in scan:
+                if item.name.endswith(SUFFIX):
+                    try:
+                        stat = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        entries.sort()
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Toplam boyut max_bytes'a inene kadar en eski kayıtları siler"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self.discard(path)
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        for _, _, path in self.entries():
+            self.discard(path)
+
+    @staticmethod
+    def discard(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        entries = self.entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
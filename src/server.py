@@ -0,0 +1,369 @@
+"""Yerel asyncio JSON-RPC 2.0 simülasyon sunucusu.
+
+Her satır bir JSON-RPC isteği ya da yanıtıdır (newline-delimited JSON).
+Sunucu birbirinden bağımsız çok sayıda MIPSCPU oturumu tutar; uzun
+run istekleri bir süreç havuzunda çalıştırılır, böylece ağır bir oturum
+event loop'u ve diğer oturumları bekletmez.
+
+Metotlar (params isimli argümanlardır):
+
+    create_session()                          -> {"session": id}
+    close_session(session)
+    list_sessions()                           -> [id, ...]
+    load(session, source)                     -> {"instructions", "labels"}
+    step(session, count=1)                    -> durum özeti
+    run(session, max_steps=None)              -> durum özeti + stop_reason
+    registers(session)                        -> {"$t0": 5, ...}
+    memory(session, address=0, count=None)    -> [{"address", "value"}, ...]
+    checkpoint(session)                       -> {"checkpoint": n}
+    restore(session, checkpoint)              -> durum özeti
+    usage(session)                            -> kaynak kullanımı
+"""
+import asyncio
+import inspect
+import itertools
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .cpu import MIPSCPU
+except ImportError:
+    from cpu import MIPSCPU
+
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SESSION_ERROR = -32000
+
+# Bu kadar komuta kadar olan run/step istekleri event loop'ta çalışır
+INLINE_STEPS = 10000
+DEFAULT_MAX_STEPS = 10_000_000
+
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _run_in_worker(state, max_steps):
+    """Süreç havuzunda çalışır: durumu yükler, bütçeyle çalıştırır, yeni durumu döndürür"""
+    start = time.process_time()
+    cpu = MIPSCPU()
+    cpu.trace_enabled = False
+    cpu.restore(state)
+    steps_before = cpu.instruction_count
+    stop_reason = cpu.run(max_steps=max_steps)
+    return {
+        "state": cpu.snapshot(),
+        "stop_reason": stop_reason,
+        "error": cpu.last_error,
+        "steps": cpu.instruction_count - steps_before,
+        "cpu_time": time.process_time() - start,
+    }
+
+
+class Session:
+    """Tek bir istemci oturumu: CPU, checkpoint'ler ve kaynak sayaçları"""
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.cpu = MIPSCPU()
+        self.cpu.trace_enabled = False
+        self.lock = asyncio.Lock()
+        self.checkpoints = []
+        self.created = time.monotonic()
+        self.last_active = self.created
+        self.requests = 0
+        self.instructions = 0
+        self.cpu_time = 0.0
+        self.offloaded_runs = 0
+
+    def summary(self, stop_reason=None):
+        cpu = self.cpu
+        return {
+            "pc": cpu.current_instruction * cpu.WORD_SIZE,
+            "instruction_count": cpu.instruction_count,
+            "finished": cpu.finished,
+            "stop_reason": stop_reason,
+            "error": cpu.last_error,
+        }
+
+    def memory_bytes(self):
+        """Oturumun tuttuğu durumun yaklaşık boyutu"""
+        cpu = self.cpu
+        size = sys.getsizeof(cpu.registers) + sys.getsizeof(cpu.data_memory)
+        size += sum(sys.getsizeof(line) for line in cpu.program_instructions)
+        for state in self.checkpoints:
+            size += sys.getsizeof(state["registers"]) + sys.getsizeof(state["data_memory"])
+        return size
+
+    def usage(self):
+        now = time.monotonic()
+        return {
+            "requests": self.requests,
+            "instructions": self.instructions,
+            "cpu_time": round(self.cpu_time, 6),
+            "offloaded_runs": self.offloaded_runs,
+            "checkpoints": len(self.checkpoints),
+            "memory_bytes": self.memory_bytes(),
+            "age": round(now - self.created, 3),
+            "idle": round(now - self.last_active, 3),
+        }
+
+
+class SimulationServer:
+    """Oturumları yöneten ve JSON-RPC isteklerini dağıtan sunucu"""
+
+    def __init__(self, workers=None, max_sessions=256, inline_steps=INLINE_STEPS):
+        self.sessions = {}
+        self.max_sessions = max_sessions
+        self.inline_steps = inline_steps
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self._ids = itertools.count(1)
+        self._server = None
+        self._connections = set()
+        self.methods = {
+            "create_session": self.create_session,
+            "close_session": self.close_session,
+            "list_sessions": self.list_sessions,
+            "load": self.load,
+            "step": self.step,
+            "run": self.run,
+            "registers": self.registers,
+            "memory": self.memory,
+            "checkpoint": self.checkpoint,
+            "restore": self.restore,
+            "usage": self.usage,
+        }
+
+    # Bağlantı yönetimi
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """TCP (host/port) ya da Unix soketi (path) üzerinde dinlemeye başlar"""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_connection, path)
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def handle_connection(self, reader, writer):
+        """Her satırı ayrı bir task olarak işler; yanıtlar bitiş sırasıyla yazılır"""
+        pending = set()
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+
+        async def respond(line):
+            response = await self.handle_line(line)
+            if response is not None:
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, asyncio.CancelledError):
+            # Sunucu kapanırken bağlantı task'ları iptal edilir
+            for task in pending:
+                task.cancel()
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    async def handle_line(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self.error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if isinstance(request, list):
+            if not request:
+                return self.error_response(None, INVALID_REQUEST, "Invalid request: empty batch")
+            responses = [r for r in await asyncio.gather(*map(self.dispatch, request)) if r]
+            return responses or None
+        return await self.dispatch(request)
+
+    @staticmethod
+    def error_response(request_id, code, message):
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    async def dispatch(self, request):
+        """Tek bir isteği çalıştırır; bildirimler (id'siz) için None döndürür"""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self.error_response(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        params = request.get("params", {})
+        method = self.methods.get(request["method"])
+        try:
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "params must be an object")
+            try:
+                inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise RPCError(INVALID_PARAMS, str(e))
+            result = await method(**params)
+        except RPCError as e:
+            response = self.error_response(request_id, e.code, e.message)
+        except Exception as e:
+            response = self.error_response(request_id, INTERNAL_ERROR, str(e))
+        else:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        return response if "id" in request else None
+
+    # Oturumlar
+    def get_session(self, session):
+        if session not in self.sessions:
+            raise RPCError(SESSION_ERROR, f"Unknown session: {session}")
+        target = self.sessions[session]
+        target.requests += 1
+        target.last_active = time.monotonic()
+        return target
+
+    async def create_session(self):
+        if len(self.sessions) >= self.max_sessions:
+            raise RPCError(SESSION_ERROR, f"Session limit of {self.max_sessions} reached")
+        session_id = f"s{next(self._ids)}"
+        self.sessions[session_id] = Session(session_id)
+        return {"session": session_id}
+
+    async def close_session(self, session):
+        self.get_session(session)
+        del self.sessions[session]
+        return True
+
+    async def list_sessions(self):
+        return sorted(self.sessions)
+
+    # Program yükleme ve yürütme
+    async def load(self, session, source):
+        target = self.get_session(session)
+        if not isinstance(source, str):
+            raise RPCError(INVALID_PARAMS, "source must be a string")
+        async with target.lock:
+            target.cpu.reset()
+            try:
+                instructions = target.cpu.load_program(source)
+            except ValueError as e:
+                # AssemblyError da ValueError'dır; satır numaralı tanılamalar istemciye döner
+                raise RPCError(INVALID_PARAMS, str(e))
+            return {"instructions": len(instructions), "labels": target.cpu.labels}
+
+    async def step(self, session, count=1):
+        target = self.get_session(session)
+        if not isinstance(count, int) or count < 1:
+            raise RPCError(INVALID_PARAMS, "count must be a positive integer")
+        return await self.execute(target, count)
+
+    async def run(self, session, max_steps=None):
+        target = self.get_session(session)
+        if max_steps is None:
+            max_steps = DEFAULT_MAX_STEPS
+        if not isinstance(max_steps, int) or max_steps < 1:
+            raise RPCError(INVALID_PARAMS, "max_steps must be a positive integer")
+        return await self.execute(target, max_steps)
+
+    async def execute(self, target, max_steps):
+        """Kısa bütçeleri yerinde, uzunları süreç havuzunda çalıştırır"""
+        async with target.lock:
+            cpu = target.cpu
+            if not cpu.program_instructions:
+                raise RPCError(SESSION_ERROR, "No program loaded")
+            if max_steps <= self.inline_steps:
+                start = time.process_time()
+                before = cpu.instruction_count
+                cpu.last_error = None
+                stop_reason = cpu.run(max_steps=max_steps)
+                target.cpu_time += time.process_time() - start
+                target.instructions += cpu.instruction_count - before
+                return target.summary(stop_reason)
+
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self.executor, _run_in_worker, cpu.snapshot(), max_steps
+            )
+            cpu.restore(result["state"])
+            cpu.last_error = result["error"]
+            target.cpu_time += result["cpu_time"]
+            target.instructions += result["steps"]
+            target.offloaded_runs += 1
+            return target.summary(result["stop_reason"])
+
+    # Durum okuma ve checkpoint'ler
+    async def registers(self, session):
+        cpu = self.get_session(session).cpu
+        names = {index: name for name, index in cpu.register_names.items()}
+        return {names[i]: value for i, value in enumerate(cpu.registers)}
+
+    async def memory(self, session, address=0, count=None):
+        target = self.get_session(session)
+        cpu = target.cpu
+        if not isinstance(address, int) or not 0 <= address < cpu.MEMORY_SIZE:
+            raise RPCError(INVALID_PARAMS, f"address must be between 0 and {cpu.MEMORY_SIZE - 1}")
+        first = address // cpu.WORD_SIZE
+        available = len(cpu.data_memory) - first
+        if count is None:
+            count = available
+        elif not isinstance(count, int) or not 0 <= count <= available:
+            raise RPCError(INVALID_PARAMS, f"count must be between 0 and {available}")
+        # Bir run/restore ortasında yarım kalmış belleği okumamak için
+        async with target.lock:
+            words = cpu.data_memory[first:first + count]
+        return [{"address": (first + i) * cpu.WORD_SIZE, "value": value}
+                for i, value in enumerate(words)]
+
+    async def checkpoint(self, session):
+        target = self.get_session(session)
+        async with target.lock:
+            target.checkpoints.append(target.cpu.snapshot())
+            return {"checkpoint": len(target.checkpoints) - 1}
+
+    async def restore(self, session, checkpoint):
+        target = self.get_session(session)
+        async with target.lock:
+            if not isinstance(checkpoint, int) or not 0 <= checkpoint < len(target.checkpoints):
+                raise RPCError(INVALID_PARAMS, f"Unknown checkpoint: {checkpoint}")
+            target.cpu.restore(target.checkpoints[checkpoint])
+            return target.summary()
+
+    async def usage(self, session):
+        return self.get_session(session).usage()
+
+
+async def serve(host="127.0.0.1", port=8765, path=None, workers=None):
+    """Sunucuyu başlatır ve kapatılana kadar çalıştırır"""
+    server = SimulationServer(workers=workers)
+    listener = await server.start(host, port, path)
+    print(f"MIPS simulation server listening on {path or server.address}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
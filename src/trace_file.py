@@ -0,0 +1,251 @@
+import csv
+import gzip
+import struct
+from collections import namedtuple
+
+
+MAGIC = b"MIPSTRC2"
+# Başlangıç durumunu içermeyen eski biçim; hâlâ okunabilir
+LEGACY_MAGIC = b"MIPSTRC1"
+GZIP_MAGIC = b"\x1f\x8b"
+NO_REGISTER = 0xFF
+NO_MEMORY = 0xFFFF
+
+# Başlık: magic, register sayısı, kelime boyutu, program komut sayısı. Ardından
+# komut metinleri, başlangıç register'ları ve başlangıç data memory'si gelir
+HEADER = struct.Struct("<8sBBI")
+# Kayıt: step, pc, machine code, register (index, eski, yeni), bellek kelimesi (index, eski, yeni)
+RECORD = struct.Struct("<IIIBiiHii")
+
+TraceRecord = namedtuple(
+    "TraceRecord",
+    "step pc code register old_register new_register word old_word new_word",
+)
+
+CSV_FIELDS = (
+    "step", "pc", "instruction", "machine_code",
+    "register", "old_register", "new_register",
+    "address", "old_memory", "new_memory",
+)
+
+
+def _int32(value):
+    """Değeri işaretli 32 bitlik aralığa sarar"""
+    return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+class TraceWriter:
+    """Trace kayıtlarını sabit genişlikli ikili formatta diske akıtır.
+
+    Dosya bir başlık, programın komut metinleri (uzunluk önekli UTF-8),
+    trace başladığındaki register'lar ve data memory (kelime sayısı
+    önekli) ve ardından her yürütülen komut için RECORD.size baytlık bir
+    kayıttan oluşur. Kayıtlar sabit genişlikte olduğu için N. adımın konumu
+    hesaplanabilir. compress=True ise dosya gzip ile yazılır; bu durumda
+    okuma tarafında seek sıkıştırmayı baştan açarak ilerler.
+    """
+
+    def __init__(self, path, instructions, num_registers=32, word_size=4,
+                 compress=False, buffer_size=1 << 16, registers=None, memory=()):
+        self.path = path
+        self.records = 0
+        if compress:
+            self._file = gzip.open(path, "wb", compresslevel=6)
+        else:
+            self._file = open(path, "wb", buffering=buffer_size)
+        self._file.write(HEADER.pack(MAGIC, num_registers, word_size, len(instructions)))
+        for instruction in instructions:
+            text = instruction.encode("utf-8")
+            self._file.write(struct.pack("<H", len(text)) + text)
+        registers = [0] * num_registers if registers is None else registers
+        self._file.write(struct.pack(f"<{num_registers}i", *map(_int32, registers)))
+        self._file.write(struct.pack(f"<I{len(memory)}i", len(memory), *map(_int32, memory)))
+
+    def write(self, step, pc, code, register=NO_REGISTER, old_register=0, new_register=0,
+              word=NO_MEMORY, old_word=0, new_word=0):
+        self._file.write(RECORD.pack(
+            step, pc, code, register, _int32(old_register), _int32(new_register),
+            word, _int32(old_word), _int32(new_word),
+        ))
+        self.records += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TraceReader:
+    """TraceWriter dosyalarını tamamını belleğe almadan okur.
+
+    Sıkıştırılmış dosyalar ilk iki bayttan (gzip magic) tanınır.
+    Kayıtlar artan adım numaraları taşır; adımlar ardışıksa seek(step)
+    dosya konumunu doğrudan o adımın kaydına taşır, arada boşluk varsa
+    (ör. devam ettirilmiş bir run) kayıtlar üzerinde ikili arama yapar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.compressed = f.read(2) == GZIP_MAGIC
+        self._file = gzip.open(path, "rb") if self.compressed else open(path, "rb")
+        magic, self.num_registers, self.word_size, count = HEADER.unpack(
+            self._file.read(HEADER.size)
+        )
+        if magic not in (MAGIC, LEGACY_MAGIC):
+            raise ValueError(f"Not a MIPS trace file: {path}")
+        self.instructions = []
+        for _ in range(count):
+            (length,) = struct.unpack("<H", self._file.read(2))
+            self.instructions.append(self._file.read(length).decode("utf-8"))
+        # Trace başladığındaki durum; eski biçimde bilinmez (boş)
+        self.initial_registers = []
+        self.initial_memory = []
+        if magic == MAGIC:
+            size = 4 * self.num_registers
+            self.initial_registers = list(struct.unpack(f"<{self.num_registers}i", self._file.read(size)))
+            (words,) = struct.unpack("<I", self._file.read(4))
+            self.initial_memory = list(struct.unpack(f"<{words}i", self._file.read(4 * words)))
+        self._data_start = self._file.tell()
+        self._length = None
+        # Trace bir programın ortasında başlatılmış olabilir
+        first = self._read()
+        self.first_step = first.step if first is not None else 1
+        self._file.seek(self._data_start)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        if self._length is None:
+            if self.compressed:
+                # Sıkıştırılmış dosyada boyut yalnızca sonuna kadar açarak bulunur
+                position = self._file.tell()
+                end = self._file.seek(0, 2)
+                self._file.seek(position)
+            else:
+                end = self._file.seek(0, 2)
+                self._file.seek(self._data_start)
+            self._length = (end - self._data_start) // RECORD.size
+        return self._length
+
+    def seek(self, step):
+        """Okuma konumunu verilen adımın kaydına, adım yoksa ondan sonraki ilk kayda taşır"""
+        if step < self.first_step:
+            raise IndexError(f"Step {step} is not in the trace")
+        position = step - self.first_step
+        record = self._record_at(position)
+        if record is None or record.step != step:
+            # Adımlar ardışık değil: ilk step >= adım olan kaydı ikili aramayla bul
+            low, high = 0, len(self)
+            while low < high:
+                middle = (low + high) // 2
+                if self._record_at(middle).step < step:
+                    low = middle + 1
+                else:
+                    high = middle
+            position = low
+        self._file.seek(self._data_start + position * RECORD.size)
+
+    def _record_at(self, position):
+        """position'daki (0'dan başlar) kayıt; dosya sonundaysa None"""
+        self._file.seek(self._data_start + position * RECORD.size)
+        return self._read()
+
+    def _read(self):
+        data = self._file.read(RECORD.size)
+        if len(data) < RECORD.size:
+            return None
+        return TraceRecord(*RECORD.unpack(data))
+
+    def record(self, step):
+        """Tek bir adımın kaydını döndürür, yoksa IndexError"""
+        self.seek(step)
+        record = self._read()
+        if record is None or record.step != step:
+            raise IndexError(f"Step {step} is not in the trace")
+        return record
+
+    def records(self, start=None, stop=None):
+        """start..stop (dahil) adımlarını sırayla üretir"""
+        self.seek(self.first_step if start is None else max(start, self.first_step))
+        while True:
+            record = self._read()
+            if record is None or (stop is not None and record.step > stop):
+                return
+            yield record
+
+    def __iter__(self):
+        return self.records()
+
+    def instruction_text(self, record):
+        index = record.pc // self.word_size
+        if 0 <= index < len(self.instructions):
+            return self.instructions[index]
+        return "?"
+
+    def format_record(self, record, register_names=None):
+        """Kaydı GUI trace paneli ile aynı metin biçiminde döndürür"""
+        names = register_names or {}
+        if record.register != NO_REGISTER:
+            name = names.get(record.register, f"$r{record.register}")
+            register_changes = f"{name}: {record.old_register} -> {record.new_register}"
+        else:
+            register_changes = "No changes"
+        if record.word != NO_MEMORY:
+            memory_changes = (f"M[0x{record.word * self.word_size:03x}]: "
+                              f"{record.old_word} -> {record.new_word}")
+        else:
+            memory_changes = "No changes"
+        return (
+            f"Step {record.step}\n"
+            f"PC: 0x{record.pc:08x}\n"
+            f"Instruction: {self.instruction_text(record)}\n"
+            f"Machine Code: {record.code:032b}\n"
+            f"Register Changes: {register_changes}\n"
+            f"Memory Changes: {memory_changes}\n"
+            f"{'-'*50}\n"
+        )
+
+    def to_text(self, out, start=None, stop=None, register_names=None):
+        """Kayıtları metin olarak out'a yazar, yazılan kayıt sayısını döndürür"""
+        written = 0
+        for record in self.records(start, stop):
+            out.write(self.format_record(record, register_names))
+            written += 1
+        return written
+
+    def to_csv(self, out, start=None, stop=None, register_names=None):
+        """Kayıtları CSV olarak out'a yazar, yazılan kayıt sayısını döndürür"""
+        names = register_names or {}
+        writer = csv.writer(out)
+        writer.writerow(CSV_FIELDS)
+        written = 0
+        for record in self.records(start, stop):
+            has_register = record.register != NO_REGISTER
+            has_memory = record.word != NO_MEMORY
+            writer.writerow([
+                record.step,
+                f"0x{record.pc:08x}",
+                self.instruction_text(record),
+                f"0x{record.code:08x}",
+                names.get(record.register, f"$r{record.register}") if has_register else "",
+                record.old_register if has_register else "",
+                record.new_register if has_register else "",
+                f"0x{record.word * self.word_size:08x}" if has_memory else "",
+                record.old_word if has_memory else "",
+                record.new_word if has_memory else "",
+            ])
+            written += 1
+        return written
@@ -0,0 +1,176 @@
+import re
+from bisect import bisect_left, bisect_right
+
+try:
+    from .trace_file import NO_REGISTER, NO_MEMORY
+except ImportError:
+    from trace_file import NO_REGISTER, NO_MEMORY
+
+
+_QUERY = re.compile(r"^\s*(\$\w+|M\[\s*(?:0x[0-9a-fA-F]+|\d+)\s*\])\s*(?:(@|<)\s*(\d+))?\s*$")
+
+
+class _History:
+    """Tek bir register ya da bellek kelimesinin değişiklik geçmişi"""
+
+    __slots__ = ("steps", "olds", "news")
+
+    def __init__(self):
+        self.steps = []
+        self.olds = []
+        self.news = []
+
+    def append(self, step, old, new):
+        self.steps.append(step)
+        self.olds.append(old)
+        self.news.append(new)
+
+    def changes(self):
+        return list(zip(self.steps, self.olds, self.news))
+
+    def last_before(self, step):
+        """step'ten önceki son değişiklik (yoksa None)"""
+        i = bisect_left(self.steps, step)
+        if i == 0:
+            return None
+        return self.steps[i - 1], self.olds[i - 1], self.news[i - 1]
+
+    def value_at(self, step, default):
+        """step yürütüldükten sonraki değer"""
+        i = bisect_right(self.steps, step)
+        if i:
+            return self.news[i - 1]
+        if self.steps:
+            # İlk değişiklikten önce değer ilk kaydın eski değeridir
+            return self.olds[0]
+        return default
+
+
+class TraceIndex:
+    """Trace kayıtlarını register ve bellek adresine göre indeksler.
+
+    Her register ve bellek kelimesi için değişikliklerin adım
+    numaraları artan sırada tutulur; "N. adımdan önceki son yazma" ve
+    "N. adımdaki değer" sorguları bisect ile O(log n) sürer. Değeri
+    değiştirmeyen yazmalar trace'te delta üretmediği için indekse girmez.
+    Hiç değişmeyen konumların değeri trace başlangıcındaki durumdan
+    (seed) okunur; .data ve load_data belleği sıfırdan farklı başlatır.
+    """
+
+    def __init__(self, word_size=4):
+        self.word_size = word_size
+        self.clear()
+
+    def clear(self):
+        self.registers = {}
+        self.memory = {}
+        self.steps = 0
+        self.initial_registers = None
+        self.initial_memory = None
+
+    @property
+    def seeded(self):
+        return self.initial_registers is not None
+
+    def seed(self, registers, memory):
+        """Trace başlangıcındaki register'ları ve data memory'yi kaydeder"""
+        self.initial_registers = list(registers)
+        self.initial_memory = list(memory)
+
+    @staticmethod
+    def _initial(values, key):
+        if values is not None and 0 <= key < len(values):
+            return values[key]
+        return 0
+
+    def add(self, step, register=None, old_register=0, new_register=0,
+            word=None, old_word=0, new_word=0):
+        """Bir adımın register/bellek (kelime indeksi) değişikliğini ekler"""
+        if register is not None:
+            history = self.registers.get(register)
+            if history is None:
+                history = self.registers[register] = _History()
+            history.append(step, old_register, new_register)
+        if word is not None:
+            history = self.memory.get(word)
+            if history is None:
+                history = self.memory[word] = _History()
+            history.append(step, old_word, new_word)
+        self.steps = step
+
+    @classmethod
+    def from_reader(cls, reader):
+        """TraceReader ile okunan ikili trace dosyasından indeks kurar"""
+        index = cls(reader.word_size)
+        index.seed(reader.initial_registers, reader.initial_memory)
+        for record in reader:
+            index.add(
+                record.step,
+                None if record.register == NO_REGISTER else record.register,
+                record.old_register, record.new_register,
+                None if record.word == NO_MEMORY else record.word,
+                record.old_word, record.new_word,
+            )
+        return index
+
+    def _register(self, register):
+        return self.registers.get(register) or _History()
+
+    def _word(self, address):
+        return self.memory.get(address // self.word_size) or _History()
+
+    # Register sorguları
+    def register_changes(self, register):
+        """[(adım, eski, yeni), ...]"""
+        return self._register(register).changes()
+
+    def last_register_change(self, register, before_step=None):
+        if before_step is None:
+            before_step = self.steps + 1
+        return self._register(register).last_before(before_step)
+
+    def register_value(self, register, step, default=None):
+        if default is None:
+            default = self._initial(self.initial_registers, register)
+        return self._register(register).value_at(step, default)
+
+    # Bellek sorguları (byte adresi)
+    def memory_changes(self, address):
+        return self._word(address).changes()
+
+    def last_memory_change(self, address, before_step=None):
+        if before_step is None:
+            before_step = self.steps + 1
+        return self._word(address).last_before(before_step)
+
+    def memory_value(self, address, step, default=None):
+        if default is None:
+            default = self._initial(self.initial_memory, address // self.word_size)
+        return self._word(address).value_at(step, default)
+
+    def query(self, text, register_map):
+        """"$t2", "$s0 @ 120" (120. adımdaki değer) veya "M[0x40] < 300"
+        (300. adımdan önceki son değişiklik) sorgusunu metin olarak yanıtlar"""
+        match = _QUERY.match(text)
+        if not match:
+            raise ValueError(f"Invalid trace query: {text}")
+        target, op, step = match.groups()
+        if target.startswith("$"):
+            if target not in register_map:
+                raise ValueError(f"Unknown register: {target}")
+            key = register_map[target]
+            changes, last, value = self.register_changes, self.last_register_change, self.register_value
+        else:
+            key = int(target[2:-1].strip(), 0)
+            target = f"M[0x{key:03x}]"
+            changes, last, value = self.memory_changes, self.last_memory_change, self.memory_value
+
+        if op == "@":
+            return f"{target} at step {step}: {value(key, int(step))}"
+        if op == "<":
+            change = last(key, int(step))
+            if change is None:
+                return f"{target}: no change before step {step}"
+            return f"{target}: last change before step {step} at step {change[0]}: {change[1]} -> {change[2]}"
+        lines = [f"Step {s}: {target}: {old} -> {new}" for s, old, new in changes(key)]
+        return "\n".join(lines) if lines else f"{target}: no changes"
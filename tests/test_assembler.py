@@ -0,0 +1,121 @@
+import os
+import tempfile
+import time
+import unittest
+from MIPS.src.assembler import assemble_file, assemble_lines, check_source, data_words, tokenize_line
+from MIPS.src.cpu import MIPSCPU
+
+
+REGISTER_MAP = MIPSCPU().register_map
+
+
+class TestCheckSource(unittest.TestCase):
+    def messages(self, source):
+        return [(d.line, d.severity, d.message) for d in check_source(source, REGISTER_MAP).diagnostics]
+
+    def test_valid_program_matches_cpu_assemble(self):
+        source = """
+            # Döngü
+            addi $t0, $zero, 3
+        loop: addi $t0, $t0, -1
+            sw $t0, 4($sp)   # kaydet
+            bne $t0, $zero, loop
+            j end
+        end:
+        """
+        check = check_source(source, REGISTER_MAP)
+        self.assertEqual(check.diagnostics, [])
+        self.assertEqual((check.instructions, check.labels), MIPSCPU.assemble(source))
+        self.assertEqual(check.lines, [3, 4, 5, 6, 7])
+
+    def test_unknown_opcode_and_operand_count(self):
+        self.assertEqual(self.messages("ad $t0, $t1, $t2\nadd $t0, $t1"), [
+            (1, "error", "Unknown opcode 'ad'"),
+            (2, "error", "'add' expects 3 operands, got 2"),
+        ])
+
+    def test_bad_operands(self):
+        self.assertEqual(self.messages(
+            "add $t0, $t1, $t10\naddi $t0, $t0, x\nlw $t0, 4[$sp]\nsll $t0, $t0, 40\naddi $t0, $t0, 70000"
+        ), [
+            (1, "error", "Unknown register '$t10'"),
+            (2, "error", "Invalid immediate 'x'"),
+            (3, "error", "Invalid memory operand '4[$sp]', expected offset($reg)"),
+            (4, "warning", "Shift amount 40 is outside 0-31"),
+            (5, "warning", "Immediate 70000 does not fit in 16 bits"),
+        ])
+
+    def test_labels(self):
+        self.assertEqual(self.messages("beq $t0, $t1, later\nj missing\nlater:\nlater: jr $ra"), [
+            (2, "error", "Undefined label 'missing'"),
+            (4, "warning", "Duplicate label 'later'"),
+        ])
+
+    def test_data_section(self):
+        """.data direktifleri doğrulanır, data label'ları lw/sw'de adrese çevrilir"""
+        source = ".data\narr: .word 1, 2\nmsg: .asciiz \"a#b\"\n.text\nlw $t0, arr+4\nsw $t0, msg($t1)"
+        check = check_source(source, REGISTER_MAP)
+        self.assertEqual(check.diagnostics, [])
+        self.assertEqual(check.instructions, ["lw $t0, 4($zero)", "sw $t0, 8($t1)"])
+        self.assertEqual(check.lines, [5, 6])
+        self.assertEqual(self.messages(".data\n.word 1, x\n.space -1\n.asciiz abc\n.byte 1\n.text\nlw $t0, nothing"), [
+            (2, "error", "Invalid .word value 'x'"),
+            (3, "error", "Invalid .space size '-1'"),
+            (4, "error", "Invalid string literal abc"),
+            (5, "error", "Unknown directive '.byte'"),
+            (7, "error", "Invalid memory operand 'nothing', expected offset($reg)"),
+        ])
+
+    def test_data_words(self):
+        self.assertEqual(data_words(".word", "-1, 0xFFFFFFFF, 7"), [-1, -1, 7])
+        self.assertEqual(data_words(".space", "5"), [0, 0])
+        # Karakterler little-endian paketlenir, sonlandırıcı sıfır eklenir
+        self.assertEqual(data_words(".asciiz", '"abcd\\n"'), [0x64636261, 0x0A])
+        with self.assertRaises(ValueError):
+            data_words(".word", "0x100000000")
+
+
+class TestAssembler(unittest.TestCase):
+    def test_tokenize_line(self):
+        statement = tokenize_line('a: b:  SW $t0 , 4( $sp )  # yorum', 3)
+        self.assertEqual(statement.labels, ["a", "b"])
+        self.assertEqual((statement.line, statement.op, statement.operands), (3, "sw", ("$t0", "4($sp)")))
+        self.assertEqual(statement.text, "SW $t0 , 4( $sp )")
+        self.assertEqual(tokenize_line('s: .asciiz "x: #y"').operands, ('"x: #y"',))
+        self.assertIsNone(tokenize_line("   # sadece yorum"))
+
+    def test_multiple_labels_and_all_errors(self):
+        """Bir satırdaki tüm label'lar aynı komutu gösterir; hatalar ilk hatada durmaz"""
+        program = assemble_lines(["start: main: addi $t0, $zero, 1", "j main", ".word 3", "1x: add $t0"], REGISTER_MAP)
+        self.assertEqual(program.labels, {"start": 0, "main": 0, "1x": 2})
+        self.assertEqual(program.instructions, ["addi $t0, $zero, 1", "j main", "add $t0"])
+        self.assertEqual([(d.line, d.message) for d in program.diagnostics], [
+            (3, "Directive '.word' outside .data section"),
+            (4, "Invalid label '1x'"),
+            (4, "'add' expects 3 operands, got 1"),
+        ])
+
+    def test_assemble_file_streams_large_source(self):
+        """Büyük kaynak dosyadan satır satır, doğrusal sürede assemble edilir"""
+        handle, path = tempfile.mkstemp(suffix=".asm")
+        try:
+            with os.fdopen(handle, "w") as f:
+                f.write(".data\nbuf: .space 64\n.text\n")
+                for i in range(50000):
+                    f.write(f"l{i}: addi $t0, $t0, 1  # adım {i}\nsw $t0, buf+4\n")
+            start = time.perf_counter()
+            program = assemble_file(path, REGISTER_MAP)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.remove(path)
+        self.assertEqual(program.diagnostics, [])
+        self.assertEqual(len(program.instructions), 100000)
+        self.assertEqual(program.instructions[1], "sw $t0, 4($zero)")
+        self.assertEqual(program.lines[-1], 100003)
+        self.assertEqual(program.labels["l49999"], 99998)
+        # 100k satır ~0.5 s sürer; yavaş CI için geniş pay
+        self.assertLess(elapsed, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
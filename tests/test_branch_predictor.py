@@ -0,0 +1,73 @@
+import unittest
+from MIPS.src.branch_predictor import (
+    StaticPredictor, OneBitPredictor, TwoBitPredictor, GsharePredictor, make_predictor
+)
+from MIPS.src.pipeline import PipelineModel
+
+
+def loop_outcomes(iterations, repeats):
+    """Döngü branch'i: iterations - 1 kez alınır, sonra bir kez alınmaz"""
+    return ([True] * (iterations - 1) + [False]) * repeats
+
+
+class TestBranchPredictors(unittest.TestCase):
+    def run_predictor(self, predictor, outcomes, pc=0x10):
+        for taken in outcomes:
+            predictor.record(pc, taken, "bne $t0, $t1, loop")
+        return predictor
+
+    def test_static_predictors(self):
+        """Statik tahmincilerin doğruluğu"""
+        outcomes = loop_outcomes(4, 5)
+        taken = self.run_predictor(StaticPredictor(taken=True), outcomes)
+        not_taken = self.run_predictor(StaticPredictor(taken=False), outcomes)
+        self.assertEqual(taken.correct, 15)
+        self.assertEqual(not_taken.correct, 5)
+        self.assertEqual(taken.predictions, 20)
+
+    def test_one_bit_vs_two_bit(self):
+        """Döngü sonunda 1-bit iki kez, 2-bit bir kez yanılır"""
+        outcomes = loop_outcomes(10, 4)
+        one_bit = self.run_predictor(OneBitPredictor(), outcomes)
+        two_bit = self.run_predictor(TwoBitPredictor(), outcomes)
+        self.assertEqual(one_bit.mispredictions, 2 * 4)
+        self.assertEqual(two_bit.mispredictions, 2 + 1 * 3)
+        self.assertGreater(two_bit.accuracy, one_bit.accuracy)
+
+    def test_gshare_learns_alternating_pattern(self):
+        """gshare global geçmiş sayesinde değişen deseni öğrenir"""
+        outcomes = [True, False] * 50
+        gshare = self.run_predictor(GsharePredictor(table_size=16), outcomes)
+        two_bit = self.run_predictor(TwoBitPredictor(), outcomes)
+        self.assertGreater(gshare.accuracy, 0.9)
+        self.assertLess(two_bit.accuracy, 0.6)
+        with self.assertRaises(ValueError):
+            GsharePredictor(table_size=100)
+
+    def test_per_branch_statistics(self):
+        """Branch bazında istatistik ve rapor"""
+        predictor = TwoBitPredictor()
+        predictor.record(0x0, True, "beq $t0, $t1, a")
+        predictor.record(0x8, False, "bne $t0, $t1, b")
+        self.assertEqual(set(predictor.branches), {0x0, 0x8})
+        self.assertEqual(predictor.branch_accuracy(0x8), 1.0)
+        self.assertEqual(predictor.misprediction_cost(penalty=3), 3)
+        self.assertIn("0x00000008 bne $t0, $t1, b", predictor.report())
+
+    def test_make_predictor(self):
+        self.assertIsInstance(make_predictor("1bit"), OneBitPredictor)
+        self.assertEqual(make_predictor("gshare:1024").table_size, 1024)
+        self.assertEqual(make_predictor("static-not-taken").name, "static-not-taken")
+        with self.assertRaises(ValueError):
+            make_predictor("perceptron")
+
+    def test_pipeline_predict_policy(self):
+        """predict politikasında sadece yanlış tahminler ceza öder"""
+        model = PipelineModel(branch_policy="predict", predictor=StaticPredictor(taken=True))
+        for taken in loop_outcomes(5, 1):
+            model.issue("bne", None, (), taken=taken, pc=0x4)
+        self.assertEqual(model.control_stalls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
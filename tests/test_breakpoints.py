@@ -0,0 +1,106 @@
+import unittest
+from types import SimpleNamespace
+from MIPS.src.breakpoints import BreakpointManager, compile_condition
+
+
+REGISTERS = {"$zero": 0, "$t0": 8, "$t1": 9, "$r8": 8}
+
+
+class TestConditions(unittest.TestCase):
+    def setUp(self):
+        registers = [0] * 32
+        registers[8] = 10
+        registers[9] = 8
+        memory = [0] * 128
+        memory[16] = 3  # M[0x40]
+        memory[2] = 99  # M[8]
+        self.sim = SimpleNamespace(registers=registers, data_memory=memory)
+
+    def test_register_comparisons(self):
+        """Register ve sabit karşılaştırmaları"""
+        self.assertTrue(compile_condition("$t0 == 10", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("$t0>$t1", REGISTERS)(self.sim))
+        self.assertFalse(compile_condition("$r8 != 10", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("$t1 >= -1", REGISTERS)(self.sim))
+
+    def test_memory_operands_and_joiners(self):
+        """Bellek operandları ve and/or birleştirmeleri"""
+        self.assertTrue(compile_condition("M[0x40] == 3", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("M[$t1] == 99", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("$t0 == 10 && M[0x40] < 4", REGISTERS)(self.sim))
+        self.assertFalse(compile_condition("$t0 == 1 and $t1 == 8", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("$t0 == 1 || $t1 == 8", REGISTERS)(self.sim))
+
+    def test_memory_range(self):
+        """Bellek dışı sabit adresler reddedilir, bellek dışını gösteren M[$reg] yanlıştır"""
+        for expression in ("M[-4] == 0", "M[0x200] == 0"):
+            with self.assertRaises(ValueError):
+                compile_condition(expression, REGISTERS, memory_words=128)
+        with self.assertRaises(ValueError):
+            compile_condition("M[-4] == 0", REGISTERS)
+        self.assertTrue(compile_condition("M[0x1fc] == 0", REGISTERS, memory_words=128)(self.sim))
+        self.sim.registers[9] = 512
+        self.assertFalse(compile_condition("M[$t1] == 0", REGISTERS)(self.sim))
+        self.assertFalse(compile_condition("M[$t1] != 0", REGISTERS)(self.sim))
+        self.sim.registers[9] = -4
+        self.assertFalse(compile_condition("M[$t1] == 0", REGISTERS)(self.sim))
+        self.assertTrue(compile_condition("M[$t1] == 0 || $t0 == 10", REGISTERS)(self.sim))
+        with self.assertRaises(ValueError):
+            BreakpointManager(4, 128).add_breakpoint(0, "M[0x200] == 0", REGISTERS)
+
+    def test_invalid_conditions(self):
+        for expression in ("$t0", "$t0 = 1", "$t7 == 1", "$t0 == 1 &&", "$t0 == 1 xor $t1 == 2"):
+            with self.assertRaises(ValueError):
+                compile_condition(expression, REGISTERS)
+
+
+class TestBreakpointManager(unittest.TestCase):
+    def test_breakpoints(self):
+        """İndeks, adres ve label breakpoint'leri"""
+        manager = BreakpointManager()
+        self.assertFalse(manager)
+        manager.add_breakpoint(3)
+        manager.add_breakpoint("0x00000010")
+        manager.add_breakpoint("loop", condition="$t0 == 2", register_map=REGISTERS)
+        self.assertEqual(manager.breakpoints, {3, 4})
+        manager.resolve_labels({"loop": 7})
+        self.assertEqual(manager.breakpoints, {3, 4, 7})
+        self.assertEqual(manager.conditions[7][0], "$t0 == 2")
+        self.assertFalse(manager.toggle_breakpoint(3))
+        self.assertTrue(manager.toggle_breakpoint(3))
+
+    def test_label_breakpoints_follow_program(self):
+        """Label breakpoint'i kaldırılınca ve label yer değiştirince eski indeks temizlenir"""
+        manager = BreakpointManager()
+        manager.add_breakpoint("loop", condition="$t0 == 2", register_map=REGISTERS)
+        manager.add_breakpoint(0)
+        manager.resolve_labels({"loop": 1})
+        self.assertEqual(manager.breakpoints, {0, 1})
+        manager.resolve_labels({"loop": 2})
+        self.assertEqual(manager.breakpoints, {0, 2})
+        self.assertEqual(set(manager.conditions), {2})
+        manager.resolve_labels({"loop": 0})
+        manager.resolve_labels({"loop": 3})
+        self.assertEqual(manager.breakpoints, {0, 3})
+        manager.remove_breakpoint("loop")
+        self.assertEqual(manager.breakpoints, {0})
+        self.assertEqual(manager.conditions, {})
+        manager.resolve_labels({"loop": 3})
+        self.assertEqual(manager.breakpoints, {0})
+
+    def test_watchpoints(self):
+        """Register bitmask'i ve bellek kelime seti"""
+        manager = BreakpointManager()
+        manager.watch_register(8)
+        self.assertTrue(manager.is_register_watched(8))
+        self.assertFalse(manager.is_register_watched(9))
+        self.assertEqual(manager.register_mask, 1 << 8)
+        manager.watch_memory(0x40)
+        self.assertEqual(manager.memory_words, {16})
+        self.assertFalse(manager.toggle_memory_watch(0x40))
+        self.assertFalse(manager.toggle_register_watch(8))
+        self.assertFalse(manager)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from unittest import mock
+from MIPS.src import cpu as cpu_module
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.cfg import ControlFlowGraph, EXIT
+
+
+NESTED_PROGRAM = """
+    addi $s0, $zero, 3
+outer:
+    addi $t1, $zero, 2
+inner:
+    add $t2, $t2, $t3
+    addi $t1, $t1, -1
+    bne $t1, $zero, inner
+    addi $s0, $s0, -1
+    bne $s0, $zero, outer
+    jal func
+    j end
+    addi $t5, $zero, 1
+func:
+    sw $t2, 0($zero)
+    jr $ra
+end:
+"""
+
+
+def build(source):
+    cpu = MIPSCPU()
+    instructions, labels = cpu.assemble(source)
+    return ControlFlowGraph(instructions, labels, cpu.register_map)
+
+
+class TestControlFlowGraph(unittest.TestCase):
+    def setUp(self):
+        self.cfg = build(NESTED_PROGRAM)
+
+    def test_basic_blocks(self):
+        """Label'lar ve kontrol komutlarından sonraki komutlar blok başlatır"""
+        spans = [(block.start, block.end) for block in self.cfg.blocks]
+        self.assertEqual(spans, [(0, 1), (1, 2), (2, 5), (5, 7), (7, 8), (8, 9), (9, 10), (10, 12)])
+        self.assertEqual(self.cfg.blocks[2].labels, ["inner"])
+        self.assertEqual(self.cfg.blocks[2].successors, [2, 3])
+        # jal hedefe ve dönüş noktasına, jr dönüş noktalarına gider
+        self.assertEqual(self.cfg.blocks[4].successors, [7, 5])
+        self.assertEqual(self.cfg.blocks[7].successors, [5])
+        self.assertEqual(self.cfg.blocks[5].successors, [EXIT])
+
+    def test_reachability(self):
+        """Atlanan kod erişilemez olarak işaretlenir"""
+        self.assertEqual([block.id for block in self.cfg.unreachable_blocks], [6])
+        self.assertFalse(self.cfg.is_reachable(9))
+        self.assertTrue(self.cfg.is_reachable(10))
+
+    def test_loop_nesting(self):
+        """İç içe döngüler dominator tabanlı geri kenarlardan bulunur"""
+        loops = {loop.header: loop for loop in self.cfg.loops}
+        self.assertEqual(sorted(loops[1].blocks), [1, 2, 3])
+        self.assertEqual(loops[1].depth, 1)
+        self.assertEqual(sorted(loops[2].blocks), [2])
+        self.assertEqual(loops[2].depth, 2)
+        self.assertEqual(self.cfg.loop_depth(3), 2)
+        self.assertEqual(self.cfg.loop_depth(6), 1)
+        self.assertEqual(self.cfg.loop_depth(7), 0)
+        self.assertEqual(self.cfg.loop_ranges(), [(1, 1), (2, 4), (5, 6)])
+        self.assertTrue(self.cfg.dominates(1, 3))
+        self.assertFalse(self.cfg.dominates(3, 1))
+
+    def test_liveness(self):
+        """Bir komuttan önce canlı olan register'lar"""
+        names = self.cfg.register_map
+        self.assertEqual(self.cfg.live_registers(2),
+                         sorted(names[r] for r in ("$t1", "$t2", "$t3", "$s0")))
+        # sw yalnızca $t2'yi okur; jr $ra'yı
+        self.assertEqual(self.cfg.live_registers(10), sorted([names["$t2"], names["$ra"]]))
+
+    def test_diagnostics(self):
+        """Erişilemeyen kod ve yazılmadan okunan register'lar uyarılır"""
+        messages = [(d.line, d.message) for d in self.cfg.diagnostics()]
+        self.assertEqual(messages, [
+            (3, "Register $t3 is read before it is written"),
+            (10, "Unreachable code (1 instruction)"),
+        ])
+        # Kaynak satır numaraları verilebilir
+        self.assertEqual(self.cfg.diagnostics(lines=list(range(100, 112)))[0].line, 102)
+
+    def test_dot_export(self):
+        dot = self.cfg.to_dot()
+        self.assertTrue(dot.startswith("digraph cfg {"))
+        self.assertIn('B6 [label="B6 (0x00000024)\\laddi $t5, $zero, 1\\l", style=dashed];', dot)
+        self.assertIn("B2 -> B2;", dot)
+        self.assertIn("B5 -> exit;", dot)
+
+    def test_empty_program(self):
+        cfg = build("")
+        self.assertEqual(cfg.blocks, [])
+        self.assertEqual(cfg.diagnostics(), [])
+
+    def test_cpu_caches_graph(self):
+        """CPU program değişene kadar aynı CFG'yi döndürür"""
+        cpu = MIPSCPU()
+        cpu.load_program(NESTED_PROGRAM)
+        cfg = cpu.control_flow_graph()
+        self.assertIs(cpu.control_flow_graph(), cfg)
+        cpu.load_program("addi $t0, $zero, 1")
+        self.assertIsNot(cpu.control_flow_graph(), cfg)
+        self.assertEqual(len(cpu.control_flow_graph().blocks), 1)
+
+    def test_cpu_adopts_matching_graph(self):
+        """Yüklü programla aynı komut ve label'lardan kurulan CFG yeniden hesaplanmadan kullanılır"""
+        cpu = MIPSCPU()
+        cpu.load_program(NESTED_PROGRAM)
+        cfg = ControlFlowGraph(cpu.program_instructions, cpu.labels, cpu.register_map)
+        self.assertTrue(cpu.adopt_control_flow_graph(cfg))
+        self.assertIs(cpu.control_flow_graph(), cfg)
+        other = ControlFlowGraph(["addi $t0, $zero, 1"], {}, cpu.register_map)
+        self.assertFalse(cpu.adopt_control_flow_graph(other))
+        self.assertIs(cpu.control_flow_graph(), cfg)
+        # Fusion döngü gövdelerini bu CFG'den alır
+        cpu.trace_enabled = False
+        cpu.fusion_enabled = True
+        with mock.patch.object(cpu_module, "compile_program", wraps=cpu_module.compile_program) as compile_program:
+            cpu.run()
+        self.assertEqual(compile_program.call_args.kwargs["loops"], cfg.loop_ranges())
+        # Aynı program yeniden yüklenince CFG yeniden kurulur
+        cpu.load_program(NESTED_PROGRAM)
+        self.assertIsNot(cpu.control_flow_graph(), cfg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import MIPS.src as package
+from MIPS.src.cli import main
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(package.__file__))
+# Bytecode cache olmadan ölçülen import süresi ~30 ms; CI gürültüsü için geniş pay
+IMPORT_BUDGET = 0.25
+
+
+def run_cli(*argv):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        status = main(list(argv))
+    return status, output.getvalue()
+
+
+class TestHeadlessImport(unittest.TestCase):
+    def test_cli_does_not_import_qt(self):
+        """CLI ve çekirdek PyQt5'i yüklemez"""
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import src.cli\n"
+            "print(time.perf_counter() - start)\n"
+            "print(any(name.startswith('PyQt5') for name in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        )
+        elapsed, qt_loaded = result.stdout.split()
+        self.assertEqual(qt_loaded, "False")
+        self.assertLess(float(elapsed), IMPORT_BUDGET)
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".asm")
+        with os.fdopen(handle, "w") as f:
+            f.write("addi $t0, $zero, 3\nloop:\naddi $t0, $t0, -1\nsw $t0, 4($zero)\nbne $t0, $zero, loop\n")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_run(self):
+        status, output = run_cli("run", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("Executed 10 instructions", output)
+        self.assertNotIn("$t0", output)  # Sıfır register'lar yazılmaz
+
+    def test_run_with_data_file(self):
+        data = self.path + ".csv"
+        with open(data, "w") as f:
+            f.write("5,6\n")
+        try:
+            status, output = run_cli("run", "--data", data, "--data-address", "0x10", self.path)
+            self.assertEqual(status, 0)
+            self.assertIn("0x00000014           6", output)
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(run_cli("run", "--data", data, "--data-address", "510", self.path)[0], 1)
+        finally:
+            os.remove(data)
+
+    def test_run_with_program_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            run_cli("run", "--cache", directory, self.path)
+            status, output = run_cli("run", "--cache", directory, self.path)
+            self.assertEqual(status, 0)
+            self.assertIn("Executed 10 instructions", output)
+            self.assertIn("Program cache: 1 hits, 0 misses, 1 entries", output)
+        finally:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+    def test_run_with_profile(self):
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            status, output = run_cli("run", "--profile", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("Executed 10 instructions", output)
+        self.assertIn("  execute ", errors.getvalue())
+        self.assertIn("10 instructions,", errors.getvalue())
+
+    def test_run_fingerprint(self):
+        status, output = run_cli("run", "--fingerprint", self.path)
+        self.assertEqual(status, 0)
+        fingerprint = output.split("State fingerprint: ")[1].split()[0]
+        status, output = run_cli("run", "--fusion", "--expect-fingerprint", fingerprint, self.path)
+        self.assertEqual(status, 0)
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            status, output = run_cli("run", "--expect-fingerprint", "0x1", self.path)
+        self.assertEqual(status, 1)
+        self.assertIn("does not match expected 0x0000000000000001", errors.getvalue())
+
+    def test_run_detect_loops(self):
+        with open(self.path, "w") as f:
+            f.write("loop:\naddi $t0, $zero, 1\nj loop\n")
+        status, output = run_cli("run", "--detect-loops", "50", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("Paused: State repeated at step 3 (also at step 1, cycle of 2 steps): infinite loop", output)
+
+    def test_cfg(self):
+        status, output = run_cli("cfg", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("B1  0x00000004-0x0000000c  loop  -> B1, exit  loop depth 1", output)
+        status, output = run_cli("cfg", "--dot", self.path)
+        self.assertIn("B1 -> B1;", output)
+
+    def test_run_with_breakpoint(self):
+        status, output = run_cli("run", "--fusion", "--break", "0x0000000c", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("Paused: Breakpoint at 0x0000000c", output)
+        self.assertIn("$t0", output)
+
+    def test_assemble(self):
+        status, output = run_cli("assemble", "--hex", self.path)
+        self.assertEqual(status, 0)
+        self.assertEqual(output.splitlines()[0], "0x00000000  0x20080003  addi $t0, $zero, 3")
+
+    def test_assemble_reports_all_errors(self):
+        with open(self.path, "w") as f:
+            f.write("add $t0, $t1\nj nowhere\naddi $t0, $t0, 1\n")
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            status, output = run_cli("assemble", self.path)
+        self.assertEqual(status, 1)
+        self.assertEqual(output, "")
+        self.assertEqual(errors.getvalue().splitlines(), [
+            "Line 1: error: 'add' expects 3 operands, got 2",
+            "Line 2: error: Undefined label 'nowhere'",
+        ])
+
+    def test_run_rejects_invalid_program(self):
+        with open(self.path, "w") as f:
+            f.write("foo $t0\naddi $t0, $zz, 1\nj nowhere\n")
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            status, output = run_cli("run", self.path)
+        self.assertEqual(status, 1)
+        self.assertEqual(output, "")
+        self.assertEqual(errors.getvalue().splitlines(), [
+            "Error: Line 1: Unknown opcode 'foo'",
+            "Line 2: Unknown register '$zz'",
+            "Line 3: Undefined label 'nowhere'",
+        ])
+
+    def test_trace(self):
+        status, output = run_cli("trace", self.path)
+        self.assertEqual(status, 0)
+        self.assertIn("Step 10", output)
+        self.assertIn("Program completed in 10 steps", output)
+
+    def test_binary_trace_and_dump(self):
+        trace_path = self.path + ".trace"
+        try:
+            status, output = run_cli("trace", "--output", trace_path, self.path)
+            self.assertEqual(status, 0)
+            self.assertIn("Wrote 10 trace records", output)
+            status, output = run_cli("dump", "--csv", "--start", "10", trace_path)
+            self.assertEqual(status, 0)
+            self.assertEqual(len(output.splitlines()), 2)
+            self.assertIn("bne $t0, $zero, loop", output)
+        finally:
+            os.remove(trace_path)
+
+    def test_missing_file(self):
+        status, _ = run_cli("run", self.path + ".missing")
+        self.assertEqual(status, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
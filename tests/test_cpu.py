@@ -0,0 +1,235 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.assembler import AssemblyError
+
+
+LOOP_PROGRAM = """
+    addi $t0, $zero, 0
+    addi $t1, $zero, 4
+loop:
+    addi $t0, $t0, 1
+    sw $t0, 8($zero)
+    bne $t0, $t1, loop
+"""
+
+
+class TestMIPSCPU(unittest.TestCase):
+    def setUp(self):
+        self.messages = []
+        self.cpu = MIPSCPU(log=self.messages.append)
+
+    def test_run_without_gui(self):
+        """Çekirdek Qt olmadan programı çalıştırır"""
+        self.cpu.load_program(LOOP_PROGRAM)
+        self.assertIsNone(self.cpu.run())
+        self.assertTrue(self.cpu.finished)
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t0"]], 4)
+        self.assertEqual(self.cpu.data_memory[2], 4)
+        self.assertEqual(self.cpu.instruction_count, 14)
+        self.assertIn("Program completed in 14 steps", self.cpu.execution_trace[-1])
+        self.assertIsNone(self.cpu.last_error)
+
+    def test_load_program_generates_machine_code(self):
+        instructions = self.cpu.load_program(LOOP_PROGRAM)
+        self.assertEqual(len(instructions), 5)
+        self.assertEqual(self.cpu.labels, {"loop": 2})
+        self.assertEqual(self.cpu.machine_code[0], "00100000000010000000000000000000")
+
+    def test_step(self):
+        self.cpu.load_program(LOOP_PROGRAM)
+        self.cpu.step()
+        self.cpu.step()
+        self.assertEqual(self.cpu.current_instruction, 2)
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t1"]], 4)
+
+    def test_error_is_logged(self):
+        """Yürütme hatası log'a yazılır ve last_error'da tutulur"""
+        # Doğrulanmadan yüklenen program: hata ancak yürütmede ortaya çıkar
+        self.cpu.load_assembled(["addi $t0, $zero, 1", "j nowhere", "addi $t1, $zero, 1"], {}, [], {})
+        self.cpu.run()
+        self.assertIn("j nowhere", self.cpu.last_error)
+        self.assertTrue(any("Error executing" in message for message in self.messages))
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t1"]], 0)
+
+    def test_run_with_step_budget(self):
+        self.cpu.load_program(LOOP_PROGRAM)
+        reason = self.cpu.run(max_steps=4)
+        self.assertEqual(reason, "Step budget of 4 instructions exhausted")
+        self.assertEqual(self.cpu.instruction_count, 4)
+        self.assertIsNone(self.cpu.run(max_steps=100))
+        self.assertTrue(self.cpu.finished)
+        self.assertEqual(self.cpu.instruction_count, 14)
+
+    def test_run_until_and_run_to(self):
+        """Koşul ya da hedef komut bir komuttan sonra sağlanınca durulur"""
+        self.cpu.load_program(LOOP_PROGRAM)
+        self.assertEqual(self.cpu.run_until("$t0 == 2"), "Condition met: $t0 == 2")
+        self.assertEqual(self.cpu.current_instruction, 3)
+        self.assertEqual(self.cpu.run_to("loop"), "Reached 0x00000008: addi $t0, $t0, 1")
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t0"]], 2)
+        # Mevcut komut hedefse döngü bir tur dönülür
+        self.cpu.run_to(2)
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t0"]], 3)
+        self.assertEqual(self.cpu.run_until("M[8] == 9", max_steps=2),
+                         "Step budget of 2 instructions exhausted")
+        self.assertIsNone(self.cpu.run_until(lambda cpu: False))
+        self.assertTrue(self.cpu.finished)
+        with self.assertRaises(ValueError):
+            self.cpu.run_to(99)
+        with self.assertRaises(ValueError):
+            self.cpu.run_until("$t0 =")
+
+    def test_snapshot_and_restore(self):
+        self.cpu.load_program(LOOP_PROGRAM)
+        self.cpu.run(max_steps=5)
+        state = self.cpu.snapshot()
+        self.cpu.run()
+        other = MIPSCPU()
+        other.restore(state)
+        self.assertEqual(other.current_instruction, 2)
+        self.assertEqual(other.data_memory[2], 1)
+        other.run()
+        self.assertEqual(other.registers, self.cpu.registers)
+        self.assertEqual(other.instruction_count, 14)
+
+    def test_reset(self):
+        self.cpu.load_program(LOOP_PROGRAM)
+        self.cpu.run()
+        self.cpu.reset()
+        self.assertEqual(list(self.cpu.registers), [0] * 32)
+        self.assertEqual(len(self.cpu.data_memory), 128)
+        self.assertEqual(self.cpu.program_instructions, [])
+        self.assertEqual(self.cpu.instruction_count, 0)
+
+
+    def test_data_section(self):
+        """.data bölümü yüklemede belleğe kopyalanır, label'lar lw/sw'de kullanılır"""
+        self.cpu.load_program("""
+            .data
+            values: .word 3, 4, 5
+            total:  .space 4
+            name:   .asciiz "MIPS"
+            .text
+                lw $t0, values
+                lw $t1, values+4
+                lw $t2, values+8
+                add $t3, $t0, $t1
+                add $t3, $t3, $t2
+                sw $t3, total
+                addi $t4, $zero, 4
+                lw $t5, name($zero)
+        """)
+        self.assertEqual(self.cpu.data_memory[:6], [3, 4, 5, 0, 0x5350494D, 0])
+        self.assertEqual(self.cpu.data_labels, {"values": 0, "total": 12, "name": 16})
+        self.assertEqual(len(self.cpu.program_instructions), 8)
+        self.cpu.run()
+        self.assertEqual(self.cpu.data_memory[3], 12)
+        self.assertEqual(self.cpu.registers[self.cpu.register_map["$t5"]], 0x5350494D)
+
+        with self.assertRaises(ValueError):
+            self.cpu.load_program(".data\n.space 600")
+        with self.assertRaises(ValueError):
+            MIPSCPU.assemble(".data\n.word x")
+
+    def test_bulk_data_files(self):
+        """Binary ve CSV dosyaları data memory'ye tek kopyayla yüklenir"""
+        directory = tempfile.mkdtemp()
+        binary = os.path.join(directory, "values.bin")
+        with open(binary, "wb") as f:
+            f.write(struct.pack("<3i", 7, -2, 0x12345678))
+        table = os.path.join(directory, "values.csv")
+        with open(table, "w") as f:
+            f.write("1, 2\n0x10,0xFFFFFFFF\n")
+        try:
+            self.assertEqual(self.cpu.load_data_file(binary), 3)
+            self.assertEqual(self.cpu.data_memory[:3], [7, -2, 0x12345678])
+            self.cpu.load_data_file(table, address=8)
+            self.assertEqual(self.cpu.data_memory[:6], [7, -2, 1, 2, 16, -1])
+            with self.assertRaises(ValueError):
+                self.cpu.load_data_file(table, address=6)
+            with self.assertRaises(ValueError):
+                self.cpu.load_data_file(table, address=504)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_32bit_register_file(self):
+        """Her yazma 32 bite sarılır, $zero değişmez, srl mantıksaldır; motorlar aynı sonucu verir"""
+        source = """
+            addi $t0, $zero, 1
+            sll $t0, $t0, 31
+            sub $t1, $t0, $t0
+            addi $t1, $t1, -1
+            srl $t2, $t1, 28
+            sub $t3, $t0, $t2
+            addi $t4, $zero, 33
+            sll $t5, $t2, $t4
+            addi $zero, $zero, 5
+            lw $zero, 0($zero)
+            addi $t6, $zero, 1
+        loop:
+            sll $t6, $t6, 1
+            addi $t7, $t7, 1
+            slt $t8, $t7, $t4
+            bne $t8, $zero, loop
+        """
+        results = []
+        for fusion in (False, True):
+            cpu = MIPSCPU()
+            cpu.trace_enabled = False
+            cpu.fusion_enabled = fusion
+            cpu.data_memory[0] = 9
+            cpu.load_program(source)
+            cpu.run()
+            results.append(list(cpu.registers))
+        self.assertEqual(results[0], results[1])
+        registers = dict(zip(["$t0", "$t1", "$t2", "$t3", "$t5", "$t6", "$zero"], [
+            -0x80000000, -1, 15, 0x7FFFFFF1, 30, 0, 0,
+        ]))
+        for name, value in registers.items():
+            self.assertEqual(results[0][self.cpu.register_map[name]], value, name)
+        self.assertEqual(self.cpu.registers.itemsize, 4)
+
+    def test_load_file(self):
+        """Kaynak dosyadan akışla yüklenir; satır başına birden fazla label ve satır içi yorum"""
+        handle, path = tempfile.mkstemp(suffix=".asm")
+        with os.fdopen(handle, "w") as f:
+            f.write("start: main: addi $t0, $zero, 2  # sayaç\nloop: addi $t0, $t0, -1\nbne $t0, $zero, loop\n")
+        try:
+            self.assertEqual(len(self.cpu.load_file(path)), 3)
+        finally:
+            os.remove(path)
+        self.assertEqual(self.cpu.labels, {"start": 0, "main": 0, "loop": 1})
+        self.assertEqual(self.cpu.program_instructions[0], "addi $t0, $zero, 2")
+        self.cpu.run()
+        self.assertEqual(self.cpu.instruction_count, 5)
+        with self.assertRaises(ValueError) as context:
+            MIPSCPU.assemble(".data\n.word x\n.word 1\n.space y")
+        self.assertEqual(str(context.exception), "Line 2: Invalid .word value 'x'\nLine 4: Invalid .space size 'y'")
+
+    def test_load_program_validates_all_lines(self):
+        """Opcode, register ve label hataları yüklemede, satır numaralarıyla birlikte raporlanır"""
+        with self.assertRaises(AssemblyError) as context:
+            self.cpu.load_program("foo $t0\naddi $t0, $zz, 1\nj nowhere")
+        self.assertEqual(str(context.exception), "Line 1: Unknown opcode 'foo'\n"
+                                                 "Line 2: Unknown register '$zz'\n"
+                                                 "Line 3: Undefined label 'nowhere'")
+        self.assertEqual(self.cpu.program_instructions, [])
+
+    def test_label_breakpoint_moves_on_reload(self):
+        """Düzenlenen program yeniden yüklenince label breakpoint'i yalnızca yeni yerinde durur"""
+        self.cpu.breakpoints.add_breakpoint("loop")
+        self.cpu.load_program("addi $t0, $zero, 1\nloop: addi $t0, $t0, -1")
+        self.assertEqual(self.cpu.breakpoints.breakpoints, {1})
+        self.cpu.load_program("loop: addi $t0, $t0, -1\naddi $t0, $zero, 1")
+        self.assertEqual(self.cpu.breakpoints.breakpoints, {0})
+        self.cpu.breakpoints.remove_breakpoint("loop")
+        self.assertIsNone(self.cpu.run())
+        self.assertEqual(self.cpu.instruction_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
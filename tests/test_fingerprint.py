@@ -0,0 +1,97 @@
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.fingerprint import MEMORY_BASE, StateFingerprint, contribution, state_fingerprint
+from MIPS.src.fuzz import generate_program
+
+
+PROGRAM = """
+    addi $t0, $zero, 5
+loop:
+    addi $t0, $t0, -1
+    sll $t1, $t0, 2
+    sw $t0, 0($t1)
+    bne $t0, $zero, loop
+    addi $t2, $zero, -1
+"""
+
+
+class TestStateFingerprint(unittest.TestCase):
+    def test_zero_state_and_locations(self):
+        self.assertEqual(state_fingerprint([0] * 32, [0] * 128), 0)
+        self.assertEqual(contribution(8, -1), contribution(8, 0xFFFFFFFF))
+        # Aynı değer register'da ve bellekte farklı katkı yapar
+        self.assertNotEqual(contribution(8, 7), contribution(MEMORY_BASE + 8, 7))
+        self.assertNotEqual(state_fingerprint([0, 1, 2], []), state_fingerprint([0, 2, 1], []))
+
+    def test_incremental_updates(self):
+        registers, memory = [0] * 32, [0] * 128
+        fingerprint = StateFingerprint(registers, memory)
+        for index, value in ((8, 3), (9, -4), (8, 0), (8, 12)):
+            fingerprint.write_register(index, registers[index], value)
+            registers[index] = value
+        fingerprint.write_memory(5, memory[5], 99)
+        memory[5] = 99
+        self.assertEqual(fingerprint.value, state_fingerprint(registers, memory))
+
+    def test_cpu_tracking_matches_full_hash(self):
+        """Her motorda artımlı parmak izi baştan hesaplananla aynıdır"""
+        for fusion in (False, True):
+            cpu = MIPSCPU()
+            cpu.trace_enabled = False
+            cpu.fusion_enabled = fusion
+            cpu.enable_fingerprint()
+            cpu.load_program(".data\nv: .word 7, -2\n.text\n" + PROGRAM)
+            self.assertEqual(cpu.state_fingerprint(), state_fingerprint(cpu.registers, cpu.data_memory))
+            cpu.run()
+            expected = state_fingerprint(cpu.registers, cpu.data_memory)
+            self.assertNotEqual(expected, 0)
+            self.assertEqual(cpu.state_fingerprint(), expected)
+            state = cpu.snapshot()
+            cpu.reset()
+            self.assertEqual(cpu.state_fingerprint(), 0)
+            cpu.restore(state)
+            self.assertEqual(cpu.state_fingerprint(), expected)
+
+    def test_runs_compare_by_fingerprint(self):
+        """Aynı son durum aynı, farklı son durum farklı parmak izi verir"""
+        fingerprints = []
+        for seed in range(3):
+            cpu = MIPSCPU()
+            cpu.trace_enabled = False
+            cpu.load_program(generate_program(seed))
+            cpu.run()
+            fingerprints.append((cpu.state_fingerprint(), list(cpu.registers), list(cpu.data_memory)))
+            tracked = MIPSCPU()
+            tracked.trace_enabled = False
+            tracked.enable_fingerprint()
+            tracked.load_program(generate_program(seed))
+            tracked.run()
+            self.assertEqual(tracked.state_fingerprint(), fingerprints[-1][0])
+        self.assertEqual(len({f[0] for f in fingerprints}), len({repr(f[1:]) for f in fingerprints}))
+
+    def test_run_until_repeat(self):
+        cpu = MIPSCPU()
+        cpu.trace_enabled = False
+        cpu.load_program("addi $t0, $zero, 3\nloop:\naddi $t1, $t0, 1\nsw $t1, 0($zero)\nj loop")
+        reason = cpu.run_until_repeat(max_steps=100)
+        self.assertEqual(reason, "State repeated at step 6 (also at step 3, cycle of 3 steps): infinite loop")
+        self.assertIsNone(cpu.fingerprint)
+        # Uzun bir girişten sonraki döngü de sabit bellekle bulunur
+        cpu = MIPSCPU()
+        cpu.trace_enabled = False
+        cpu.load_program("addi $t3, $zero, 8\naddi $t0, $zero, 500\nwarm: addi $t0, $t0, -1\n"
+                         "bne $t0, $zero, warm\nspin: addi $t1, $t1, 1\nbne $t1, $t3, spin\n"
+                         "addi $t1, $zero, 0\nj spin")
+        reason = cpu.run_until_repeat()
+        self.assertTrue(reason.endswith("cycle of 18 steps): infinite loop"), reason)
+        self.assertLess(cpu.instruction_count, 2 * (1002 + 18))
+        # Sonlanan program için tekrar bulunmaz
+        cpu = MIPSCPU()
+        cpu.trace_enabled = False
+        cpu.load_program(PROGRAM)
+        self.assertIsNone(cpu.run_until_repeat())
+        self.assertTrue(cpu.finished)
+
+
+if __name__ == '__main__':
+    unittest.main()
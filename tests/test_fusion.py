@@ -0,0 +1,96 @@
+import unittest
+from MIPS.src.fusion import CompileError, compile_program, plan_fusion
+
+
+REGISTERS = {f"$r{i}": i for i in range(32)}
+REGISTERS.update({"$zero": 0, "$t0": 8, "$t1": 9, "$t2": 10, "$t3": 11, "$ra": 31})
+
+LOOP = [
+    "addi $t0, $zero, 0",
+    "addi $t1, $zero, 10",
+    "addi $t0, $t0, 1",      # loop
+    "sw $t0, 4($zero)",
+    "lw $t2, 4($zero)",
+    "add $t3, $t3, $t2",
+    "bne $t0, $t1, loop",
+    "sll $t3, $t3, 1",
+]
+LABELS = {"loop": 2}
+
+
+def run(compiled, limit=10000):
+    registers = [0] * 32
+    memory = [0] * 128
+    pc = executed = 0
+    while pc < len(compiled.handlers) and executed < limit:
+        handler, weight = compiled.handlers[pc]
+        pc = handler(registers, memory)
+        executed += weight
+    return registers, memory, pc, executed
+
+
+class TestFusion(unittest.TestCase):
+    def test_fused_matches_unfused(self):
+        """Birleştirilmiş yürütme birleştirilmemiş yürütmeyle aynı durumu üretir"""
+        fused = compile_program(LOOP, LABELS, REGISTERS)
+        plain = compile_program(LOOP, LABELS, REGISTERS, fuse=False)
+        self.assertTrue(fused.fused)
+        self.assertEqual(plain.fused, {})
+        self.assertEqual(run(fused), run(plain))
+        registers, memory, pc, executed = run(fused)
+        self.assertEqual(registers[11], 55 * 2)
+        self.assertEqual(memory[1], 10)
+        self.assertEqual(executed, 2 + 10 * 5 + 1)
+
+    def test_loop_body_is_fused(self):
+        """Döngü gövdesi statik olarak birleştirilir, son komut branch olabilir"""
+        compiled = compile_program(LOOP, LABELS, REGISTERS)
+        self.assertEqual(compiled.fused, {2: 3, 5: 2})
+
+    def test_boundaries_split_sequences(self):
+        """Breakpoint olan pc bir dizinin ortasına düşemez"""
+        compiled = compile_program(LOOP, LABELS, REGISTERS, boundaries={3})
+        for start, length in compiled.fused.items():
+            self.assertFalse(start < 3 < start + length)
+        self.assertEqual(run(compiled)[:2], run(compile_program(LOOP, LABELS, REGISTERS, fuse=False))[:2])
+
+    def test_jump_into_fused_sequence(self):
+        """Birleştirilmiş dizinin ortasına atlayan branch tekil handler'ı kullanır"""
+        program = [
+            "addi $t0, $t0, 1",
+            "addi $t1, $t1, 2",      # mid
+            "addi $t2, $t2, 3",
+            "slt $t3, $t2, $r12",
+            "beq $t3, $zero, mid",
+            "addi $r12, $zero, 100",
+        ]
+        labels = {"mid": 1}
+        fused = compile_program(program, labels, REGISTERS, min_count=1)
+        plain = compile_program(program, labels, REGISTERS, fuse=False)
+        self.assertIn(0, fused.fused)
+        self.assertEqual(run(fused, limit=50), run(plain, limit=50))
+
+    def test_profile_guided_plan(self):
+        """Profil verisi verildiğinde yalnızca sık yürütülen diziler seçilir"""
+        ops = ["addi", "addi", "add", "sw", "lw", "add"]
+        fusable = [True] * len(ops)
+        plan = plan_fusion(ops, fusable, profile={3: 50, 0: 1}, min_count=10)
+        self.assertEqual(plan, {3: 3})
+
+    def test_missing_label_only_raises_when_taken(self):
+        """Bulunamayan label, referans yorumlayıcıdaki gibi yalnızca alındığında hata verir"""
+        compiled = compile_program(["bne $t0, $zero, nowhere", "addi $t0, $zero, 1"], {}, REGISTERS)
+        registers, memory, pc, executed = run(compiled, limit=1)
+        self.assertEqual(pc, 1)
+        registers = [0] * 32
+        registers[8] = 1
+        with self.assertRaises(Exception):
+            compiled.handlers[0][0](registers, [0] * 128)
+
+    def test_uncompilable_instruction(self):
+        with self.assertRaises(CompileError):
+            compile_program(["add $t0, $bogus, $t1"], {}, REGISTERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from MIPS.src import fuzz as fuzzing
+from MIPS.src.assembler import check_source
+from MIPS.src.cpu import MIPSCPU
+
+
+class TestFuzz(unittest.TestCase):
+    def test_generated_programs_are_valid_and_terminate(self):
+        register_map = MIPSCPU().register_map
+        for seed in range(20):
+            source = fuzzing.generate_program(seed)
+            self.assertEqual(check_source(source, register_map).diagnostics, [], source)
+            self.assertIsNotNone(fuzzing.run_reference(MIPSCPU.assemble(source), 200000))
+
+    def test_generation_is_deterministic(self):
+        self.assertEqual(fuzzing.generate_program(7), fuzzing.generate_program(7))
+        self.assertNotEqual(fuzzing.generate_program(7), fuzzing.generate_program(8))
+
+    def test_engines_agree(self):
+        for seed in range(30):
+            self.assertIsNone(fuzzing.compare(fuzzing.generate_program(seed), list(fuzzing.ENGINES)))
+
+    def test_divergence_is_minimized(self):
+        """slt sonucunu bozan bir motor tek satırlık bir programa küçültülür"""
+        def broken_slt(program, compiled):
+            state = fuzzing.run_fast(program, compiled)
+            if any(instruction.startswith("slt") for instruction in program[0]):
+                state["registers"][8] += 1
+            return state
+
+        fuzzing.ENGINES["broken"] = broken_slt
+        try:
+            seed = next(s for s in range(100) if "slt" in fuzzing.generate_program(s))
+            source = fuzzing.generate_program(seed)
+            engine, field, _, _ = fuzzing.compare(source, ["fast", "broken"])
+            self.assertEqual((engine, field), ("broken", "registers"))
+            reduced = fuzzing.minimize(source, ["broken"])
+            self.assertEqual(len(reduced.splitlines()), 1)
+            self.assertTrue(reduced.startswith("slt"))
+        finally:
+            del fuzzing.ENGINES["broken"]
+
+    def test_parallel_fuzz(self):
+        report = fuzzing.fuzz(count=40, workers=2)
+        self.assertEqual(report["programs"], 40)
+        self.assertIsNone(report["divergence"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from MIPS.src.hooks import HookRegistry, HOOK_EVENTS, PRE_FETCH, POST_EXECUTE
+
+
+class TestHookRegistry(unittest.TestCase):
+    def test_empty_registry_is_falsy(self):
+        """Hook yokken registry False döner (hızlı döngü seçilir)"""
+        hooks = HookRegistry()
+        self.assertFalse(hooks)
+        for event in HOOK_EVENTS:
+            self.assertEqual(getattr(hooks, event), [])
+
+    def test_register_and_unregister(self):
+        """Callback kaydı ve kaldırılması"""
+        hooks = HookRegistry()
+        callback = hooks.register(PRE_FETCH, lambda sim, index: None)
+        self.assertTrue(hooks)
+        self.assertTrue(hooks.is_registered(PRE_FETCH, callback))
+        hooks.unregister(PRE_FETCH, callback)
+        hooks.unregister(PRE_FETCH, callback)  # İkinci kez kaldırmak hata vermez
+        self.assertFalse(hooks)
+
+    def test_clear(self):
+        hooks = HookRegistry()
+        hooks.register(PRE_FETCH, print)
+        hooks.register(POST_EXECUTE, print)
+        hooks.clear(PRE_FETCH)
+        self.assertEqual(hooks.pre_fetch, [])
+        self.assertEqual(hooks.post_execute, [print])
+        hooks.clear()
+        self.assertFalse(hooks)
+
+    def test_unknown_event(self):
+        with self.assertRaises(ValueError):
+            HookRegistry().register("on_magic", print)
+
+
+if __name__ == '__main__':
+    unittest.main()
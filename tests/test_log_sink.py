@@ -0,0 +1,64 @@
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.log_sink import LogSink, ERROR, INFO, VERBOSE
+
+
+class TestLogSink(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.sink = LogSink(emit=self.batches.append, level=INFO, max_lines=3, batch_size=2)
+
+    def test_level_filter(self):
+        """Sink seviyesinden ayrıntılı mesajlar atılır"""
+        self.sink.verbose("detail")
+        self.sink.info("note")
+        self.sink.error("failure")
+        self.assertEqual(list(self.sink.messages), ["note", "failure"])
+        self.sink.level = ERROR
+        self.sink.info("hidden")
+        self.assertEqual(list(self.sink.messages), ["note", "failure"])
+
+    def test_batched_flush(self):
+        """Mesajlar batch_size dolunca ya da flush ile toplu gönderilir"""
+        self.sink.info("a")
+        self.assertEqual(self.batches, [])
+        self.sink.info("b")
+        self.sink.info("c")
+        self.assertEqual(self.batches, [["a", "b"]])
+        self.sink.flush()
+        self.sink.flush()
+        self.assertEqual(self.batches, [["a", "b"], ["c"]])
+
+    def test_capped_size(self):
+        """Yalnızca son max_lines mesaj tutulur"""
+        for i in range(5):
+            self.sink.info(str(i))
+        self.assertEqual(list(self.sink.messages), ["2", "3", "4"])
+        self.assertEqual(self.sink.dropped, 2)
+        self.sink.clear()
+        self.assertEqual(self.sink.text(), "")
+        self.assertEqual(self.sink.dropped, 0)
+
+    def test_cpu_levels(self):
+        """CPU hata, bilgi ve ayrıntı mesajlarını seviyeleriyle gönderir"""
+        sink = LogSink(level=VERBOSE)
+        cpu = MIPSCPU(log=sink)
+        # Doğrulanmadan yüklenir; eksik label kodlamada uyarı, yürütmede hata verir
+        cpu.load_assembled(["addi $t0, $zero, 3", "j missing"], {}, [], {})
+        self.assertIn("Warning: Label 'missing' not found", sink.messages)
+        cpu.run()
+        self.assertIn("$t0 = 3", sink.messages)
+        self.assertIn("Error executing: j missing", sink.messages)
+
+        sink.clear()
+        sink.level = ERROR
+        cpu.reset()
+        cpu.load_assembled(["addi $t0, $zero, 3", "j missing"], {}, [], {})
+        cpu.run()
+        self.assertNotIn("$t0 = 3", sink.messages)
+        self.assertNotIn("Warning: Label 'missing' not found", sink.messages)
+        self.assertIn("Error executing: j missing", sink.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
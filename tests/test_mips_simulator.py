@@ -1,7 +1,16 @@
+import os
 import sys
+import tempfile
+import time
 import unittest
+from unittest import mock
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QApplication
 from MIPS.src.mips_simulator import MIPSSimulator
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.hooks import (
+    PRE_FETCH, POST_EXECUTE, MEMORY_READ, MEMORY_WRITE, BRANCH_RESOLVED
+)
 
 class TestMIPSSimulator(unittest.TestCase):
     @classmethod
@@ -169,5 +178,516 @@ class TestMIPSSimulator(unittest.TestCase):
         self.assertEqual(self.simulator.registers[self.simulator.register_map['$t2']], 8)
         self.assertEqual(self.simulator.instruction_count, 3)
 
+    def test_pipeline_timing(self):
+        """Pipeline timing modunun testi"""
+        test_code = """
+            addi $t0, $zero, 4
+            sw $t0, 0($zero)
+            lw $t1, 0($zero)
+            add $t2, $t1, $t0     # load-use stall
+        """
+        self.simulator.enable_pipeline_timing(forwarding=True, branch_policy="flush")
+        try:
+            self.simulator.assembly_editor.setText(test_code)
+            self.simulator.run_program()
+            model = self.simulator.pipeline_model
+            self.assertEqual(model.instructions, 4)
+            self.assertEqual(model.load_use_stalls, 1)
+            self.assertEqual(model.cycles, 9)
+        finally:
+            self.simulator.disable_pipeline_timing()
+
+    def test_branch_prediction(self):
+        """Branch tahmincilerinin çalışma sırasında değerlendirilmesi"""
+        test_code = """
+            addi $t0, $zero, 0
+            addi $t1, $zero, 4
+            loop:
+            addi $t0, $t0, 1
+            bne $t0, $t1, loop
+        """
+        predictor = self.simulator.add_branch_predictor("2bit")
+        try:
+            self.simulator.assembly_editor.setText(test_code)
+            self.simulator.run_program()
+            self.assertEqual(predictor.predictions, 4)
+            self.assertEqual(list(predictor.branches), [12])
+            self.assertEqual(predictor.mispredictions, 2)
+        finally:
+            self.simulator.clear_branch_predictors()
+
+    def test_execution_hooks(self):
+        """Hook API'sinin testi"""
+        test_code = """
+            addi $t0, $zero, 7
+            sw $t0, 8($zero)
+            lw $t1, 8($zero)
+            beq $t0, $t1, done
+            addi $t2, $zero, 1
+            done:
+            addi $t3, $zero, 2
+        """
+        events = []
+        hooks = self.simulator.hooks
+        callbacks = [
+            (PRE_FETCH, lambda sim, index: events.append(("fetch", index))),
+            (POST_EXECUTE, lambda sim, index, inst, nxt: events.append(("exec", index, nxt))),
+            (MEMORY_READ, lambda sim, addr, value: events.append(("read", addr, value))),
+            (MEMORY_WRITE, lambda sim, addr, old, new: events.append(("write", addr, old, new))),
+            (BRANCH_RESOLVED, lambda sim, index, inst, taken, nxt: events.append(("branch", taken, nxt))),
+        ]
+        for event, callback in callbacks:
+            hooks.register(event, callback)
+        try:
+            self.simulator.assembly_editor.setText(test_code)
+            self.simulator.run_program()
+        finally:
+            for event, callback in callbacks:
+                hooks.unregister(event, callback)
+
+        self.assertFalse(hooks)
+        self.assertEqual([e[1] for e in events if e[0] == "fetch"], [0, 1, 2, 3, 5])
+        self.assertIn(("write", 8, 0, 7), events)
+        self.assertIn(("read", 8, 7), events)
+        self.assertIn(("branch", True, 5), events)
+        self.assertEqual(events[-1], ("exec", 5, 6))
+        self.assertEqual(self.simulator.registers[self.simulator.register_map['$t3']], 2)
+
+    def test_breakpoints_and_watchpoints(self):
+        """Breakpoint ve watchpoint'lerde durma ve devam etme"""
+        test_code = """
+            addi $t0, $zero, 0
+            addi $t1, $zero, 5
+            loop:
+            addi $t0, $t0, 1
+            sw $t0, 16($zero)
+            bne $t0, $t1, loop
+            addi $t2, $zero, 9
+        """
+        breakpoints = self.simulator.breakpoints
+        reg = self.simulator.register_map
+        self.simulator.assembly_editor.setText(test_code)
+        try:
+            # Koşullu label breakpoint'i
+            breakpoints.add_breakpoint("loop", condition="$t0 == 3", register_map=reg)
+            self.simulator.run_program()
+            self.assertEqual(self.simulator.current_instruction, 2)
+            self.assertEqual(self.simulator.registers[reg['$t0']], 3)
+
+            # Step görünümüne devret, sonra devam et
+            self.simulator.step_program()
+            self.assertEqual(self.simulator.registers[reg['$t0']], 4)
+            breakpoints.clear()
+            breakpoints.watch_memory(16)
+            self.simulator.continue_program()
+            self.assertEqual(self.simulator.data_memory[4], 4)
+            self.assertEqual(self.simulator.current_instruction, 4)
+
+            breakpoints.clear()
+            breakpoints.watch_register(reg['$t2'])
+            self.simulator.continue_program()
+            self.assertEqual(self.simulator.registers[reg['$t2']], 9)
+            count = self.simulator.instruction_count
+            self.simulator.continue_program()
+            self.assertEqual(self.simulator.current_instruction, 6)
+            self.assertEqual(self.simulator.instruction_count, count)
+        finally:
+            breakpoints.clear()
+
+    def test_fusion_matches_reference(self):
+        """Birleştirilmiş yürütme referans yorumlayıcıyla aynı durumu üretir"""
+        test_code = """
+            addi $t0, $zero, 0
+            addi $t1, $zero, 6
+            loop:
+            addi $t0, $t0, 1
+            sw $t0, 8($zero)
+            lw $t2, 8($zero)
+            add $t3, $t3, $t2
+            slt $t4, $t0, $t1
+            bne $t4, $zero, loop
+            sll $t5, $t3, 2
+        """
+        self.simulator.assembly_editor.setText(test_code)
+        self.simulator.trace_enabled = False
+        try:
+            self.simulator.run_program()
+            expected = (list(self.simulator.registers), list(self.simulator.data_memory),
+                        self.simulator.instruction_count)
+
+            self.simulator.fusion_enabled = True
+            self.simulator.run_program()
+            self.assertTrue(self.simulator._compiled_cache[1].fused)
+            actual = (list(self.simulator.registers), list(self.simulator.data_memory),
+                      self.simulator.instruction_count)
+            self.assertEqual(actual, expected)
+
+            # Breakpoint'te duran durum da aynı olmalı
+            self.simulator.breakpoints.add_breakpoint("loop", "$t0 == 3", self.simulator.register_map)
+            self.simulator.run_program()
+            self.assertEqual(self.simulator.current_instruction, 2)
+            self.assertEqual(self.simulator.registers[self.simulator.register_map['$t3']], 6)
+            self.assertEqual(self.simulator.instruction_count, 2 + 3 * 6)
+        finally:
+            self.simulator.breakpoints.clear()
+            self.simulator.fusion_enabled = False
+            self.simulator.trace_enabled = True
+
+    def test_trace_query(self):
+        """Trace sorgu kutusu sonucu Output paneline yazar"""
+        self.simulator.assembly_editor.setText("""
+            addi $t2, $zero, 7
+            sw $t2, 64($zero)
+            addi $t2, $t2, 1
+        """)
+        self.simulator.run_program()
+        self.simulator.trace_query_edit.setText("$t2 @ 2")
+        self.simulator.run_trace_query()
+        self.assertIn("$t2 at step 2: 7", self.simulator.output_log.toPlainText())
+        self.simulator.trace_query_edit.setText("M[0x40] < 3")
+        self.simulator.run_trace_query()
+        self.assertIn("at step 2: 0 -> 7", self.simulator.output_log.toPlainText())
+        self.simulator.trace_query_edit.setText("$nope")
+        self.simulator.run_trace_query()
+        self.assertIn("Error: Unknown register: $nope", self.simulator.output_log.toPlainText())
+
+    def test_background_assembly_diagnostics(self):
+        """Arka plan assemble tabloyu günceller ve hatalı satırları listeler"""
+        self.simulator.assembly_editor.setText("addi $t0, $zero, 1\nad $t1, $t0, $t0\nj nowhere")
+        self.simulator.start_background_assembly()
+        deadline = time.monotonic() + 5
+        while (len(self.simulator.assembly_diagnostics) != 2
+               or self.simulator.machine_code_table.item(2, 2) is None):
+            self.assertLess(time.monotonic(), deadline)
+            self.app.processEvents()
+        self.simulator.assembly_timer.stop()
+
+        table = self.simulator.machine_code_table
+        self.assertEqual(table.rowCount(), 3)
+        self.assertEqual(table.item(0, 2).text(), "00100000000010000000000000000001")
+        self.assertEqual(table.item(1, 2).text(), "error: Unknown opcode 'ad'")
+        self.assertEqual(table.item(2, 2).toolTip(), "Undefined label 'nowhere'")
+        self.assertEqual(len(self.simulator.assembly_editor.extraSelections()), 2)
+        self.assertIn("Line 2: error: Unknown opcode 'ad'", self.simulator.diagnostics_label.text())
+
+        # Eski bir assemble sonucu uygulanmaz
+        stale = self.simulator.assembly_generation - 1
+        self.simulator.apply_background_assembly(stale, None)
+
+    def test_background_assembly_cfg_warnings(self):
+        """Hatasız kaynakta CFG uyarıları tanılamalara eklenir"""
+        from MIPS.src.mips_simulator import assemble_for_editor
+        check, machine_code, cfg = assemble_for_editor(
+            "j end\naddi $t0, $zero, 1\nend:\nadd $t1, $t2, $zero", self.simulator.register_map
+        )
+        self.assertEqual([(d.line, d.severity, d.message) for d in check.diagnostics], [
+            (2, "warning", "Unreachable code (1 instruction)"),
+            (4, "warning", "Register $t2 is read before it is written"),
+        ])
+        self.assertNotIn(None, machine_code)
+        self.assertEqual(len(cfg.blocks), 3)
+
+    def test_background_assembly_encoder_failures(self):
+        """Virgülle ayrılmış operandlar kodlanır; kodlanamayan komut hata tanılaması olur"""
+        from MIPS.src.mips_simulator import assemble_for_editor
+        source = "addi $t0,$zero,3\nloop: addi $t0,$t0,-1\nbne $t0,$zero,loop"
+        check, machine_code, _ = assemble_for_editor(source, self.simulator.register_map)
+        self.assertEqual(check.diagnostics, [])
+        self.assertEqual(machine_code[0], "00100000000010000000000000000011")
+        self.assertEqual(machine_code[2][:16], "0001010100000000")
+
+        def encode(cpu, instruction, index=None):
+            if index == 1:
+                raise ValueError(f"Cannot encode '{instruction}': boom")
+            return "0" * 31 + "1"
+        with mock.patch.object(MIPSCPU, "encode_instruction", encode):
+            check, machine_code, _ = assemble_for_editor(source, self.simulator.register_map)
+        self.assertEqual([(d.line, d.severity, d.message) for d in check.diagnostics],
+                         [(2, "error", "Cannot encode 'addi $t0,$t0,-1': boom")])
+        self.assertIsNone(machine_code[1])
+
+    def test_loaded_program_reuses_editor_cfg(self):
+        """Program yüklenince editörün arka planda kurduğu CFG CPU'ya verilir"""
+        from MIPS.src.mips_simulator import assemble_for_editor
+        sim = self.simulator
+        source = "addi $t0, $zero, 3\nloop:\naddi $t0, $t0, -1\nbne $t0, $zero, loop"
+        sim.assembly_editor.setText(source)
+        sim.assembly_timer.stop()
+        sim.assembly_generation += 1
+        result = assemble_for_editor(source, dict(sim.register_map))
+        try:
+            sim.apply_background_assembly(sim.assembly_generation, result)
+            sim.load_editor_program()
+            self.assertIs(sim.control_flow_graph(), result[2])
+        finally:
+            sim.editor_cfg = None
+
+    def test_data_section_and_data_file(self):
+        """.data bölümü ve seçilen data dosyası Run ve Step'te belleğe yüklenir"""
+        sim = self.simulator
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as f:
+            f.write("0,0,40\n")
+        sim.assembly_editor.setText(".data\n.space 12\nx: .word 2\n.text\nlw $t0, x\nlw $t1, 8($zero)\nadd $t2, $t0, $t1")
+        sim.data_file = path
+        try:
+            sim.run_program()
+            self.assertEqual(sim.registers[sim.register_map['$t2']], 42)
+            self.assertIn("Loaded 3 data words", sim.output_log.toPlainText())
+            sim.reset_program()
+            sim.step_program()
+            self.assertEqual(sim.registers[sim.register_map['$t0']], 2)
+            self.assertEqual(sim.data_memory_table.item(2, 1).text(), "40")
+        finally:
+            sim.data_file = None
+            os.remove(path)
+
+    def test_multicore_core_switch(self):
+        """Çok çekirdekli çalıştırma ve gösterilen çekirdeğin değiştirilmesi"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $k0, 10\nsll $t1, $k0, 2\nsw $t0, 0($t1)")
+        sim.cores_combo.setCurrentText("2")
+        try:
+            sim.run_program()
+            self.assertEqual(sim.system.data_memory[:2], [10, 11])
+            self.assertEqual(sim.core_combo.count(), 2)
+            self.assertIn("Core 1: 3 instructions", sim.output_log.toPlainText())
+            sim.core_combo.setCurrentIndex(1)
+            self.assertEqual(sim.register_file_table.item(8, 2).text(), "11")
+            sim.core_combo.setCurrentIndex(0)
+            self.assertEqual(sim.register_file_table.item(8, 2).text(), "10")
+
+            # Step, zamanlayıcının seçtiği çekirdeği gösterir
+            sim.reset_program()
+            sim.step_program()
+            sim.step_program()
+            self.assertEqual(sim.core_combo.currentIndex(), 1)
+            self.assertIn("Core 1, step 2", sim.output_log.toPlainText())
+            sim.continue_program()
+            self.assertTrue(sim.system.finished)
+        finally:
+            sim.cores_combo.setCurrentText("1")
+            sim.reset_program()
+        self.assertIs(sim.cpu, sim.main_cpu)
+        self.assertEqual(sim.core_combo.count(), 1)
+
+    def test_multicore_keeps_debug_configuration(self):
+        """Breakpoint/watchpoint'ler çekirdeklere geçer; pipeline ayarları tek çekirdekte kalır"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $k0, 10\nsll $t1, $k0, 2\nsw $t0, 0($t1)")
+        sim.reset_program()
+        sim.breakpoints.add_breakpoint(2)
+        sim.cores_combo.setCurrentText("2")
+        try:
+            self.assertFalse(sim.pipeline_checkbox.isEnabled())
+            self.assertFalse(sim.predictor_combo.isEnabled())
+            sim.run_program()
+            self.assertIn("Paused: Core 0: Breakpoint at 0x00000008", sim.output_log.toPlainText())
+            self.assertEqual(sim.system.data_memory[:2], [0, 0])
+            sim.continue_program()
+            self.assertIn("Paused: Core 1: Breakpoint at 0x00000008", sim.output_log.toPlainText())
+            sim.continue_program()
+            self.assertTrue(sim.system.finished)
+            self.assertEqual(sim.system.data_memory[:2], [10, 11])
+        finally:
+            sim.cores_combo.setCurrentText("1")
+            sim.reset_program()
+            sim.breakpoints.clear()
+        self.assertTrue(sim.pipeline_checkbox.isEnabled())
+
+    def test_output_log_levels_and_cap(self):
+        """Output paneli seviyeye göre filtrelenir, toplu yazılır ve sınırlıdır"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 0\nloop: addi $t0, $t0, 1\nj done\ndone:")
+
+        def fail(cpu, index):
+            if index == 2:
+                raise RuntimeError("boom")
+
+        appends = []
+        original = sim.write_log
+        sim.log.emit = lambda lines: (appends.append(len(lines)), original(lines))
+        try:
+            sim.hooks.register(PRE_FETCH, fail)
+            try:
+                sim.run_program()
+            finally:
+                sim.hooks.unregister(PRE_FETCH, fail)
+            text = sim.output_log.toPlainText()
+            self.assertNotIn("$t0 = 1", text)
+            self.assertIn("Error executing: j done", text)
+            self.assertIn("Program execution completed!", text)
+            # Panel her mesajda değil; reset, yükleme ve run sonunda güncellenir
+            self.assertLessEqual(len(appends), 4)
+
+            # Step açıklaması info seviyesinde de gösterilir
+            sim.reset_program()
+            sim.step_program()
+            self.assertIn("$t0 = 0", sim.output_log.toPlainText())
+
+            sim.log_level_combo.setCurrentText("verbose")
+            sim.assembly_editor.setText("addi $t0, $zero, 0\nloop: addi $t0, $t0, 1\nj loop")
+            sim.reset_program()
+            sim.cpu.load_program(sim.assembly_editor.toPlainText())
+            sim.cpu.run(max_steps=20000)
+            self.assertLessEqual(sim.output_log.document().blockCount(), sim.log.messages.maxlen)
+            self.assertGreater(sim.log.dropped, 0)
+        finally:
+            sim.log.emit = original
+            sim.log_level_combo.setCurrentText("info")
+
+    def test_batch_controls(self):
+        """Step N, Run to Cursor ve Run Until görünümleri yalnızca sonda, bir kez yeniler"""
+        sim = self.simulator
+        sim.assembly_editor.setText(
+            "addi $t1, $zero, 0\nloop: addi $t1, $t1, 1\nsw $t1, 8($zero)\nbne $t1, $zero, loop"
+        )
+        refreshes = []
+        original = sim.populate_registers
+        sim.populate_registers = lambda old_values=None: (refreshes.append(old_values), original(old_values))
+        try:
+            sim.reset_program()
+            refreshes.clear()
+            sim.step_count_spin.setValue(5)
+            sim.step_n()
+            self.assertTrue(sim.wait_for_batch(5))
+            t1 = sim.register_map["$t1"]
+            self.assertEqual(sim.registers[t1], 2)
+            self.assertEqual(sim.instruction_count, 5)
+            self.assertEqual(len(refreshes), 1)
+            # Değişiklikler başlangıç durumuna göre vurgulanır
+            self.assertEqual(refreshes[0][t1], 0)
+            self.assertEqual(sim.register_file_table.item(t1, 2).background().color(), QColor(255, 255, 0))
+            self.assertIn("Executed 5 instructions", sim.output_log.toPlainText())
+
+            sim.machine_code_table.setCurrentCell(3, 0)
+            sim.run_to_cursor()
+            self.assertTrue(sim.wait_for_batch(5))
+            self.assertEqual(sim.current_instruction, 3)
+            self.assertIn("Paused: Reached 0x0000000c", sim.output_log.toPlainText())
+
+            sim.run_until_edit.setText("$t1 == 40 && M[8] == 40")
+            sim.run_until_condition()
+            self.assertTrue(sim.wait_for_batch(5))
+            self.assertEqual(sim.registers[t1], 40)
+            self.assertEqual(sim.data_memory[2], 40)
+            self.assertEqual(len(refreshes), 3)
+            self.assertEqual(sim.machine_code_table.item(sim.current_instruction, 0).background().color(),
+                             QColor(255, 255, 0))
+
+            sim.run_until_edit.setText("$t1 ==")
+            sim.run_until_condition()
+            self.assertTrue(sim.wait_for_batch(5))
+            self.assertIn("Error: Invalid condition", sim.output_log.toPlainText())
+        finally:
+            del sim.populate_registers
+            sim.run_until_edit.clear()
+
+    def test_batch_runs_off_the_gui_thread(self):
+        """Step N arka planda çalışır; bu sırada yürütme kontrolleri kapalıdır ve trace metni üretilmez"""
+        import threading
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 1\naddi $t1, $zero, 2\naddi $t2, $zero, 3")
+        release = threading.Event()
+
+        def wait(cpu, index):
+            release.wait(5)
+
+        sim.reset_program()
+        sim.hooks.register(PRE_FETCH, wait)
+        try:
+            sim.step_count_spin.setValue(3)
+            sim.step_n()
+            self.assertTrue(sim.batch_running)
+            self.assertFalse(sim.run_button.isEnabled())
+            self.assertFalse(sim.step_n_button.isEnabled())
+            release.set()
+            self.assertTrue(sim.wait_for_batch(5))
+        finally:
+            release.set()
+            sim.wait_for_batch(5)
+            sim.hooks.unregister(PRE_FETCH, wait)
+        self.assertTrue(sim.run_button.isEnabled())
+        self.assertEqual(sim.instruction_count, 3)
+        self.assertNotIn("Step 1", "".join(sim.execution_trace))
+        self.assertEqual(sim.cpu.trace_index.register_value(sim.register_map["$t1"], 2), 2)
+        self.assertTrue(sim.cpu.trace_text)
+        self.assertIn("Executed 3 instructions", sim.output_log.toPlainText())
+
+    def test_step_n_stops_at_watchpoint(self):
+        """Step N bütçeli döngüde de watchpoint'lerde durur"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 1\naddi $t1, $zero, 5\nsw $t1, 8($zero)\naddi $t2, $zero, 2")
+        try:
+            sim.reset_program()
+            sim.breakpoints.watch_register(sim.register_map["$t1"])
+            sim.step_count_spin.setValue(10)
+            sim.step_n()
+            self.assertTrue(sim.wait_for_batch(5))
+            self.assertEqual(sim.instruction_count, 2)
+            self.assertIn("Paused: Watchpoint $t1: 0 -> 5", sim.output_log.toPlainText())
+            sim.breakpoints.clear()
+            sim.breakpoints.watch_memory(8)
+            sim.step_n()
+            self.assertTrue(sim.wait_for_batch(5))
+            self.assertEqual(sim.instruction_count, 3)
+            self.assertIn("Paused: Watchpoint M[0x008]: 0 -> 5", sim.output_log.toPlainText())
+        finally:
+            sim.breakpoints.clear()
+
+    def test_step_n_reports_errors(self):
+        """Yürütme hatası Step N çıktısında kaybolmaz"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 1\naddi $t1, $zero, 2\naddi $t0, $zero, 2")
+
+        def fail(cpu, index):
+            if index == 1:
+                raise RuntimeError("boom")
+
+        sim.reset_program()
+        sim.hooks.register(PRE_FETCH, fail)
+        try:
+            sim.step_count_spin.setValue(5)
+            sim.step_n()
+            self.assertTrue(sim.wait_for_batch(5))
+        finally:
+            sim.hooks.unregister(PRE_FETCH, fail)
+        text = sim.output_log.toPlainText()
+        self.assertIn("Error executing: addi $t1, $zero, 2", text)
+        self.assertIn("Stopped on error: addi $t1, $zero, 2: boom", text)
+        self.assertNotIn("Program execution completed!", text)
+
+    def test_profiling(self):
+        """Profile açıkken Run sonunda aşama dökümü yazılır, tablo güncellemeleri gui'ye düşer"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 5\nloop: addi $t0, $t0, -1\nbne $t0, $zero, loop")
+        sim.profile_checkbox.setChecked(True)
+        try:
+            sim.run_program()
+            profiler = sim.cpu.profiler
+            self.assertEqual(profiler.instructions, 11)
+            self.assertEqual(profiler.calls["execute"], 11)
+            self.assertGreater(profiler.calls["gui"], 0)
+            self.assertIn("11 instructions", sim.output_log.toPlainText())
+        finally:
+            sim.profile_checkbox.setChecked(False)
+        self.assertIsNone(sim.cpu.profiler)
+        self.assertNotIn("populate_memory", vars(sim))
+        self.assertNotIn("execute_instruction", vars(sim.cpu))
+
+    def test_profiling_stops_on_failed_run(self):
+        """Yükleme başarısız olsa da ölçüm kapatılır ve rapor yazılır"""
+        sim = self.simulator
+        sim.assembly_editor.setText("addi $t0, $zero, 1\nad $t1, $t0, $t0")
+        sim.profile_checkbox.setChecked(True)
+        try:
+            sim.run_program()
+            self.assertIsNone(sim.cpu.profiler.started)
+            text = sim.output_log.toPlainText()
+            self.assertIn("Profile:", text)
+            self.assertIn("Program execution failed", text)
+        finally:
+            sim.profile_checkbox.setChecked(False)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
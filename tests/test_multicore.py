@@ -0,0 +1,137 @@
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.fingerprint import state_fingerprint
+from MIPS.src.multicore import (
+    MultiCoreSystem, RoundRobinScheduler, RandomScheduler, make_scheduler, run_independent
+)
+
+
+# Her çekirdek kendi kelimesine ve ortak sayaca (M[64]) kilitsiz olarak 5 kez ekler
+SHARED_COUNTER = """
+    sll $t0, $k0, 2
+    addi $t1, $zero, 5
+loop:
+    lw $t2, 0($t0)
+    addi $t2, $t2, 1
+    sw $t2, 0($t0)
+    lw $t3, 64($zero)
+    addi $t3, $t3, 1
+    sw $t3, 64($zero)
+    addi $t1, $t1, -1
+    bne $t1, $zero, loop
+"""
+
+
+class TestMultiCore(unittest.TestCase):
+    def run_system(self, scheduler, cores=4):
+        system = MultiCoreSystem(cores, scheduler)
+        system.load_program(SHARED_COUNTER)
+        self.assertIsNone(system.run())
+        return system
+
+    def test_shared_memory_and_private_registers(self):
+        """Çekirdekler belleği paylaşır, register ve PC'leri ayrıdır"""
+        system = self.run_system(RoundRobinScheduler(quantum=100))
+        self.assertIs(system.cores[1].data_memory, system.cores[0].data_memory)
+        self.assertEqual(system.data_memory[:4], [5, 5, 5, 5])
+        # Dilimler tüm döngüyü kapsadığı için güncelleme kaybolmaz
+        self.assertEqual(system.data_memory[16], 20)
+        self.assertEqual([core.registers[8] for core in system.cores], [0, 4, 8, 12])
+        self.assertTrue(all(core.finished for core in system.cores))
+
+    def test_round_robin_interleaving(self):
+        """Tek komutluk dilimlerde çekirdekler sırayla ilerler ve yarış görülür"""
+        system = self.run_system(RoundRobinScheduler(quantum=1))
+        self.assertEqual(system.data_memory[:4], [5, 5, 5, 5])
+        self.assertLess(system.data_memory[16], 20)
+        self.assertEqual(system.steps, 168)
+        self.assertEqual(system.context_switches, 167)
+        stats = system.core_stats()
+        self.assertEqual([entry["instructions"] for entry in stats], [42] * 4)
+        self.assertEqual([entry["finished_at"] for entry in stats], [165, 166, 167, 168])
+        self.assertEqual(stats[0]["share"], 0.25)
+        self.assertIn("Core 3: 42 instructions (25%), 42 slices, finished at step 168", system.report())
+
+    def test_seeded_random_is_reproducible(self):
+        first = self.run_system(RandomScheduler(seed=3))
+        second = self.run_system(RandomScheduler(seed=3))
+        self.assertEqual(first.data_memory, second.data_memory)
+        self.assertEqual(first.core_stats(), second.core_stats())
+        # Sıfırlanan sistem aynı sırayı yeniden üretir
+        first.reset()
+        first.load_program(SHARED_COUNTER)
+        first.run()
+        self.assertEqual(first.core_stats(), second.core_stats())
+
+    def test_step_and_budget(self):
+        system = MultiCoreSystem(2, make_scheduler("round-robin", quantum=3))
+        system.load_program(SHARED_COUNTER)
+        self.assertEqual([system.step() for _ in range(4)], [0, 1, 0, 1])
+        self.assertEqual(system.run(max_steps=10), "Step budget of 10 instructions exhausted")
+        self.assertEqual(system.steps, 10)
+        self.assertIsNone(system.run())
+        self.assertIsNone(system.step())
+
+    def test_failing_core_stops_alone(self):
+        """Hata veren çekirdek durur, diğerleri devam eder"""
+        system = MultiCoreSystem(2)
+        system.cores[0].load_assembled(["addi $t0, $zero, 1", "j missing"], {}, [], {})
+        system.load_program(SHARED_COUNTER, core=1)
+        self.assertIsNone(system.run())
+        self.assertIsNotNone(system.cores[0].last_error)
+        self.assertEqual(system.data_memory[1], 5)
+        self.assertIn("error:", system.report())
+
+    def test_shared_memory_fingerprint(self):
+        """Her çekirdeğin sw'si ortak bellek parmak izini günceller"""
+        system = MultiCoreSystem(2, RoundRobinScheduler(quantum=3))
+        with self.assertRaises(ValueError):
+            system.cores[0].enable_fingerprint()
+        untracked = system.state_fingerprint()
+        system.enable_fingerprint()
+        self.assertEqual(system.state_fingerprint(), untracked)
+        system.load_program(SHARED_COUNTER)
+        self.assertIsNone(system.run())
+        for core in system.cores:
+            self.assertEqual(core.state_fingerprint(), state_fingerprint(core.registers, core.data_memory))
+        tracked = system.state_fingerprint()
+        system.disable_fingerprint()
+        self.assertEqual(system.state_fingerprint(), tracked)
+        # Aynı register'lar farklı çekirdeklerde farklı sistem durumudur
+        first, second = system.cores
+        first.registers, second.registers = second.registers, first.registers
+        self.assertNotEqual(system.state_fingerprint(), tracked)
+
+    def test_breakpoints_pause_the_system(self):
+        """Breakpoint'te duran çekirdek sebebiyle bildirilir ve sonraki run'da sürdürülür"""
+        system = MultiCoreSystem(2, RoundRobinScheduler(quantum=100))
+        system.cores[0].breakpoints.watch_memory(64)
+        system.share_breakpoints(system.cores[0].breakpoints)
+        system.load_program(SHARED_COUNTER)
+        self.assertEqual(system.run(), "Core 0: Watchpoint M[0x040]: 0 -> 1")
+        self.assertEqual(system.run(), "Core 1: Watchpoint M[0x040]: 1 -> 2")
+        system.cores[0].breakpoints.clear()
+        self.assertIsNone(system.run())
+        self.assertEqual(system.data_memory[16], 10)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            MultiCoreSystem(0)
+        with self.assertRaises(ValueError):
+            make_scheduler("fifo")
+        with self.assertRaises(ValueError):
+            RoundRobinScheduler(quantum=0)
+
+    def test_independent_processes(self):
+        """Bağımsız programlar ayrı süreçlerde tek çekirdekle aynı sonucu verir"""
+        sources = [f"addi $t0, $zero, {n}\nsw $t0, 0($zero)" for n in range(4)]
+        results = run_independent(sources, workers=2)
+        self.assertEqual([result["data_memory"][0] for result in results], [0, 1, 2, 3])
+        cpu = MIPSCPU()
+        cpu.load_program(sources[3])
+        cpu.run()
+        self.assertEqual(results[3]["registers"], list(cpu.registers))
+
+
+if __name__ == '__main__':
+    unittest.main()
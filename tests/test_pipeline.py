@@ -0,0 +1,85 @@
+import unittest
+from MIPS.src.pipeline import PipelineModel, register_operands
+
+
+class TestPipelineModel(unittest.TestCase):
+    def setUp(self):
+        self.regs = {"$zero": 0, "$t0": 8, "$t1": 9, "$t2": 10, "$ra": 31}
+
+    def test_register_operands(self):
+        """Komutların okuduğu/yazdığı register'ların testi"""
+        self.assertEqual(register_operands("add", ["$t2", "$t0", "$t1"], self.regs), (10, (8, 9)))
+        self.assertEqual(register_operands("lw", ["$t0", "4($t1)"], self.regs), (8, (9,)))
+        self.assertEqual(register_operands("sw", ["$t0", "0($zero)"], self.regs), (None, (8,)))
+        self.assertEqual(register_operands("jal", ["main"], self.regs), (31, ()))
+
+    def test_no_hazards(self):
+        """Bağımsız komutlar: n komut n + 4 cycle sürer"""
+        model = PipelineModel()
+        for _ in range(5):
+            model.issue("addi", 8, ())
+        self.assertEqual(model.cycles, 9)
+        self.assertEqual(model.total_stalls, 0)
+
+    def test_load_use_with_forwarding(self):
+        """Forwarding açıkken load-use bir stall üretir"""
+        model = PipelineModel(forwarding=True)
+        model.issue("lw", 8, ())
+        model.issue("add", 10, (8, 9))
+        self.assertEqual(model.load_use_stalls, 1)
+        self.assertEqual(model.data_stalls, 0)
+        self.assertEqual(model.cycles, 7)
+
+    def test_alu_dependency_without_forwarding(self):
+        """Forwarding kapalıyken ardışık bağımlılık iki stall üretir"""
+        model = PipelineModel(forwarding=False)
+        model.issue("addi", 8, ())
+        model.issue("add", 10, (8, 8))
+        self.assertEqual(model.data_stalls, 2)
+
+        forwarded = PipelineModel(forwarding=True)
+        forwarded.issue("addi", 8, ())
+        forwarded.issue("add", 10, (8, 8))
+        self.assertEqual(forwarded.total_stalls, 0)
+
+    def test_branch_policies(self):
+        """Flush politikası sadece alınan branch'lerde, stall politikası her branch'te ceza öder"""
+        flush = PipelineModel(branch_policy="flush")
+        stall = PipelineModel(branch_policy="stall")
+        for model in (flush, stall):
+            model.issue("beq", None, (), taken=False)
+            model.issue("addi", 8, ())
+        self.assertEqual(flush.control_stalls, 0)
+        self.assertEqual(stall.control_stalls, 1)
+
+        flush.reset()
+        flush.issue("beq", None, (), taken=True)
+        flush.issue("addi", 8, ())
+        self.assertEqual(flush.control_stalls, 1)
+        self.assertEqual(flush.cycles, 7)
+
+    def test_branch_operand_hazard(self):
+        """Branch operandlarını ID'de okuduğu için ALU sonucunu bir cycle bekler"""
+        model = PipelineModel(forwarding=True)
+        model.issue("addi", 8, ())
+        model.issue("bne", None, (8, 0), taken=False)
+        self.assertEqual(model.data_stalls, 1)
+
+    def test_cpi_and_diagram(self):
+        """CPI hesabı ve pipeline diyagramı"""
+        model = PipelineModel()
+        model.issue("lw", 8, (), text="lw $t0, 0($zero)")
+        model.issue("add", 10, (8, 8), text="add $t2, $t0, $t0")
+        self.assertAlmostEqual(model.cpi, 7 / 2)
+        diagram = model.diagram()
+        self.assertIn("add $t2, $t0, $t0", diagram)
+        self.assertIn("**", diagram)
+        self.assertIn("WB", diagram)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            PipelineModel(branch_policy="predict-backward")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import pstats
+import tempfile
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.profiler import STAGES
+
+
+PROGRAM = """
+    addi $t0, $zero, 20
+loop:
+    addi $t0, $t0, -1
+    sw $t0, 0($zero)
+    bne $t0, $zero, loop
+"""
+
+
+class TestStageProfiler(unittest.TestCase):
+    def setUp(self):
+        self.cpu = MIPSCPU()
+
+    def test_stage_breakdown(self):
+        profiler = self.cpu.enable_profiling()
+        self.cpu.load_program(PROGRAM)
+        self.cpu.run()
+        profiler.stop()
+        self.assertEqual(profiler.calls["parse"], 1)
+        self.assertEqual(profiler.calls["execute"], 61)
+        self.assertEqual(profiler.calls["trace"], 61)
+        self.assertEqual(profiler.instructions, 61)
+        # Aşamalar yalnızca kendi sürelerini alır; toplam ölçülen süreyi aşmaz
+        self.assertLessEqual(sum(profiler.times.values()), profiler.elapsed)
+        rows = profiler.breakdown()
+        self.assertEqual([row[0] for row in rows], list(STAGES) + ["other"])
+        self.assertAlmostEqual(sum(row[2] for row in rows), 1.0)
+        self.assertIn("61 instructions", profiler.report())
+
+    def test_fused_run_and_restart(self):
+        self.cpu.trace_enabled = False
+        self.cpu.fusion_enabled = True
+        profiler = self.cpu.enable_profiling()
+        self.cpu.load_program(PROGRAM)
+        self.cpu.run()
+        profiler.stop()
+        self.assertEqual(profiler.calls["execute"], 1)
+        self.assertEqual(profiler.instructions, 61)
+        profiler.start()
+        profiler.stop()
+        self.assertEqual((profiler.calls["execute"], profiler.instructions), (0, 0))
+
+    def test_cprofile_dump_and_disable(self):
+        handle, path = tempfile.mkstemp(suffix=".pstats")
+        os.close(handle)
+        try:
+            profiler = self.cpu.enable_profiling(path)
+            self.cpu.load_program(PROGRAM)
+            self.cpu.run()
+            profiler.stop()
+            functions = {function for _, _, function in pstats.Stats(path).stats}
+            self.assertIn("execute_instruction", functions)
+        finally:
+            os.remove(path)
+        self.cpu.disable_profiling()
+        self.assertIsNone(self.cpu.profiler)
+        self.assertNotIn("execute_instruction", vars(self.cpu))
+
+
+if __name__ == '__main__':
+    unittest.main()
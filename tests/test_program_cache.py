@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from MIPS.src import cpu as cpu_module
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.program_cache import CachedProgram, ProgramCache
+
+
+SOURCE = """
+.data
+values: .word 5, 7
+.text
+    lw $t0, values
+    lw $t1, values+4
+loop: add $t2, $t2, $t0
+    addi $t1, $t1, -1
+    bne $t1, $zero, loop
+    sw $t2, values
+"""
+
+
+class TestProgramCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ProgramCache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_cpu(self):
+        cpu = MIPSCPU()
+        cpu.trace_enabled = False
+        cpu.program_cache = self.cache
+        return cpu
+
+    def test_hit_skips_parsing_and_encoding(self):
+        first = self.make_cpu()
+        first.load_program(SOURCE)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        second = self.make_cpu()
+        with mock.patch.object(cpu_module, "Assembler") as assembler, \
+                mock.patch.object(MIPSCPU, "generate_machine_code") as encode, \
+                mock.patch.object(MIPSCPU, "clean_instruction_params") as decode:
+            second.load_program(SOURCE)
+        assembler.assert_not_called()
+        encode.assert_not_called()
+        decode.assert_not_called()
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(second.machine_code, first.machine_code)
+        self.assertEqual(second.decoded_instructions, first.decoded_instructions)
+        self.assertEqual(second.decoded_instructions[4], ("bne", ("$t1", "$zero", "loop")))
+        self.assertEqual(second.labels, {"loop": 2})
+        self.assertEqual(second.data_memory[:2], [5, 7])
+        second.run()
+        self.assertEqual(second.data_memory[0], 35)
+
+        # CPU durumu anahtara girmez: çalışmış bir CPU'ya yeniden yükleme de isabettir
+        second.load_program(SOURCE)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+        # Kaynak ya da sürüm değişince anahtar da değişir
+        self.make_cpu().load_program(SOURCE + "\n")
+        with mock.patch.object(cpu_module, "SIMULATOR_VERSION", "test"):
+            self.make_cpu().load_program(SOURCE)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 3))
+
+    def test_encoding_ignores_cpu_state(self):
+        """Branch offset'i komutun indeksinden, register'lı kaydırma metinden kodlanır"""
+        cpu = self.make_cpu()
+        cpu.load_program(SOURCE)
+        self.assertEqual(cpu.machine_code[4][-16:], f"{-3 & 0xFFFF:016b}")
+        cpu.current_instruction = 3
+        cpu.registers[10] = 7
+        self.assertEqual(cpu.generate_machine_code("bne $t1, $zero, loop", 4), cpu.machine_code[4])
+        # sllv $t0, $t1, $t2: 000000 rs=$t2 rt=$t1 rd=$t0 00000 000100
+        self.assertEqual(cpu.generate_machine_code("sll $t0, $t1, $t2"),
+                         "000000" "01010" "01001" "01000" "00000" "000100")
+
+    def test_comma_only_operands(self):
+        """Yalnızca virgülle ayrılmış operandlar boşluklu yazımla aynı kodlanır ve önbellekten döner"""
+        compact = "addi $t0,$zero,3\nloop: addi $t0,$t0,-1\nsw $t0,0($zero)\nbne $t0,$zero,loop"
+        spaced = "addi $t0, $zero, 3\nloop: addi $t0, $t0, -1\nsw $t0, 0($zero)\nbne $t0, $zero, loop"
+        reference = MIPSCPU()
+        reference.load_program(spaced)
+        first = self.make_cpu()
+        first.load_program(compact)
+        self.assertEqual(first.machine_code, reference.machine_code)
+        self.assertNotIn("0" * 32, first.machine_code)
+        self.assertEqual(first.generate_machine_code("bne $t0,$zero,loop", 3), reference.machine_code[3])
+
+        second = self.make_cpu()
+        second.load_program(compact)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(second.machine_code, reference.machine_code)
+        second.run()
+        self.assertEqual(second.registers[8], 0)
+        self.assertEqual(second.instruction_count, 10)
+
+    def test_load_file(self):
+        path = os.path.join(self.directory, "program.asm")
+        with open(path, "w") as f:
+            f.write(SOURCE)
+        self.make_cpu().load_file(path)
+        cpu = self.make_cpu()
+        cpu.load_file(path)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(cpu.program_instructions[0], "lw $t0, 0($zero)")
+
+    def test_lru_eviction(self):
+        entry = CachedProgram(["addi $t0, $zero, 1"] * 50, {}, [], {}, ["0" * 32] * 50,
+                              [("addi", ("$t0", "$zero", "1"))] * 50)
+        self.cache.put("a", entry)
+        size = self.cache.size()
+        self.cache.max_bytes = size * 2
+        self.cache.put("b", entry)
+        # Kayıtlara farklı kullanım zamanları ver; a'nın okunması onu en yeni yapar
+        os.utime(self.cache.path("a"), ns=(1, 1))
+        os.utime(self.cache.path("b"), ns=(2, 2))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.cache.put("c", entry)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats(), {
+            "hits": 2, "misses": 1, "evictions": 1, "entries": 2, "bytes": size * 2,
+        })
+
+    def test_corrupt_entry_is_a_miss(self):
+        with open(self.cache.path("bad"), "wb") as f:
+            f.write(b"not a pickle")
+        self.assertIsNone(self.cache.get("bad"))
+        self.assertFalse(os.path.exists(self.cache.path("bad")))
+        self.assertEqual(self.cache.misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
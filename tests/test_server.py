@@ -0,0 +1,133 @@
+import asyncio
+import json
+import unittest
+from MIPS.src.server import (
+    SimulationServer, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS, SESSION_ERROR
+)
+
+
+LOOP_PROGRAM = """
+    addi $t0, $zero, 0
+    addi $t1, $zero, 5000
+loop:
+    addi $t0, $t0, 1
+    sw $t0, 8($zero)
+    bne $t0, $t1, loop
+"""
+
+
+class Client:
+    """Testler için satır tabanlı JSON-RPC istemcisi"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = 0
+
+    async def send(self, method, **params):
+        self.ids += 1
+        request = {"jsonrpc": "2.0", "id": self.ids, "method": method, "params": params}
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def call(self, method, **params):
+        response = await self.send(method, **params)
+        if "error" in response:
+            raise AssertionError(response["error"])
+        return response["result"]
+
+
+class TestSimulationServer(unittest.TestCase):
+    def run_with_server(self, scenario, **options):
+        async def main():
+            server = SimulationServer(workers=1, **options)
+            await server.start()
+            host, port = server.address
+            reader, writer = await asyncio.open_connection(host, port)
+            try:
+                await scenario(Client(reader, writer), server)
+            finally:
+                writer.close()
+                await server.close()
+        asyncio.run(main())
+
+    def test_session_lifecycle(self):
+        async def scenario(client, server):
+            session = (await client.call("create_session"))["session"]
+            loaded = await client.call("load", session=session, source=LOOP_PROGRAM)
+            self.assertEqual(loaded, {"instructions": 5, "labels": {"loop": 2}})
+
+            state = await client.call("step", session=session, count=3)
+            self.assertEqual(state["pc"], 12)
+            self.assertEqual((await client.call("registers", session=session))["$t0"], 1)
+
+            checkpoint = (await client.call("checkpoint", session=session))["checkpoint"]
+            state = await client.call("run", session=session, max_steps=100)
+            self.assertEqual(state["stop_reason"], "Step budget of 100 instructions exhausted")
+            self.assertFalse(state["finished"])
+
+            state = await client.call("restore", session=session, checkpoint=checkpoint)
+            self.assertEqual(state["instruction_count"], 3)
+            memory = await client.call("memory", session=session, address=8, count=1)
+            self.assertEqual(memory, [{"address": 8, "value": 0}])
+
+            usage = await client.call("usage", session=session)
+            self.assertEqual(usage["instructions"], 103)
+            self.assertEqual(usage["checkpoints"], 1)
+
+            self.assertEqual(await client.call("list_sessions"), [session])
+            await client.call("close_session", session=session)
+            self.assertEqual(await client.call("list_sessions"), [])
+        self.run_with_server(scenario)
+
+    def test_long_run_is_offloaded(self):
+        """inline_steps üzerindeki run'lar süreç havuzunda çalışır"""
+        async def scenario(client, server):
+            session = (await client.call("create_session"))["session"]
+            await client.call("load", session=session, source=LOOP_PROGRAM)
+            state = await client.call("run", session=session)
+            self.assertTrue(state["finished"])
+            self.assertIsNone(state["stop_reason"])
+            self.assertEqual(state["instruction_count"], 2 + 3 * 5000)
+            memory = await client.call("memory", session=session, address=8, count=1)
+            self.assertEqual(memory[0]["value"], 5000)
+            usage = await client.call("usage", session=session)
+            self.assertEqual(usage["offloaded_runs"], 1)
+            self.assertEqual(usage["instructions"], 2 + 3 * 5000)
+        self.run_with_server(scenario, inline_steps=1000)
+
+    def test_errors(self):
+        async def scenario(client, server):
+            response = await client.send("nope")
+            self.assertEqual(response["error"]["code"], METHOD_NOT_FOUND)
+            response = await client.send("registers", session="missing")
+            self.assertEqual(response["error"]["code"], SESSION_ERROR)
+            session = (await client.call("create_session"))["session"]
+            response = await client.send("load", session=session)
+            self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+            response = await client.send("load", session=session, source="foo $t0\nj nowhere")
+            self.assertEqual(response["error"], {
+                "code": INVALID_PARAMS,
+                "message": "Line 1: Unknown opcode 'foo'\nLine 2: Undefined label 'nowhere'",
+            })
+            client.writer.write(b"[]\n")
+            response = json.loads(await client.reader.readline())
+            self.assertEqual(response["error"]["code"], INVALID_REQUEST)
+            self.assertIsNone(response["id"])
+            response = await client.send("run", session=session)
+            self.assertEqual(response["error"]["message"], "No program loaded")
+            for params in ({"address": -4}, {"address": 512}, {"address": "0x40"},
+                           {"address": 504, "count": 3}, {"count": -1}):
+                response = await client.send("memory", session=session, **params)
+                self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+            memory = await client.call("memory", session=session, address=504)
+            self.assertEqual([word["address"] for word in memory], [504, 508])
+            await client.call("create_session")
+            response = await client.send("create_session")
+            self.assertEqual(response["error"]["code"], SESSION_ERROR)
+        self.run_with_server(scenario, max_sessions=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import io
+import os
+import tempfile
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.trace_file import TraceReader, TraceWriter, HEADER, RECORD, NO_REGISTER, NO_MEMORY
+
+
+PROGRAM = """
+    addi $t0, $zero, 0
+    addi $t1, $zero, 3
+loop:
+    addi $t0, $t0, 1
+    sw $t0, 8($zero)
+    bne $t0, $t1, loop
+"""
+
+
+class TestTraceFile(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".trace")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write_program_trace(self, compress=False):
+        cpu = MIPSCPU()
+        cpu.load_program(PROGRAM)
+        cpu.open_trace_file(self.path, compress=compress)
+        cpu.run()
+        self.assertIsNone(cpu.trace_writer)  # Program bitince dosya kapanır
+        self.assertEqual(cpu.execution_trace, [])  # Bellekte trace tutulmaz
+        return cpu
+
+    def test_fixed_width_records(self):
+        """Dosya boyutu başlık + komut metinleri + başlangıç durumu + sabit genişlikli kayıtlardır"""
+        with TraceWriter(self.path, ["addi $t0, $zero, 1"], memory=[5, 0, -1]) as writer:
+            writer.write(1, 0, 0x20080001, register=8, old_register=0, new_register=1)
+            writer.write(2, 4, 0)
+        with TraceReader(self.path) as reader:
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader.record(2).register, NO_REGISTER)
+            self.assertEqual(reader.record(2).word, NO_MEMORY)
+            self.assertEqual(reader.record(1).new_register, 1)
+            self.assertEqual(reader.initial_registers, [0] * 32)
+            self.assertEqual(reader.initial_memory, [5, 0, -1])
+        # 32 register, kelime sayısı ve 3 bellek kelimesi
+        header = HEADER.size + 2 + len("addi $t0, $zero, 1") + 4 * 32 + 4 + 4 * 3
+        self.assertEqual(os.path.getsize(self.path), header + 2 * RECORD.size)
+
+    def test_stream_and_seek(self):
+        cpu = self.write_program_trace()
+        with TraceReader(self.path) as reader:
+            self.assertEqual(len(reader), cpu.instruction_count)
+            record = reader.record(4)  # İlk sw
+            self.assertEqual(record.pc, 12)
+            self.assertEqual((record.word, record.old_word, record.new_word), (2, 0, 1))
+            self.assertEqual(reader.instruction_text(record), "sw $t0, 8($zero)")
+            self.assertEqual([r.step for r in reader.records(5, 7)], [5, 6, 7])
+            with self.assertRaises(IndexError):
+                reader.record(100)
+
+    def test_seek_with_step_gaps(self):
+        """Adım numaraları ardışık değilse doğru kayıt ikili aramayla bulunur"""
+        for compress in (False, True):
+            with TraceWriter(self.path, ["addi $t0, $t0, 1"], compress=compress) as writer:
+                for step in (3, 4, 10, 11, 12, 20):
+                    writer.write(step, 0, 0, register=8, old_register=step - 1, new_register=step)
+            with TraceReader(self.path) as reader:
+                self.assertEqual(reader.record(11).new_register, 11)
+                self.assertEqual(reader.record(20).new_register, 20)
+                self.assertEqual(reader.record(4).new_register, 4)
+                for missing in (5, 13, 21):
+                    with self.assertRaises(IndexError):
+                        reader.record(missing)
+                self.assertEqual([r.step for r in reader.records(5, 12)], [10, 11, 12])
+                self.assertEqual([r.step for r in reader.records(12)], [12, 20])
+
+    def test_compressed(self):
+        cpu = self.write_program_trace(compress=True)
+        with TraceReader(self.path) as reader:
+            self.assertTrue(reader.compressed)
+            self.assertEqual(len(reader), cpu.instruction_count)
+            self.assertEqual(reader.record(3).new_register, 1)
+
+    def test_text_matches_in_memory_trace(self):
+        """Dosyadan üretilen metin bellek içi trace ile aynıdır"""
+        self.write_program_trace()
+        reference = MIPSCPU()
+        reference.load_program(PROGRAM)
+        reference.run()
+        names = {index: name for name, index in reference.register_names.items()}
+        out = io.StringIO()
+        with TraceReader(self.path) as reader:
+            reader.to_text(out, register_names=names)
+        self.assertEqual(out.getvalue(), "".join(reference.execution_trace[:-1]))
+
+    def test_csv(self):
+        self.write_program_trace()
+        out = io.StringIO()
+        with TraceReader(self.path) as reader:
+            self.assertEqual(reader.to_csv(out, start=2, stop=3), 2)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith('2,0x00000004,"addi $t1, $zero, 3",0x20090003,$r9,0,3'))
+
+    def test_not_a_trace_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            TraceReader(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from MIPS.src.cpu import MIPSCPU
+from MIPS.src.trace_file import TraceReader
+from MIPS.src.trace_index import TraceIndex
+
+
+PROGRAM = """
+    addi $t0, $zero, 0
+    addi $t1, $zero, 3
+loop:
+    addi $t0, $t0, 1
+    sw $t0, 64($zero)
+    bne $t0, $t1, loop
+"""
+
+
+class TestTraceIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TraceIndex()
+        self.index.add(1, register=8, old_register=0, new_register=5)
+        self.index.add(2, word=16, old_word=0, new_word=5)
+        self.index.add(3)
+        self.index.add(4, register=8, old_register=5, new_register=6)
+
+    def test_register_changes(self):
+        self.assertEqual(self.index.register_changes(8), [(1, 0, 5), (4, 5, 6)])
+        self.assertEqual(self.index.register_changes(9), [])
+
+    def test_last_change_before_step(self):
+        self.assertEqual(self.index.last_register_change(8, 4), (1, 0, 5))
+        self.assertEqual(self.index.last_register_change(8), (4, 5, 6))
+        self.assertIsNone(self.index.last_register_change(8, 1))
+        self.assertEqual(self.index.last_memory_change(0x40, 10), (2, 0, 5))
+
+    def test_value_at_step(self):
+        self.assertEqual(self.index.register_value(8, 0), 0)
+        self.assertEqual(self.index.register_value(8, 3), 5)
+        self.assertEqual(self.index.register_value(8, 4), 6)
+        self.assertEqual(self.index.register_value(9, 4, default=42), 42)
+        self.assertEqual(self.index.memory_value(0x40, 1), 0)
+        self.assertEqual(self.index.memory_value(0x40, 2), 5)
+
+    def test_query(self):
+        register_map = {"$t0": 8, "$t1": 9}
+        self.assertEqual(self.index.query("$t0", register_map),
+                         "Step 1: $t0: 0 -> 5\nStep 4: $t0: 5 -> 6")
+        self.assertEqual(self.index.query("$t0 @ 3", register_map), "$t0 at step 3: 5")
+        self.assertEqual(self.index.query("M[64] < 3", register_map),
+                         "M[0x040]: last change before step 3 at step 2: 0 -> 5")
+        self.assertEqual(self.index.query("$t1", register_map), "$t1: no changes")
+        with self.assertRaises(ValueError):
+            self.index.query("$t0 ==", register_map)
+
+    def test_cpu_indexes_while_tracing(self):
+        """CPU trace kaydederken indeksi de doldurur; dosyadan kurulan indeks aynıdır"""
+        cpu = MIPSCPU()
+        cpu.load_program(PROGRAM)
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            cpu.open_trace_file(path)
+            cpu.run()
+            with TraceReader(path) as reader:
+                from_file = TraceIndex.from_reader(reader)
+        finally:
+            os.remove(path)
+        t0 = cpu.register_map["$t0"]
+        self.assertEqual(cpu.trace_index.register_changes(t0), [(3, 0, 1), (6, 1, 2), (9, 2, 3)])
+        self.assertEqual(cpu.trace_index.memory_value(64, 6), 1)
+        self.assertEqual(cpu.trace_index.memory_changes(64), from_file.memory_changes(64))
+        self.assertEqual(cpu.trace_index.register_changes(t0), from_file.register_changes(t0))
+
+
+    def test_unchanged_words_use_initial_state(self):
+        """Hiç yazılmayan kelimeler .data ile yüklenen başlangıç değerini verir"""
+        cpu = MIPSCPU()
+        cpu.load_program(".data\nval: .word 7, 9\n.text\naddi $t0, $zero, 1\nsw $t0, val\naddi $t1, $zero, 2")
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            cpu.open_trace_file(path)
+            cpu.run()
+            with TraceReader(path) as reader:
+                self.assertEqual(reader.initial_memory[:2], [7, 9])
+                from_file = TraceIndex.from_reader(reader)
+        finally:
+            os.remove(path)
+        register_map = cpu.register_map
+        for index in (cpu.trace_index, from_file):
+            self.assertEqual(index.query("M[0x4] @ 2", register_map), "M[0x004] at step 2: 9")
+            self.assertEqual(index.memory_value(0, 1), 7)
+            self.assertEqual(index.memory_value(0, 2), 1)
+            self.assertEqual(index.register_value(cpu.register_map["$t2"], 3), 0)
+
+if __name__ == '__main__':
+    unittest.main()